@@ -0,0 +1,116 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+import hmac
+import logging
+import os
+
+from app.api.v1.balance import principal_cache, response_cache
+from app.core.password_hashing import password_hasher
+from app.core.profiling import profile_store
+from app.core.loop_monitor import loop_monitor
+from app.database import SessionLocal, get_db
+from app.services.balance.export_service import EXPORT_FORMATS, stream_export, user_id_shards
+from app.services.nutrition.data.menu_registry import menu_registry
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 관리자 토큰 (설정되지 않으면 관리자 API 비활성화)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """X-Admin-Token 헤더로 관리자 요청인지 확인합니다."""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="관리자 API가 비활성화되어 있습니다.")
+    # 헤더 값은 latin-1로 디코딩되어 있으므로 원래 바이트로 되돌려 상수 시간 비교 (ProfilingMiddleware와 같은 방식)
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token.encode("latin-1"), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+@router.get("/menu-dictionary", dependencies=[Depends(require_admin)])
+async def get_menu_dictionary_status():
+    """현재 사용 중인 메뉴 사전 버전 정보를 반환합니다."""
+    status = menu_registry.current().describe()
+    status["reloading"] = menu_registry.reloading
+    status["last_error"] = menu_registry.last_error
+    return status
+
+@router.post("/menu-dictionary/reload", status_code=202, dependencies=[Depends(require_admin)])
+async def reload_menu_dictionary():
+    """메뉴 사전과 교정 테이블을 백그라운드에서 다시 빌드한 뒤 교체합니다."""
+    started = menu_registry.reload_in_background()
+    logger.info(f"메뉴 사전 재빌드 요청 (시작됨: {started})")
+    return {
+        "status": "reloading" if started else "already_reloading",
+        "current_version": menu_registry.current().version
+    }
+
+@router.get("/auth-cache", dependencies=[Depends(require_admin)])
+async def get_auth_cache_stats():
+    """인증 사용자 캐시의 적중률 등 통계를 반환합니다. (현재 워커 기준)"""
+    return {"pid": os.getpid(), **principal_cache.stats()}
+
+@router.get("/password-hashing", dependencies=[Depends(require_admin)])
+async def get_password_hashing_stats():
+    """비밀번호 해시 대기열 상태와 429로 거절한 요청 수를 반환합니다. (현재 워커 기준)"""
+    return {"pid": os.getpid(), **password_hasher.stats()}
+
+@router.get("/response-cache", dependencies=[Depends(require_admin)])
+async def get_response_cache_stats():
+    """조회 API 응답 본문 캐시 통계를 반환합니다. (현재 워커 기준)"""
+    return {"pid": os.getpid(), **response_cache.stats()}
+
+@router.get("/loop-lag", dependencies=[Depends(require_admin)])
+async def get_loop_lag():
+    """이벤트 루프 지연 감시 상태와 최근 멈춤 기록(라우트, 루프 스레드 스택)을 반환합니다. (현재 워커 기준)"""
+    return {"pid": os.getpid(), **loop_monitor.stats()}
+
+@router.get("/export/shards", dependencies=[Depends(require_admin)])
+def get_export_shards(
+    shard_size: int = Query(1000, ge=1, description="구간당 사용자 ID 수"),
+    db: Session = Depends(get_db)
+):
+    """전체 식사 기록 내보내기를 나눠 실행할 사용자 ID 구간 목록을 반환합니다."""
+    return {
+        "shards": [
+            {"user_id_start": start, "user_id_end": end}
+            for start, end in user_id_shards(db, shard_size)
+        ]
+    }
+
+@router.get("/export/meals", dependencies=[Depends(require_admin)])
+def export_all_meals(
+    export_format: str = Query("ndjson", alias="format", regex="^(ndjson|csv)$"),
+    user_id_start: Optional[int] = Query(None, description="이 사용자 ID부터 (포함)"),
+    user_id_end: Optional[int] = Query(None, description="이 사용자 ID 전까지 (미포함)")
+):
+    """모든 사용자(또는 사용자 ID 구간)의 식사 기록을 스트리밍으로 내보냅니다. (오프라인 분석용)"""
+    filename = f"meals_{user_id_start or 'min'}-{user_id_end or 'max'}.{export_format}"
+    logger.info(f"전체 식사 기록 내보내기 요청: 사용자 ID [{user_id_start}, {user_id_end})")
+    return StreamingResponse(
+        stream_export(SessionLocal, export_format, user_id_start=user_id_start, user_id_end=user_id_end),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@router.get("/profiles", dependencies=[Depends(require_admin)])
+def list_profiles():
+    """저장된 요청 프로파일 목록 (최신순)을 반환합니다."""
+    return {"directory": profile_store.directory, "profiles": profile_store.list()}
+
+@router.get("/profiles/{profile_id}", dependencies=[Depends(require_admin)])
+def download_profile(profile_id: str):
+    """요청 프로파일을 speedscope JSON 파일로 내려받습니다. (https://www.speedscope.app 에서 열기)"""
+    path = profile_store.path_for(profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    with open(path, "rb") as f:
+        content = f.read()
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={"Content-Disposition": f'attachment; filename="{profile_id}.speedscope.json"'}
+    )
@@ -1,21 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, Cookie, Query
+from fastapi import APIRouter, Depends, HTTPException, Cookie, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from typing import List, Dict, Optional, Union
 from datetime import datetime, timedelta, date
 from jwt import encode, decode
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert
+import os
 import logging
-from passlib.context import CryptContext
+from dataclasses import dataclass
 from sqlalchemy.exc import IntegrityError
 from jwt import PyJWT
 import pytz
 
-from app.database import get_db
+from app.core.cache import TTLCache
+from app.core.metrics import register_cache
+from app.core.response_cache import VersionedResponseCache
+from app.core.password_hashing import HashingBusy, password_hasher, pwd_context
+from app.database import SessionLocal, get_db
 from app.models.balance import Meal, User
 from app.models import balance as models
-from app.services.balance.balance_service import BalanceService
-from app.schemas.balance import MealCreate, BalanceResponse, UserCreate, Token, BalanceCreate, Balance, DailyBalance, UserProfile, UserProfileUpdate, UserLogin
+from app.services.balance.balance_service import BalanceService, bump_data_versions, day_range, decode_cursor, encode_cursor
+from app.services.balance.dashboard_service import DashboardService, days_since_joined, group_meals, parse_fields, stats_payload
+from app.services.balance.export_service import EXPORT_FORMATS, stream_export
+from app.services.balance.daily_nutrition_service import DailyNutritionService, MealContribution, local_date_of
+from app.schemas.balance import MealCreate, MealBulkCreate, MealBulkResponse, MealHistoryPage, MealType, BalanceResponse, UserCreate, Token, BalanceCreate, Balance, DailyBalance, UserProfile, UserProfileUpdate, UserLogin
 from app.schemas import user as schemas
 
 # 로거 설정
@@ -26,12 +36,19 @@ SECRET_KEY = "your-secret-key"  # 실제 운영환경에서는 환경변수로 
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 1440  # 24시간
 
-# 비밀번호 해싱
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 인증 사용자 캐시 (0이면 비활성화). 다른 워커의 변경은 최대 TTL만큼 늦게 반영됨
+# (ETag 라우트는 get_versioned_user로 data_version만 요청마다 확인)
+AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL", "60"))
+AUTH_CACHE_MAXSIZE = int(os.getenv("AUTH_CACHE_MAXSIZE", "10000"))
+# 조회 API 응답 본문 캐시 (0이면 비활성화, ETag/304는 그대로 동작)
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "300"))
+RESPONSE_CACHE_MAXSIZE = int(os.getenv("RESPONSE_CACHE_MAXSIZE", "2000"))
 
 # 한국 시간대 설정
 KST = pytz.timezone('Asia/Seoul')
 
+# 동기 세션(get_db)을 쓰는 라우트는 모두 def로 정의해 FastAPI 스레드풀에서 실행
+# (async def에서 동기 쿼리를 실행하면 /food/analyze를 처리하는 이벤트 루프가 멈춤)
 router = APIRouter(prefix="/balance", tags=["Balance"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/balance/token")
 
@@ -50,39 +67,110 @@ def create_access_token(data: dict):
     encoded_jwt = encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """인증된 사용자 중 핸들러가 사용하는 필드만 담은 정보 (캐시 대상)"""
+    id: int
+    email: str
+    name: Optional[str]
+    daily_calorie_goal: Optional[int]
+    created_at: Optional[datetime]
+    data_version: int
+
+# 토큰의 sub(사용자 ID) -> AuthenticatedUser, 프로세스 단위 캐시
+principal_cache: TTLCache[AuthenticatedUser] = TTLCache(ttl=AUTH_CACHE_TTL, maxsize=AUTH_CACHE_MAXSIZE)
+
+def invalidate_principal(user_id: int):
+    """프로필/목표/비밀번호가 바뀐 사용자의 캐시 항목 제거"""
+    principal_cache.invalidate(int(user_id))
+
+# (사용자, 엔드포인트, 파라미터, 데이터 버전)별 직렬화된 응답, 프로세스 단위 캐시
+response_cache = VersionedResponseCache(ttl=RESPONSE_CACHE_TTL, maxsize=RESPONSE_CACHE_MAXSIZE)
+
+register_cache("principal", principal_cache.stats)
+register_cache("response", response_cache.stats)
+
+def bump_data_version(db: Session, user_id: int):
+    """사용자의 식사/목표가 바뀌었음을 기록 (다른 워커도 get_versioned_user에서 바로 새 버전을 읽음)"""
+    bump_data_versions(db, user_id)
+
+def _user_id_from_token(token: str) -> int:
     try:
-        logger.info(f"토큰 검증 시작: {token[:10]}...")
         payload = decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        logger.info(f"토큰 페이로드: {payload}")
         user_id: Union[str, int] = payload.get("sub")
         if user_id is None:
             logger.error("토큰에 user_id(sub) 없음")
             raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-        user_id = int(user_id)
-        logger.info(f"사용자 ID: {user_id}")
+        return int(user_id)
     except ValueError as ve:
         logger.error(f"user_id 변환 오류: {str(ve)}")
         raise HTTPException(status_code=401, detail="Invalid user ID format")
     except Exception as e:
         logger.error(f"토큰 검증 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-    
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
+
+def _load_principal(db: Session, user_id: int) -> AuthenticatedUser:
+    # 필요한 컬럼만 조회 (profile_image, password_hash 제외)
+    row = db.query(User.id, User.email, User.name, User.daily_calorie_goal, User.created_at, User.data_version).filter(
+        User.id == user_id
+    ).first()
+    if row is None:
         logger.error(f"사용자를 찾을 수 없음: ID {user_id}")
         raise HTTPException(status_code=404, detail="User not found")
-    logger.info(f"사용자 찾음: ID {user_id}, 이름: {user.name}")
+    user = AuthenticatedUser(*row)
+    principal_cache.set(user_id, user)
+    logger.debug(f"사용자 찾음: ID {user_id}")
     return user
 
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> AuthenticatedUser:
+    """인증 사용자 (캐시 적중 시 DB를 조회하지 않음, 다른 워커의 변경은 최대 AUTH_CACHE_TTL만큼 늦게 반영)"""
+    user_id = _user_id_from_token(token)
+    cached = principal_cache.get(user_id)
+    if cached is not None:
+        return cached
+    return _load_principal(db, user_id)
+
+def get_versioned_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> AuthenticatedUser:
+    """ETag 라우트용 인증 사용자. 캐시 적중 시에도 data_version만 기본 키로 읽어
+    다른 워커에서 바뀐 식사/목표가 바로 반영되게 함 (버전이 바뀌었으면 다시 조회)"""
+    user_id = _user_id_from_token(token)
+    cached = principal_cache.get(user_id)
+    if cached is not None:
+        version = db.query(User.data_version).filter(User.id == user_id).scalar()
+        if version == cached.data_version:
+            return cached
+        principal_cache.invalidate(user_id)
+    return _load_principal(db, user_id)
+
+def _hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail="요청이 많아 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": "1"}
+    )
+
+def _client_key(request: Request) -> str:
+    return f"ip:{request.client.host}" if request.client else ""
+
+# 로그인/회원가입은 bcrypt를 전용 스레드 풀에서 기다려야 하므로 async def로 두고,
+# DB 작업은 run_in_threadpool로 이벤트 루프 밖에서 실행
 @router.post("/token", response_model=Token)
-async def login_for_access_token(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login_for_access_token(user_data: UserLogin, request: Request, db: Session = Depends(get_db)):
     """사용자 로그인 및 토큰 발급"""
     try:
         logger.info(f"로그인 시도: {user_data.email}")
-        user = db.query(User).filter(User.email == user_data.email).first()
+        user = await run_in_threadpool(lambda: db.query(User).filter(User.email == user_data.email).first())
+        
+        verified = False
+        if user is not None:
+            with password_hasher.admit([_client_key(request), f"account:{user_data.email}"]):
+                verified, new_hash = await password_hasher.verify_and_update(user_data.password, user.password_hash)
+            if verified and new_hash:
+                # BCRYPT_ROUNDS가 올라간 경우 기존 해시를 새 비용으로 교체
+                user.password_hash = new_hash
+                await run_in_threadpool(db.commit)
         
-        if user is None or verify_password(user_data.password, user.password_hash) is False:
+        if not verified:
             raise HTTPException(
                 status_code=401,
                 detail="이메일 또는 비밀번호가 올바르지 않습니다."
@@ -99,6 +187,11 @@ async def login_for_access_token(user_data: UserLogin, db: Session = Depends(get
             "name": user.name
         }
         
+    except HashingBusy:
+        logger.warning(f"로그인 요청 제한: {user_data.email}")
+        raise _hashing_busy()
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"로그인 중 오류 발생: {str(e)}")
         raise HTTPException(
@@ -107,18 +200,19 @@ async def login_for_access_token(user_data: UserLogin, db: Session = Depends(get
         )
 
 @router.post("/register", response_model=Token)
-async def register_user(user: UserCreate, db: Session = Depends(get_db)):
+async def register_user(user: UserCreate, request: Request, db: Session = Depends(get_db)):
     """새로운 사용자를 등록합니다."""
     try:
         # 이메일 중복 확인
-        if db.query(User).filter(User.email == user.email).first():
+        if await run_in_threadpool(lambda: db.query(User).filter(User.email == user.email).first()):
             raise HTTPException(
                 status_code=400,
                 detail="이미 등록된 이메일입니다."
             )
         
         # 비밀번호 해싱
-        hashed_password = get_password_hash(user.password)
+        with password_hasher.admit([_client_key(request), f"account:{user.email}"]):
+            hashed_password = await password_hasher.hash(user.password)
         
         # 새 사용자 생성
         db_user = User(
@@ -128,9 +222,11 @@ async def register_user(user: UserCreate, db: Session = Depends(get_db)):
             daily_calorie_goal=user.daily_calorie_goal
         )
         
-        db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        def save():
+            db.add(db_user)
+            db.commit()
+            db.refresh(db_user)
+        await run_in_threadpool(save)
         
         # 토큰 생성
         access_token = create_access_token(data={"sub": str(db_user.id)})
@@ -142,84 +238,72 @@ async def register_user(user: UserCreate, db: Session = Depends(get_db)):
             "name": db_user.name
         }
         
+    except HashingBusy:
+        logger.warning(f"회원가입 요청 제한: {user.email}")
+        raise _hashing_busy()
+    except HTTPException:
+        raise
     except IntegrityError:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(
             status_code=400,
             detail="이미 등록된 이메일입니다."
         )
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(
             status_code=500,
             detail=f"사용자 등록 중 오류가 발생했습니다: {str(e)}"
         )
 
+@router.get("/dashboard")
+def get_dashboard(
+    request: Request,
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 항목 (profile, stats, meals, weekly_score, monthly, days_since_joined). 생략하면 전체"),
+    current_user: AuthenticatedUser = Depends(get_versioned_user),
+    db: Session = Depends(get_db)
+):
+    """프로필/메인 화면에 필요한 항목을 한 번에 조회합니다."""
+    try:
+        selected = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # 오늘 기준 항목이 있으므로 날짜도 키에 포함
+    now = datetime.now()
+    return response_cache.respond(
+        request, current_user.id, current_user.data_version, "dashboard",
+        {"fields": ",".join(sorted(set(selected))), "day": now.date()},
+        lambda: DashboardService(db).build(current_user, selected, now=now)
+    )
+
 @router.get("/stats")
-async def get_balance_stats(
-    current_user: User = Depends(get_current_user),
+def get_balance_stats(
+    request: Request,
+    current_user: AuthenticatedUser = Depends(get_versioned_user),
     db: Session = Depends(get_db)
 ):
     """인증된 사용자의 영양 밸런스 통계를 조회합니다."""
     try:
-        balance_service = BalanceService(db)
-        # 오늘의 식사 기록 조회
         today = datetime.now().date()
-        start_of_day = datetime.combine(today, datetime.min.time())
-        end_of_day = datetime.combine(today, datetime.max.time())
-
-        today_meals = db.query(Meal).filter(
-            Meal.user_id == current_user.id,
-            Meal.timestamp >= start_of_day,
-            Meal.timestamp <= end_of_day
-        ).all()
         
-        # 오늘의 총 영양소 계산
-        if not today_meals:
-            return {
-                "balance_score": None,
-                "total_calories": None,
-                "daily_calorie_goal": current_user.daily_calorie_goal,
-                "highlight": "",
-                "needs_improvement": "",
-                "nutrients": {
-                    'carbohydrates': None,
-                    'protein': None,
-                    'fat': None
-                }
-            }
-            
-        total_nutrients = {
-            'carbohydrates': float(sum(getattr(meal, 'carbohydrates', 0) or 0 for meal in today_meals)),
-            'protein': float(sum(getattr(meal, 'protein', 0) or 0 for meal in today_meals)),
-            'fat': float(sum(getattr(meal, 'fat', 0) or 0 for meal in today_meals))
-        }
-        
-        # 밸런스 점수 계산
-        balance_score = balance_service.calculate_balance_score(total_nutrients)
+        def build():
+            # 오늘의 일별 합계 조회
+            today_totals = db.query(models.DailyNutrition).filter(
+                models.DailyNutrition.user_id == current_user.id,
+                models.DailyNutrition.local_date == today
+            ).first()
+            return stats_payload(BalanceService(db), today_totals, current_user.daily_calorie_goal)
         
-        # 영양소 분석
-        nutrient_analysis = balance_service.analyze_nutrients(total_nutrients)
-        
-        # 총 칼로리
-        total_calories = sum(meal.calories for meal in today_meals)
-        
-        return {
-            "balance_score": balance_score,
-            "total_calories": total_calories,
-            "daily_calorie_goal": current_user.daily_calorie_goal,
-            "highlight": nutrient_analysis["highlight"],
-            "needs_improvement": nutrient_analysis["needsImprovement"],
-            "nutrients": total_nutrients
-        }
+        return response_cache.respond(request, current_user.id, current_user.data_version, "stats", {"day": today}, build)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/meals")
-async def get_meals(
+def get_meals(
+    request: Request,
     date: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_versioned_user),
     db: Session = Depends(get_db)
 ):
     """인증된 사용자의 특정 날짜 식사 기록을 조회합니다."""
@@ -230,48 +314,23 @@ async def get_meals(
         else:
             target_date = datetime.now()
 
-        # 해당 날짜의 시작(00:00:00)과 끝(23:59:59) 설정
-        start_of_day = datetime(target_date.year, target_date.month, target_date.day, 0, 0, 0)
-        end_of_day = datetime(target_date.year, target_date.month, target_date.day, 23, 59, 59)
-
-        # 해당 날짜의 모든 식사 기록 조회
-        meals = db.query(Meal).filter(
-            Meal.user_id == current_user.id,
-            Meal.timestamp >= start_of_day,
-            Meal.timestamp <= end_of_day
-        ).all()
-
-        # 식사 타입별로 그룹화
-        meal_groups = {
-            'breakfast': [],
-            'lunch': [],
-            'dinner': []
-        }
+        def build():
+            # 해당 날짜 00:00부터 다음 날 00:00 전까지의 모든 식사 기록 조회
+            meals = BalanceService(db).get_meals_between(current_user.id, *day_range(target_date.date()))
+            # 식사 타입별로 그룹화
+            return group_meals(meals)
 
-        for meal in meals:
-            meal_type = meal.meal_type.lower()
-            if meal_type in meal_groups:
-                meal_groups[meal_type].append({
-                    'id': meal.id,
-                    'name': meal.food_name or '식사',
-                    'calories': float(str(meal.calories or 0)),
-                    'nutrients': {
-                        'carbohydrates': float(str(meal.carbohydrates or 0)),
-                        'protein': float(str(meal.protein or 0)),
-                        'fat': float(str(meal.fat or 0))
-                    },
-                    'timestamp': meal.timestamp.isoformat() if meal.timestamp else None
-                })
-
-        return meal_groups
+        return response_cache.respond(
+            request, current_user.id, current_user.data_version, "meals", {"day": target_date.date()}, build
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/meals")
-async def add_meal(
+def add_meal(
     meal: MealCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """새로운 식사 기록을 추가합니다."""
@@ -291,7 +350,12 @@ async def add_meal(
         )
         
         db.add(db_meal)
+        db.flush()
+        # 일별 합계도 같은 트랜잭션에서 갱신
+        DailyNutritionService(db).add_meal(db_meal)
+        bump_data_version(db, current_user.id)
         db.commit()
+        invalidate_principal(current_user.id)
         db.refresh(db_meal)
         
         return {
@@ -313,22 +377,152 @@ async def add_meal(
             detail=f"식사 기록 추가 중 오류가 발생했습니다: {str(e)}"
         )
 
+@router.post("/meals/bulk", response_model=MealBulkResponse)
+def add_meals_bulk(
+    bulk: MealBulkCreate,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """여러 식사 기록을 한 번에 추가합니다. (OCR 결과 여러 항목 저장)"""
+    try:
+        # 같은 요청의 식사는 모두 같은 시각으로 기록
+        now = datetime.now(KST)
+        rows = [
+            {
+                "user_id": current_user.id,
+                "meal_type": item.meal_type.value,
+                "food_name": item.food_name,
+                "timestamp": now,
+                "calories": item.calories,
+                "carbohydrates": item.carbohydrates,
+                "protein": item.protein,
+                "fat": item.fat
+            }
+            for item in bulk.meals
+        ]
+        # 새 ID는 INSERT와 같은 트랜잭션에서 받음 (시각으로 다시 조회하면 같은 시각의 다른 요청 행이 섞일 수 있음)
+        dialect = db.get_bind().dialect
+        if dialect.full_returning:
+            # PostgreSQL: 다중 VALUES INSERT ... RETURNING 한 번
+            ids = [row[0] for row in db.execute(insert(Meal).values(rows).returning(Meal.id))]
+        elif dialect.name == "sqlite":
+            # SQLite: 한 번의 executemany로 INSERT한 뒤 사용자의 마지막 n개 ID를 조회.
+            # 쓰기 잠금을 커밋까지 잡고 있으므로 그 사이에 다른 요청의 행이 끼어들 수 없음
+            db.execute(insert(Meal), rows)
+            ids = [row[0] for row in db.query(Meal.id).filter(
+                Meal.user_id == current_user.id
+            ).order_by(Meal.id.desc()).limit(len(rows))][::-1]
+        else:
+            # 그 밖의 DB: flush에서 행마다 INSERT 후 ID를 채움
+            meals = [Meal(**row) for row in rows]
+            db.add_all(meals)
+            db.flush()
+            ids = [meal.id for meal in meals]
+        
+        # 일별 합계는 날짜별로 합산해 한 번만 갱신
+        DailyNutritionService(db).add_meals([
+            MealContribution(current_user.id, local_date_of(now), item.meal_type.value, item.calories,
+                             item.carbohydrates, item.protein, item.fat)
+            for item in bulk.meals
+        ])
+        bump_data_version(db, current_user.id)
+        db.commit()
+        invalidate_principal(current_user.id)
+        logger.info(f"식사 일괄 추가: 사용자 ID {current_user.id}, {len(ids)}건")
+        
+        return {"ids": ids, "timestamp": now}
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"식사 기록 추가 중 오류가 발생했습니다: {str(e)}"
+        )
+
+# /meals/{meal_id}보다 먼저 선언해야 "history"가 meal_id로 해석되지 않음
+@router.get("/meals/history", response_model=MealHistoryPage)
+def get_meal_history(
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    meal_type: Optional[MealType] = None,
+    start_date: Optional[date] = Query(None, description="이 날짜부터 (포함)"),
+    end_date: Optional[date] = Query(None, description="이 날짜까지 (포함)"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """식사 기록을 최신순으로 페이지 단위 조회합니다."""
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # 한 건 더 읽어 다음 페이지가 있는지 확인
+    meals = BalanceService(db).get_meal_history(
+        current_user.id,
+        limit + 1,
+        after=after,
+        meal_type=meal_type.value if meal_type else None,
+        start=day_range(start_date)[0] if start_date else None,
+        end=day_range(end_date)[1] if end_date else None
+    )
+    page = meals[:limit]
+    
+    return {
+        "items": [
+            {
+                "id": meal.id,
+                "meal_type": meal.meal_type,
+                "food_name": meal.food_name,
+                "timestamp": meal.timestamp,
+                "calories": float(meal.calories or 0),
+                "nutrients": {
+                    "carbohydrates": float(meal.carbohydrates or 0),
+                    "protein": float(meal.protein or 0),
+                    "fat": float(meal.fat or 0)
+                }
+            }
+            for meal in page
+        ],
+        "next_cursor": encode_cursor(page[-1].timestamp, page[-1].id) if len(meals) > limit else None
+    }
+
+@router.get("/export")
+def export_meals(
+    export_format: str = Query("ndjson", alias="format", regex="^(ndjson|csv)$", description="ndjson 또는 csv"),
+    current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    """인증된 사용자의 전체 식사 기록을 스트리밍으로 내보냅니다."""
+    filename = f"meals_{current_user.id}_{datetime.now().strftime('%Y%m%d')}.{export_format}"
+    return StreamingResponse(
+        stream_export(SessionLocal, export_format, user_id=current_user.id),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @router.post("/balance", response_model=Balance)
 def create_balance(balance: BalanceCreate, db: Session = Depends(get_db)):
     balance_service = BalanceService(db)
     return balance_service.create_balance(balance)
 
 @router.get("/monthly/{user_id}/{year}/{month}", response_model=dict)
-async def get_monthly_balance(
+def get_monthly_balance(
+    request: Request,
     user_id: int,
     year: int,
     month: int,
-    current_user: User = Depends(get_current_user),
+    include_meals: bool = Query(True, description="날짜별 식사 상세 포함 여부 (false면 일별 합계만 조회)"),
+    current_user: AuthenticatedUser = Depends(get_versioned_user),
     db: Session = Depends(get_db)
 ):
     """인증된 사용자의 월간 밸런스 통계를 조회합니다."""
     balance_service = BalanceService(db)
-    return balance_service.get_monthly_balance(user_id, year, month)
+    if user_id != current_user.id:
+        # 다른 사용자의 데이터 버전은 알 수 없으므로 캐시하지 않음
+        return balance_service.get_monthly_balance(user_id, year, month, include_meals=include_meals)
+    return response_cache.respond(
+        request, current_user.id, current_user.data_version, "monthly",
+        {"year": year, "month": month, "include_meals": include_meals},
+        lambda: balance_service.get_monthly_balance(user_id, year, month, include_meals=include_meals)
+    )
 
 # @router.get("/balance/daily/{user_id}/{year}/{month}/{day}", response_model=dict)
 # def get_daily_balance(user_id: int, year: int, month: int, day: int, db: Session = Depends(get_db)):
@@ -346,8 +540,8 @@ def get_user_streak(user_id: int, db: Session = Depends(get_db)):
     return balance_service.get_user_streak(user_id)
 
 @router.get("/weekly-score")
-async def get_weekly_balance_score(
-    current_user: User = Depends(get_current_user),
+def get_weekly_balance_score(
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """지난 7일간의 평균 밸런스 점수를 반환합니다."""
@@ -359,35 +553,34 @@ async def get_weekly_balance_score(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/user/days-since-joined")
-async def get_days_since_joined(
-    current_user: User = Depends(get_current_user)
+def get_days_since_joined(
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ) -> dict:
     """사용자의 가입 후 경과 일수를 반환합니다."""
-    created_at = getattr(current_user, 'created_at', None)
-    if not created_at:
-        return {"days": 0}
-    
-    days = (datetime.now() - created_at).days
-    return {"days": max(1, days)}  # 최소 1일로 표시 
+    return {"days": days_since_joined(current_user.created_at, datetime.now())}
 
 @router.put("/user/calorie-goal")
-async def update_calorie_goal(
+def update_calorie_goal(
     daily_calorie_goal: int,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """사용자의 일일 칼로리 목표를 업데이트합니다."""
     try:
-        setattr(current_user, 'daily_calorie_goal', daily_calorie_goal)
+        db.query(User).filter(User.id == current_user.id).update(
+            {User.daily_calorie_goal: daily_calorie_goal}, synchronize_session=False
+        )
+        bump_data_version(db, current_user.id)
         db.commit()
+        invalidate_principal(current_user.id)
         return {"message": "Updated successfully", "daily_calorie_goal": daily_calorie_goal}
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/users/profile", response_model=schemas.User)
-async def get_user_profile(
-    current_user: models.User = Depends(get_current_user),
+def get_user_profile(
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """현재 사용자의 프로필 정보를 조회합니다."""
@@ -411,23 +604,33 @@ async def get_user_profile(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/users/profile", response_model=UserProfile)
-async def update_user_profile(
+def update_user_profile(
     profile_update: UserProfileUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """현재 사용자의 프로필 정보를 업데이트합니다."""
+    user = db.query(User).filter(User.id == current_user.id).first()
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
     for field, value in profile_update.dict(exclude_unset=True).items():
-        setattr(current_user, field, value)
+        setattr(user, field, value)
+    user.data_version = (user.data_version or 0) + 1
     
     db.commit()
-    db.refresh(current_user)
-    return current_user 
+    invalidate_principal(user.id)
+    db.refresh(user)
+    return {
+        "name": user.name,
+        "email": user.email,
+        "profile_image": user.profile_image,
+        "daily_calorie_goal": user.daily_calorie_goal
+    }
 
 @router.get("/meals/{meal_id}")
-async def get_meal(
+def get_meal(
     meal_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """특정 식사 기록을 조회합니다."""
@@ -454,10 +657,10 @@ async def get_meal(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/meals/{meal_id}")
-async def update_meal(
+def update_meal(
     meal_id: int,
     meal: MealCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """특정 식사 기록을 수정합니다."""
@@ -470,14 +673,48 @@ async def update_meal(
         if not db_meal:
             raise HTTPException(status_code=404, detail="Meal not found")
             
+        before = MealContribution.of(db_meal)
+        
         # 식사 정보 업데이트
         for field in ['food_name', 'calories', 'carbohydrates', 'protein', 'fat', 'meal_type']:
             setattr(db_meal, field, getattr(meal, field))
         
+        db.flush()
+        DailyNutritionService(db).replace_meal(before, db_meal)
+        bump_data_version(db, current_user.id)
         db.commit()
+        invalidate_principal(current_user.id)
         db.refresh(db_meal)
         
         return {"message": "Meal updated successfully"}
     except Exception as e:
         db.rollback()
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.delete("/meals/{meal_id}")
+def delete_meal(
+    meal_id: int,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """특정 식사 기록을 삭제합니다."""
+    db_meal = db.query(Meal).filter(
+        Meal.id == meal_id,
+        Meal.user_id == current_user.id
+    ).first()
+    
+    if not db_meal:
+        raise HTTPException(status_code=404, detail="Meal not found")
+    
+    try:
+        contribution = MealContribution.of(db_meal)
+        db.delete(db_meal)
+        db.flush()
+        DailyNutritionService(db).remove_meal(contribution)
+        bump_data_version(db, current_user.id)
+        db.commit()
+        invalidate_principal(current_user.id)
+        return {"message": "Meal deleted successfully"}
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Response
 import logging
 from app.services.ocr.ocr_service import OCRService
 from app.services.nutrition.nutrition_service import NutritionService
-from app.schemas.food import FoodRecognitionResponse
+from app.services.nutrition.menu_matcher import MenuMatcher
+from app.services.nutrition.data.menu_registry import menu_registry, use_snapshot
+from app.schemas.food import (
+    FoodRecognitionResponse, MenuCandidate, MenuMatchRequest, MenuMatchResponse, MenuMatchResult
+)
 from difflib import get_close_matches
 import re
 from app.api.v1.balance import get_current_user
+from app.core.metrics import PIPELINE_STAGE_SECONDS
 from typing import List, Dict, Any, Optional
 
 # 로거 설정
@@ -16,6 +21,10 @@ router = APIRouter(prefix="/food", tags=["Food Recognition"])
 
 ocr_service = OCRService()
 nutrition_service = NutritionService()
+menu_matcher = MenuMatcher()
+
+# 응답에 사용한 메뉴 사전 버전을 표시하는 헤더
+MENU_DICT_VERSION_HEADER = "X-Menu-Dict-Version"
 
 # OCR 신뢰도 임계값
 HIGH_CONFIDENCE_THRESHOLD = 0.5  # 높은 신뢰도 기준
@@ -73,6 +82,7 @@ def _clean_and_normalize_text(text: str) -> str:
 
 @router.post("/analyze")
 async def analyze_food_image(
+    response: Response,
     file: UploadFile = File(...),
     current_user: dict = Depends(get_current_user)
 ):
@@ -82,6 +92,37 @@ async def analyze_food_image(
     2. 추출된 음식 이름을 정제,후처리
     3. 정제된 음식 이름으로 영양 정보 조회
     """
+    # 요청 처리 중 사전이 교체되어도 한 요청은 하나의 버전만 사용
+    snapshot = menu_registry.current()
+    response.headers[MENU_DICT_VERSION_HEADER] = snapshot.version
+    with use_snapshot(snapshot):
+        return await _analyze_food_image(file)
+
+@router.post("/match", response_model=MenuMatchResponse)
+def match_menus(
+    request: MenuMatchRequest,
+    response: Response,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    여러 텍스트를 한 번에 메뉴 사전과 매칭하여 텍스트별 상위 top_k 후보와 점수를 반환합니다.
+    cutoff 미만의 후보는 제외되며, 모든 텍스트는 같은 사전 버전으로 매칭됩니다.
+    """
+    snapshot = menu_registry.current()
+    response.headers[MENU_DICT_VERSION_HEADER] = snapshot.version
+    with PIPELINE_STAGE_SECONDS.time(stage="menu_match"):
+        matches = menu_matcher.match_batch(request.texts, top_k=request.top_k,
+                                           cutoff=request.cutoff, snapshot=snapshot)
+    logger.info(f"메뉴 일괄 매칭: {len(request.texts)}개 텍스트, 사전 버전 {snapshot.version}")
+    return MenuMatchResponse(
+        dictionary_version=snapshot.version,
+        results=[
+            MenuMatchResult(text=text, candidates=[MenuCandidate(menu=m, score=s) for m, s in candidates])
+            for text, candidates in zip(request.texts, matches)
+        ]
+    )
+
+async def _analyze_food_image(file: UploadFile):
     try:
         logger.info("=== API 호출 시작 ===")
         
@@ -0,0 +1,3 @@
+"""
+API 모듈에서 함께 쓰는 공통 기능
+"""
@@ -0,0 +1,152 @@
+import os
+import sys
+import time
+import asyncio
+import logging
+import threading
+import traceback
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from app.core.metrics import registry, route_label
+
+logger = logging.getLogger(__name__)
+
+# 하트비트 주기와 멈춤으로 볼 지연 (밀리초)
+LOOP_LAG_INTERVAL_MS = float(os.getenv("LOOP_LAG_INTERVAL_MS", "50"))
+LOOP_LAG_THRESHOLD_MS = float(os.getenv("LOOP_LAG_THRESHOLD_MS", "100"))
+# 관리자 API로 보여줄 최근 멈춤 기록 수, 기록할 스택 깊이
+LOOP_LAG_MAX_EVENTS = int(os.getenv("LOOP_LAG_MAX_EVENTS", "50"))
+LOOP_LAG_STACK_LIMIT = 40
+
+LOOP_LAG_SECONDS = registry.histogram(
+    "event_loop_lag_seconds", "이벤트 루프 하트비트가 예정보다 늦게 실행된 시간",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0))
+LOOP_STALLS = registry.counter(
+    "event_loop_stalls_total", "임계값 이상 이벤트 루프가 멈춘 횟수 (멈춘 동안 실행 중이던 라우트별)", ["route"])
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연 감시
+
+    루프 안의 하트비트 태스크가 주기마다 시각을 남기고, 별도 감시 스레드가 하트비트가
+    임계값 이상 늦어지면 그 순간 루프 스레드의 스택과 실행 중이던 요청의 라우트를 기록합니다.
+    멈춘 동안 루프는 아무것도 할 수 없으므로 스택은 감시 스레드에서 sys._current_frames()로 읽습니다.
+    """
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL_MS / 1000,
+                 threshold: float = LOOP_LAG_THRESHOLD_MS / 1000, max_events: int = LOOP_LAG_MAX_EVENTS):
+        self.interval = interval
+        self.threshold = threshold
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        # 요청을 처리 중인 태스크 -> ASGI scope (LoopTaskMiddleware가 관리)
+        self.task_scopes: Dict[asyncio.Task, dict] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._last_beat = 0.0
+        self._max_lag = 0.0
+        self._stop = threading.Event()
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._watchdog is not None and self._watchdog.is_alive()
+
+    def start(self):
+        """실행 중인 이벤트 루프에서 호출 (앱 시작 이벤트)"""
+        if self.running:
+            return
+        self._loop = asyncio.get_event_loop()
+        self._loop_thread = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop.clear()
+        self._heartbeat_task = self._loop.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(f"이벤트 루프 지연 감시 시작 (주기 {self.interval * 1000:.0f}ms, 임계값 {self.threshold * 1000:.0f}ms)")
+
+    def stop(self):
+        self._stop.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+        self._watchdog = None
+
+    async def _heartbeat(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            lag = max(0.0, now - expected)
+            LOOP_LAG_SECONDS.observe(lag)
+            self._max_lag = max(self._max_lag, lag)
+            if lag >= self.threshold and self.events and self.events[-1]["lag_ms"] is None:
+                # 감시 스레드가 기록한 멈춤의 최종 지연 시간
+                self.events[-1]["lag_ms"] = round(lag * 1000, 1)
+            self._last_beat = now
+
+    def _watch(self):
+        captured_beat = None
+        while not self._stop.wait(self.interval / 2):
+            beat = self._last_beat
+            stalled = time.perf_counter() - beat - self.interval
+            # 한 번 멈출 때마다 한 번만 기록 (하트비트가 다시 돌면 다음 멈춤을 기록)
+            if stalled >= self.threshold and captured_beat != beat:
+                captured_beat = beat
+                self._capture(stalled)
+
+    def _current_route(self) -> str:
+        task = asyncio.current_task(self._loop)
+        scope = self.task_scopes.get(task) if task is not None else None
+        if scope is None:
+            return "background" if task is not None else "unknown"
+        route = route_label(scope)
+        return f"{scope['method']} {scope['path'] if route == 'unmatched' else route}"
+
+    def _capture(self, stalled: float):
+        frame = sys._current_frames().get(self._loop_thread)
+        stack = traceback.format_stack(frame, limit=LOOP_LAG_STACK_LIMIT) if frame is not None else []
+        route = self._current_route()
+        LOOP_STALLS.inc(route=route)
+        self.events.append({
+            "at": time.time(),
+            "route": route,
+            "stalled_ms": round(stalled * 1000, 1),
+            "lag_ms": None,
+            "stack": [line.rstrip("\n") for line in stack],
+        })
+        logger.warning(f"이벤트 루프가 {stalled * 1000:.0f}ms 이상 멈춤 ({route})\n{''.join(stack)}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "interval_ms": self.interval * 1000,
+            "threshold_ms": self.threshold * 1000,
+            "max_lag_ms": round(self._max_lag * 1000, 1),
+            "active_requests": len(self.task_scopes),
+            "recent_stalls": list(self.events)[::-1],
+        }
+
+
+loop_monitor = LoopLagMonitor()
+
+
+class LoopTaskMiddleware:
+    """요청을 처리하는 태스크와 scope를 loop_monitor에 등록 (멈춤이 어느 라우트에서 났는지 찾기 위함)"""
+
+    def __init__(self, app, monitor: LoopLagMonitor = loop_monitor):
+        self.app = app
+        self.monitor = monitor
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        task = asyncio.current_task()
+        self.monitor.task_scopes[task] = scope
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.monitor.task_scopes.pop(task, None)
@@ -0,0 +1,260 @@
+import re
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# 초 단위 기본 구간 (SQL 한 건 ~ OCR 한 장까지)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type_name}"]
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """누적 구간 히스토그램 (관측 한 번에 잠금 1회, 구간 탐색은 이진 탐색)"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 -> [구간별 개수..., +Inf 개수, 합계]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._label_values(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            row[index] += 1
+            row[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """블록 실행 시간을 관측 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = [(key, row[:]) for key, row in self._values.items()]
+        for key, row in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), row[:-1]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(row[-1])}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class CallbackMetric(_Metric):
+    """수집 시점에 함수를 호출해 값을 읽는 지표 (이미 통계를 세고 있는 객체를 노출할 때 사용)"""
+
+    def __init__(self, name: str, help_text: str, type_name: str, labelnames: Sequence[str],
+                 collect: Callable[[], Iterable[Tuple[LabelValues, float]]]):
+        super().__init__(name, help_text, labelnames)
+        self.type_name = type_name
+        self._collect = collect
+
+    def samples(self) -> Iterator[str]:
+        for key, value in self._collect():
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class MetricsRegistry:
+    """프로세스 단위 지표 저장소 (워커가 여러 개면 워커마다 따로 수집됨)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            # 모듈을 다시 불러와도 같은 이름은 하나만 유지
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help_text, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+PIPELINE_STAGE_SECONDS = registry.histogram(
+    "food_pipeline_stage_seconds", "음식 이미지 분석 단계별 소요 시간", ["stage"])
+DB_QUERY_SECONDS = registry.histogram(
+    "db_query_seconds", "SQL 실행 시간 (문장 종류와 대상 테이블별)", ["operation", "table"])
+UPSTREAM_ERRORS = registry.counter(
+    "upstream_errors_total", "외부 API 호출 실패 수", ["upstream", "reason"])
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (응답 헤더 전송까지)", ["method", "route", "status"])
+
+_CACHES: Dict[str, Callable[[], Dict]] = {}
+
+
+def register_cache(name: str, stats: Callable[[], Dict]):
+    """hits/misses를 포함한 통계 함수를 가진 캐시를 cache_requests_total로 노출"""
+    _CACHES[name] = stats
+
+
+def _collect_cache_requests() -> Iterator[Tuple[LabelValues, float]]:
+    for name, stats in list(_CACHES.items()):
+        values = stats()
+        yield (name, "hit"), values.get("hits", 0)
+        yield (name, "miss"), values.get("misses", 0)
+
+
+registry.register(CallbackMetric(
+    "cache_requests_total", "캐시 조회 수 (적중/실패)", "counter", ["cache", "result"], _collect_cache_requests))
+
+
+_STATEMENT_PATTERNS = [
+    ("select", re.compile(r"^\s*SELECT\b.*?\bFROM\s+[\"`]?(\w+)", re.IGNORECASE | re.DOTALL)),
+    ("insert", re.compile(r"^\s*INSERT\s+INTO\s+[\"`]?(\w+)", re.IGNORECASE)),
+    ("update", re.compile(r"^\s*UPDATE\s+[\"`]?(\w+)", re.IGNORECASE)),
+    ("delete", re.compile(r"^\s*DELETE\s+FROM\s+[\"`]?(\w+)", re.IGNORECASE)),
+]
+
+
+@lru_cache(maxsize=2048)
+def classify_statement(statement: str) -> Tuple[str, str]:
+    """SQL 문장을 (종류, 대상 테이블)로 분류 (같은 문장은 캐시된 결과 사용)"""
+    for operation, pattern in _STATEMENT_PATTERNS:
+        match = pattern.match(statement)
+        if match:
+            return operation, match.group(1).lower()
+    keyword = statement.lstrip().split(None, 1)[0].lower() if statement.strip() else "other"
+    return (keyword if keyword in ("select", "insert", "update", "delete", "pragma", "begin", "commit") else "other"), ""
+
+
+_route_templates: Dict[int, Dict[object, str]] = {}
+
+
+def route_label(scope) -> str:
+    """요청이 매칭된 라우트의 경로 템플릿 (/meals/{meal_id} 등, 매칭되지 않았으면 unmatched)
+
+    Starlette 0.14는 scope에 라우트를 남기지 않으므로 scope["endpoint"]로 앱의 라우트 목록에서 찾습니다.
+    """
+    endpoint = scope.get("endpoint")
+    app = scope.get("app")
+    if endpoint is None or app is None:
+        return "unmatched"
+    templates = _route_templates.get(id(app))
+    if templates is None:
+        templates = {getattr(route, "endpoint", None): route.path
+                     for route in getattr(app, "routes", []) if hasattr(route, "path")}
+        _route_templates[id(app)] = templates
+    return templates.get(endpoint, "unmatched")
+
+
+class MetricsMiddleware:
+    """요청별 처리 시간을 라우트 템플릿 단위로 HTTP_REQUEST_SECONDS에 기록"""
+
+    def __init__(self, app, exclude_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = set(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status: Optional[int] = None
+
+        async def send_with_metrics(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, method=scope["method"],
+                                             route=route_label(scope), status=str(status))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            if status is None:
+                # 응답을 보내기 전에 예외로 끝난 요청
+                HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, method=scope["method"],
+                                             route=route_label(scope), status="500")
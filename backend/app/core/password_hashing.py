@@ -0,0 +1,89 @@
+import os
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+from passlib.context import CryptContext
+
+logger = logging.getLogger(__name__)
+
+# bcrypt 비용 (2^rounds). 해시에 rounds가 함께 저장되므로 바꿔도 기존 해시는 그대로 검증되고,
+# 이 값보다 약한 해시는 다음 로그인 때 새 비용으로 다시 해시됨
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# 해시 전용 스레드 수 (bcrypt는 해시 중 GIL을 놓으므로 스레드로도 코어를 활용함)
+HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+# 대기 + 실행 중인 해시 작업 상한. 넘으면 429
+HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", str(HASH_WORKERS * 8)))
+# 같은 계정/IP의 동시 해시 작업 상한
+HASH_MAX_PER_KEY = int(os.getenv("PASSWORD_HASH_MAX_PER_KEY", "2"))
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS
+)
+
+
+class HashingBusy(Exception):
+    """해시 대기열이 가득 찼거나 같은 계정/IP의 요청이 너무 많음"""
+
+
+class PasswordHasher:
+    """전용 스레드 풀에서 비밀번호 해시/검증을 실행하고 대기열 길이를 제한"""
+
+    def __init__(self, context: CryptContext, workers: int, max_pending: int, max_per_key: int):
+        self.context = context
+        self.max_pending = max_pending
+        self.max_per_key = max_per_key
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._per_key: Dict[str, int] = {}
+        self._rejected = 0
+
+    @contextmanager
+    def admit(self, keys: Iterable[str]):
+        """대기열과 키별 동시 작업 수를 확인하고 자리를 잡음. 초과 시 HashingBusy"""
+        keys = [key for key in keys if key]
+        with self._lock:
+            if self._pending >= self.max_pending or any(self._per_key.get(key, 0) >= self.max_per_key for key in keys):
+                self._rejected += 1
+                raise HashingBusy()
+            self._pending += 1
+            for key in keys:
+                self._per_key[key] = self._per_key.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pending -= 1
+                for key in keys:
+                    remaining = self._per_key[key] - 1
+                    if remaining:
+                        self._per_key[key] = remaining
+                    else:
+                        del self._per_key[key]
+
+    async def hash(self, password: str) -> str:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.context.hash, password)
+
+    async def verify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """(일치 여부, 비용이 바뀌어 다시 만든 해시 또는 None)"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.context.verify_and_update, password, hashed
+        )
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "rounds": BCRYPT_ROUNDS,
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+                "rejected": self._rejected
+            }
+
+
+password_hasher = PasswordHasher(pwd_context, HASH_WORKERS, HASH_MAX_PENDING, HASH_MAX_PER_KEY)
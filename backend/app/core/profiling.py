@@ -0,0 +1,253 @@
+import os
+import re
+import sys
+import hmac
+import json
+import time
+import uuid
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# 프로파일 저장 위치와 보관 개수 (오래된 것부터 삭제)
+PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(BACKEND_DIR, "profiles"))
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "50"))
+# 샘플링 간격 (밀리초), 요청 하나를 프로파일링하는 최대 시간 (초)
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "120"))
+
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_ID_PATTERN = re.compile(r"^\d{8}-\d{6}-[0-9a-f]{8}$")
+
+# 가장 안쪽 Python 프레임이 이 함수면 대기 중인 스레드로 보고 샘플에서 제외
+# (이벤트 루프의 select, 스레드 풀 워커의 작업 대기, Event/Condition 대기)
+IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("thread.py", "_worker"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+}
+
+FrameKey = Tuple[str, str, int]
+
+
+class SamplingProfiler:
+    """sys._current_frames()로 모든 스레드의 스택을 주기적으로 기록하는 벽시계 기준 샘플링 프로파일러
+
+    이벤트 루프 스레드(OCR 포함)와 스레드 풀(동기 라우트, 비밀번호 해시)을 함께 보기 위해
+    스레드를 가리지 않고 샘플링하므로, 같은 시간에 처리 중인 다른 요청도 섞일 수 있습니다.
+    """
+
+    def __init__(self, interval: float = PROFILE_INTERVAL_MS / 1000, max_seconds: float = PROFILE_MAX_SECONDS):
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self.frames: List[FrameKey] = []
+        self._frame_ids: Dict[FrameKey, int] = {}
+        # 스레드 ID -> (이름, [(스택 프레임 ID 튜플, 가중치(초))])
+        self.samples: Dict[int, Tuple[str, List[Tuple[Tuple[int, ...], float]]]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.started_at = 0.0
+        self.duration = 0.0
+
+    def _frame_id(self, code) -> int:
+        key = (code.co_name, code.co_filename, code.co_firstlineno)
+        frame_id = self._frame_ids.get(key)
+        if frame_id is None:
+            frame_id = self._frame_ids[key] = len(self.frames)
+            self.frames.append(key)
+        return frame_id
+
+    def _sample(self, own_ident: int, weight: float, names: Dict[int, str]):
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            code = frame.f_code
+            if (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._frame_id(frame.f_code))
+                frame = frame.f_back
+            stack.reverse()
+            if ident not in self.samples:
+                if ident not in names:
+                    names.update((t.ident, t.name) for t in threading.enumerate())
+                self.samples[ident] = (names.get(ident, str(ident)), [])
+            self.samples[ident][1].append((tuple(stack), weight))
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        last = self.started_at
+        deadline = self.started_at + self.max_seconds
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            # 샘플마다 실제 경과 시간을 가중치로 사용 (GIL 대기로 간격이 늘어나도 시간이 맞도록)
+            self._sample(own_ident, now - last, names)
+            last = now
+            if now > deadline:
+                logger.warning(f"프로파일링 최대 시간({self.max_seconds}초) 초과, 샘플링 중단")
+                break
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self.started_at
+
+    def to_speedscope(self, name: str) -> Dict:
+        """speedscope(https://www.speedscope.app) 파일 형식, 스레드마다 프로파일 하나"""
+        profiles = []
+        for ident, (thread_name, samples) in sorted(self.samples.items(), key=lambda item: item[1][0]):
+            total = sum(weight for _, weight in samples) * 1000
+            profiles.append({
+                "type": "sampled",
+                "name": f"{thread_name} ({ident})",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": round(total, 3),
+                "samples": [list(stack) for stack, _ in samples],
+                "weights": [round(weight * 1000, 3) for _, weight in samples],
+            })
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "ocr_api request profiler",
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [{"name": func, "file": filename, "line": line} for func, filename, line in self.frames]
+            },
+            "profiles": profiles,
+        }
+
+
+class ProfileStore:
+    """프로파일 파일 저장/목록/조회 (디렉토리를 공유하므로 모든 워커의 프로파일이 보임)"""
+
+    def __init__(self, directory: str = PROFILE_DIR, max_files: int = PROFILE_MAX_FILES):
+        self.directory = directory
+        self.max_files = max_files
+
+    @staticmethod
+    def new_id() -> str:
+        return f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+    def path_for(self, profile_id: str) -> Optional[str]:
+        """저장된 프로파일 경로 (형식이 맞지 않거나 없으면 None)"""
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = os.path.join(self.directory, f"{profile_id}.speedscope.json")
+        return path if os.path.exists(path) else None
+
+    def save(self, profile_id: str, data: Dict) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{profile_id}.speedscope.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        self._prune()
+        return path
+
+    def list(self) -> List[Dict]:
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for filename in os.listdir(self.directory):
+            if not filename.endswith(".speedscope.json"):
+                continue
+            stat = os.stat(os.path.join(self.directory, filename))
+            entries.append({
+                "id": filename[:-len(".speedscope.json")],
+                "bytes": stat.st_size,
+                "created_at": stat.st_mtime,
+            })
+        return sorted(entries, key=lambda entry: entry["created_at"], reverse=True)
+
+    def _prune(self):
+        for entry in self.list()[self.max_files:]:
+            try:
+                os.remove(os.path.join(self.directory, f"{entry['id']}.speedscope.json"))
+            except OSError:
+                pass
+
+
+profile_store = ProfileStore()
+
+
+class ProfilingMiddleware:
+    """관리자 토큰과 함께 X-Profile: 1 헤더나 ?profile=1로 요청하면 그 요청의 프로파일을 저장
+
+    응답에 X-Profile-Id 헤더로 프로파일 ID를 돌려주고, /admin/profiles/{id}로 내려받을 수 있습니다.
+    샘플러가 프로세스 전체를 보므로 한 워커에서 동시에 하나의 요청만 프로파일링합니다
+    (이미 진행 중이면 X-Profile-Id: busy).
+    """
+
+    def __init__(self, app, admin_token: Optional[str] = None, store: ProfileStore = profile_store):
+        self.app = app
+        self.admin_token = admin_token
+        self.store = store
+        self._busy = threading.Lock()
+
+    def _requested(self, scope) -> bool:
+        if not self.admin_token:
+            return False
+        headers = dict(scope["headers"])
+        flag = headers.get(b"x-profile", b"").decode("latin-1")
+        if flag not in ("1", "true"):
+            flag = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("profile", [""])[0]
+        if flag not in ("1", "true"):
+            return False
+        # str끼리 비교하면 비ASCII 토큰에서 TypeError가 나므로 bytes로 비교
+        return hmac.compare_digest(headers.get(b"x-admin-token", b""), self.admin_token.encode())
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not self._busy.acquire(blocking=False):
+            await self.app(scope, receive, self._with_header(send, "busy"))
+            return
+
+        profile_id = self.store.new_id()
+        status = {"code": 500}
+        profiler = SamplingProfiler()
+        profiler.start()
+        try:
+            await self.app(scope, receive, self._with_header(send, profile_id, status))
+        finally:
+            profiler.stop()
+            self._busy.release()
+            query = scope.get("query_string", b"").decode("latin-1")
+            name = (f"{scope['method']} {scope['path']}{'?' + query if query else ''} "
+                    f"-> {status['code']} ({profiler.duration * 1000:.0f}ms) [{profile_id}]")
+            try:
+                path = await run_in_threadpool(self.store.save, profile_id, profiler.to_speedscope(name))
+                logger.info(f"요청 프로파일 저장: {name} -> {path}")
+            except OSError as e:
+                logger.error(f"요청 프로파일 저장 실패: {str(e)}")
+
+    @staticmethod
+    def _with_header(send, value: str, status: Optional[Dict] = None):
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                if status is not None:
+                    status["code"] = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (PROFILE_ID_HEADER.lower().encode("latin-1"), value.encode("latin-1"))
+                ]
+            await send(message)
+        return send_with_profile_id
@@ -0,0 +1,65 @@
+import json
+import hashlib
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.core.cache import TTLCache
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(쉼표 구분, W/ 허용, *)에 etag가 포함되는지 확인"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+class VersionedResponseCache:
+    """사용자 데이터 버전 기반 ETag 조건부 요청 처리와 직렬화된 JSON 응답 캐시
+
+    응답은 (사용자, 엔드포인트, 파라미터, 데이터 버전)이 같으면 같다고 보고,
+    식사/목표가 바뀔 때 데이터 버전이 올라가면 ETag와 캐시 키가 함께 바뀝니다.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.bodies: TTLCache[bytes] = TTLCache(ttl=ttl, maxsize=maxsize)
+
+    @staticmethod
+    def _key(user_id: int, version: int, endpoint: str, params: Dict[str, Any]) -> Tuple[Hashable, ...]:
+        return (user_id, version, endpoint, tuple(sorted((name, str(value)) for name, value in params.items())))
+
+    @staticmethod
+    def etag_for(key: Tuple[Hashable, ...]) -> str:
+        user_id, version, endpoint, params = key
+        digest = hashlib.blake2b(repr((endpoint, params)).encode("utf-8"), digest_size=8).hexdigest()
+        return f'"{user_id}-{version}-{digest}"'
+
+    def respond(self, request: Request, user_id: int, version: int, endpoint: str,
+                params: Dict[str, Any], build: Callable[[], Any]) -> Response:
+        """If-None-Match가 현재 ETag와 같으면 304, 아니면 캐시된 본문 또는 build() 결과를 반환"""
+        key = self._key(user_id, version, endpoint, params)
+        etag = self.etag_for(key)
+        # 브라우저가 매번 재검증하도록 no-cache (재검증은 304로 끝남)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        body = self.bodies.get(key)
+        if body is None:
+            body = json.dumps(
+                jsonable_encoder(build()),
+                ensure_ascii=False,
+                allow_nan=False,
+                separators=(",", ":")
+            ).encode("utf-8")
+            self.bodies.set(key, body)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.bodies.stats()
@@ -0,0 +1,195 @@
+import os
+import re
+import time
+import logging
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.metrics import DB_QUERY_SECONDS, classify_statement, registry, route_label
+
+logger = logging.getLogger(__name__)
+
+# 이 시간(ms) 이상 걸린 SQL 한 건은 경고 로그 (DB_EXPLAIN_SLOW_QUERIES=1이면 실행 계획도 함께)
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "100"))
+DB_EXPLAIN_SLOW_QUERIES = os.getenv("DB_EXPLAIN_SLOW_QUERIES", "0") == "1"
+# 요청 하나의 쿼리 수/DB 누적 시간(ms)이 이 값을 넘으면 경고 로그
+DB_REQUEST_MAX_QUERIES = int(os.getenv("DB_REQUEST_MAX_QUERIES", "30"))
+DB_REQUEST_MAX_MS = float(os.getenv("DB_REQUEST_MAX_MS", "250"))
+# 같은 형태의 문장이 요청 하나에서 이 횟수 이상 실행되면 N+1 의심으로 경고
+DB_REPEATED_QUERY_THRESHOLD = int(os.getenv("DB_REPEATED_QUERY_THRESHOLD", "5"))
+# 요청별로 보관하는 가장 느린 문장 수
+DB_SLOWEST_KEPT = 3
+
+DB_QUERIES_PER_REQUEST = registry.histogram(
+    "db_queries_per_request", "요청 하나에서 실행한 SQL 수", ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100))
+DB_QUERY_WARNINGS = registry.counter(
+    "db_query_warnings_total", "쿼리 수/DB 시간/반복 문장 경고 수", ["route", "kind"])
+
+_WHITESPACE = re.compile(r"\s+")
+# IN (?, ?, ?) 처럼 개수만 다른 바인드 목록
+_BIND_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+))+\s*\)")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+@lru_cache(maxsize=2048)
+def statement_shape(statement: str) -> str:
+    """바인드 목록 길이와 리터럴 값을 지운 문장 형태 (같은 형태가 반복되면 N+1 의심)"""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _BIND_LIST.sub("(?, ...)", shape)
+    return _LITERALS.sub("?", shape)
+
+
+class RequestTiming:
+    """요청 하나에서 실행한 SQL 횟수와 누적 시간, 문장 형태별 횟수, 가장 느린 문장"""
+
+    __slots__ = ("db_time", "db_queries", "shapes", "slowest")
+
+    def __init__(self):
+        self.db_time = 0.0
+        self.db_queries = 0
+        # 문장 형태 -> [실행 횟수, 누적 시간]
+        self.shapes: Dict[str, List[float]] = {}
+        # (시간, 문장) 느린 순
+        self.slowest: List[Tuple[float, str]] = []
+
+    def record(self, statement: str, elapsed: float):
+        self.db_time += elapsed
+        self.db_queries += 1
+        shape = statement_shape(statement)
+        entry = self.shapes.get(shape)
+        if entry is None:
+            self.shapes[shape] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+        if len(self.slowest) < DB_SLOWEST_KEPT or elapsed > self.slowest[-1][0]:
+            self.slowest.append((elapsed, statement))
+            self.slowest.sort(key=lambda item: -item[0])
+            del self.slowest[DB_SLOWEST_KEPT:]
+
+    def repeated(self, threshold: int = DB_REPEATED_QUERY_THRESHOLD) -> List[Tuple[str, int, float]]:
+        """threshold번 이상 실행된 문장 형태 (형태, 횟수, 누적 시간), 많이 실행된 순"""
+        rows = [(shape, int(count), total) for shape, (count, total) in self.shapes.items() if count >= threshold]
+        return sorted(rows, key=lambda row: -row[1])
+
+    def warnings(self) -> List[Tuple[str, str]]:
+        """임계값을 넘은 항목 (종류, 설명)"""
+        found = []
+        if self.db_queries > DB_REQUEST_MAX_QUERIES:
+            found.append(("query_count", f"쿼리 {self.db_queries}개 (기준 {DB_REQUEST_MAX_QUERIES})"))
+        if self.db_time * 1000 > DB_REQUEST_MAX_MS:
+            found.append(("db_time", f"DB 시간 {self.db_time * 1000:.1f}ms (기준 {DB_REQUEST_MAX_MS:.0f}ms)"))
+        for shape, count, total in self.repeated():
+            found.append(("repeated", f"같은 형태 {count}회 ({total * 1000:.1f}ms, N+1 의심): {shape[:300]}"))
+        return found
+
+
+# 미들웨어가 요청마다 새 객체를 넣음. 스레드풀에서 실행되는 동기 라우트도
+# 복사된 컨텍스트에서 같은 객체를 보므로 누적 값이 미들웨어에 반영됨
+_current_timing: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    return _current_timing.get()
+
+
+def explain(conn, statement: str, parameters) -> List[str]:
+    """같은 DBAPI 연결의 별도 커서로 실행 계획 조회 (엔진 이벤트와 원래 커서의 결과에 영향 없음)"""
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        # SQLite는 (id, parent, notused, detail), PostgreSQL은 (QUERY PLAN)
+        return [str(row[-1]) for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def _log_slow_query(conn, statement: str, parameters, elapsed: float, executemany: bool):
+    message = f"느린 쿼리 {elapsed * 1000:.1f}ms: {_WHITESPACE.sub(' ', statement).strip()[:500]}"
+    if DB_EXPLAIN_SLOW_QUERIES and not executemany and classify_statement(statement)[0] == "select":
+        try:
+            message += "\n  실행 계획: " + "\n  ".join(explain(conn, statement, parameters))
+        except Exception as e:
+            message += f"\n  실행 계획 조회 실패: {str(e)}"
+    logger.warning(message)
+
+
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    operation, table = classify_statement(statement)
+    DB_QUERY_SECONDS.observe(elapsed, operation=operation, table=table)
+    timing = _current_timing.get()
+    if timing is not None:
+        timing.record(statement, elapsed)
+    if elapsed * 1000 >= DB_SLOW_QUERY_MS:
+        _log_slow_query(conn, statement, parameters, elapsed, executemany)
+
+
+def instrument_engine(engine: Engine):
+    """엔진의 SQL 실행 시간을 현재 요청의 RequestTiming과 db_query_seconds 지표에 기록 (여러 번 호출해도 한 번만 등록)"""
+    if event.contains(engine, "before_cursor_execute", _start_query_timer):
+        return
+    event.listen(engine, "before_cursor_execute", _start_query_timer)
+    event.listen(engine, "after_cursor_execute", _stop_query_timer)
+
+
+def report_request(scope, timing: RequestTiming):
+    """요청이 끝난 뒤 쿼리 수를 기록하고 임계값을 넘었으면 가장 느린 문장과 함께 경고"""
+    route = route_label(scope)
+    DB_QUERIES_PER_REQUEST.observe(timing.db_queries, route=route)
+    found = timing.warnings()
+    if not found:
+        return
+    for kind, _ in found:
+        DB_QUERY_WARNINGS.inc(route=route, kind=kind)
+    slowest = "\n".join(f"  {elapsed * 1000:.1f}ms: {_WHITESPACE.sub(' ', statement).strip()[:300]}"
+                        for elapsed, statement in timing.slowest)
+    logger.warning(f"{scope['method']} {scope['path']} ({route}) DB 경고: "
+                   + "; ".join(message for _, message in found) + f"\n 가장 느린 문장:\n{slowest}")
+
+
+class ServerTimingMiddleware:
+    """요청별 SQL 실행 기록 (쿼리 수/시간 경고, N+1 감지)과 Server-Timing 헤더
+    (db: SQL 누적 시간/횟수, app: 응답 헤더까지 걸린 시간)
+
+    스트리밍 응답은 헤더를 보낸 뒤 실행한 SQL이 헤더에는 포함되지 않고 경고 검사에만 포함됩니다.
+    """
+
+    def __init__(self, app, add_header: bool = True, check_queries: bool = True):
+        self.app = app
+        self.add_header = add_header
+        self.check_queries = check_queries
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = _current_timing.set(timing)
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                total = (time.perf_counter() - started) * 1000
+                value = (f'db;dur={timing.db_time * 1000:.2f};desc="{timing.db_queries} queries", '
+                         f'app;dur={total:.2f}')
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"server-timing", value.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing if self.add_header else send)
+        finally:
+            _current_timing.reset(token)
+            if self.check_queries:
+                report_request(scope, timing)
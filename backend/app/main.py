@@ -1,8 +1,15 @@
+import os
+import asyncio
 import logging
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.v1 import food_recognition, balance
+from app.api.v1 import food_recognition, balance, admin
+from app.services.nutrition.data.menu_registry import menu_registry
 from app.database import engine, Base, create_tables
+from app.core.timing import ServerTimingMiddleware, instrument_engine
+from app.core.metrics import MetricsMiddleware, registry as metrics_registry
+from app.core.profiling import PROFILE_ID_HEADER, ProfilingMiddleware
+from app.core.loop_monitor import LoopTaskMiddleware, loop_monitor
 from sqlalchemy import inspect
 from app.models.balance import User, Meal
 import pytz
@@ -11,6 +18,17 @@ from datetime import datetime
 # 한국 시간대 설정
 KST = pytz.timezone('Asia/Seoul')
 
+# 메뉴 사전 파일 감시 주기 (초, 0이면 감시하지 않음)
+MENU_DICT_WATCH_INTERVAL = float(os.getenv("MENU_DICT_WATCH_INTERVAL", "0"))
+# 응답에 Server-Timing(DB 시간/쿼리 수) 헤더 추가 여부
+SERVER_TIMING = os.getenv("SERVER_TIMING", "1") == "1"
+# 요청별 쿼리 수/DB 시간/반복 문장(N+1) 경고 로그 (기준값은 app/core/timing.py의 DB_* 환경 변수)
+DB_QUERY_WARNINGS = os.getenv("DB_QUERY_WARNINGS", "1") == "1"
+# Prometheus 형식 지표(/metrics) 노출 여부 (워커 프로세스별 값)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") == "1"
+# 이벤트 루프 지연 감시 (임계값 이상 멈추면 루프 스레드 스택과 라우트를 기록)
+LOOP_MONITOR_ENABLED = os.getenv("LOOP_MONITOR_ENABLED", "1") == "1"
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -35,9 +53,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
-    expose_headers=["*"],
+    expose_headers=["*", "ETag", "Server-Timing", PROFILE_ID_HEADER, food_recognition.MENU_DICT_VERSION_HEADER],
 )
 
+if SERVER_TIMING or METRICS_ENABLED or DB_QUERY_WARNINGS:
+    instrument_engine(engine)
+if SERVER_TIMING or DB_QUERY_WARNINGS:
+    app.add_middleware(ServerTimingMiddleware, add_header=SERVER_TIMING, check_queries=DB_QUERY_WARNINGS)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+if LOOP_MONITOR_ENABLED:
+    app.add_middleware(LoopTaskMiddleware)
+# 관리자 토큰이 있는 요청만 X-Profile: 1 또는 ?profile=1로 프로파일링 (토큰이 없으면 비활성화)
+app.add_middleware(ProfilingMiddleware, admin_token=admin.ADMIN_TOKEN)
+
 # 요청 로깅 미들웨어
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -50,12 +79,19 @@ async def log_requests(request: Request, call_next):
 # API 라우터 등록
 app.include_router(food_recognition.router, prefix="/api/v1")
 app.include_router(balance.router, prefix="/api/v1")
+app.include_router(admin.router, prefix="/api/v1")
 
 @app.get("/")
 async def root():
     logger.info("Root endpoint accessed")
     return {"status": "Food Recognition API is running"}
 
+if METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        """Prometheus 수집용 지표 (현재 워커 기준)"""
+        return Response(content=metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.on_event("startup")
 async def startup_event():
     logger.info("=== 서버 시작됨 ===")
@@ -68,11 +104,18 @@ async def startup_event():
     except Exception as e:
         logger.error(f"테이블 생성 중 오류 발생: {str(e)}")
     
+    if MENU_DICT_WATCH_INTERVAL > 0:
+        asyncio.create_task(menu_registry.watch(MENU_DICT_WATCH_INTERVAL))
+
+    if LOOP_MONITOR_ENABLED:
+        loop_monitor.start()
+    
     logger.info("CORS origins: http://localhost:3000")
     logger.info("API 엔드포인트: /api/v1/food/analyze")
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    loop_monitor.stop()
     logger.info("=== 서버 종료됨 ===")
 
 # ASGI 애플리케이션을 main으로 export
@@ -0,0 +1,72 @@
+"""
+버전별 스키마 마이그레이션
+
+마이그레이션은 ``upgrade(conn)``을 가진 ``m<NNNN>_<설명>.py`` 모듈입니다.
+적용한 버전은 ``schema_migrations``에 기록되어 데이터베이스마다 한 번만 실행됩니다.
+"""
+import re
+import logging
+import pkgutil
+import importlib
+from datetime import datetime
+from typing import List, NamedTuple, Set
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_TABLE = "schema_migrations"
+_MODULE_PATTERN = re.compile(r"^m(\d{4})_(\w+)$")
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    module: str
+
+
+def discover_migrations() -> List[Migration]:
+    """패키지 내 마이그레이션 모듈을 버전 순으로 반환"""
+    migrations = []
+    for info in pkgutil.iter_modules(__path__):
+        match = _MODULE_PATTERN.match(info.name)
+        if match:
+            migrations.append(Migration(int(match.group(1)), match.group(2), f"{__name__}.{info.name}"))
+    return sorted(migrations)
+
+
+def _ensure_migrations_table(conn: Connection):
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {MIGRATIONS_TABLE} ("
+        "version INTEGER PRIMARY KEY, name VARCHAR NOT NULL, applied_at TIMESTAMP NOT NULL)"
+    ))
+
+
+def applied_versions(engine: Engine) -> Set[int]:
+    with engine.begin() as conn:
+        _ensure_migrations_table(conn)
+        return {row[0] for row in conn.execute(text(f"SELECT version FROM {MIGRATIONS_TABLE}"))}
+
+
+def pending_migrations(engine: Engine) -> List[Migration]:
+    applied = applied_versions(engine)
+    return [m for m in discover_migrations() if m.version not in applied]
+
+
+def run_migrations(engine: Engine) -> List[Migration]:
+    """적용되지 않은 마이그레이션을 순서대로 적용 (각 마이그레이션은 별도 트랜잭션)"""
+    applied = []
+    for migration in pending_migrations(engine):
+        module = importlib.import_module(migration.module)
+        with engine.begin() as conn:
+            module.upgrade(conn)
+            conn.execute(
+                text(f"INSERT INTO {MIGRATIONS_TABLE} (version, name, applied_at) VALUES (:version, :name, :applied_at)"),
+                {"version": migration.version, "name": migration.name, "applied_at": datetime.utcnow()}
+            )
+        logger.info(f"마이그레이션 적용: {migration.version:04d}_{migration.name}")
+        applied.append(migration)
+    return applied
+
+
+__all__ = ['Migration', 'discover_migrations', 'applied_versions', 'pending_migrations', 'run_migrations']
@@ -0,0 +1,35 @@
+"""users 테이블에 password_hash를 추가하고 email/password_hash를 NOT NULL로 변경 (기존 add_columns.py)"""
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+
+def upgrade(conn: Connection):
+    inspector = inspect(conn)
+    if not inspector.has_table("users"):
+        return
+    columns = {column["name"] for column in inspector.get_columns("users")}
+    if "password_hash" in columns:
+        return
+
+    conn.execute(text("ALTER TABLE users ADD COLUMN password_hash TEXT"))
+    # SQLite는 컬럼 제약 조건을 바꿀 수 없어 임시 테이블로 옮겨 다시 만듦
+    conn.execute(text('''
+        CREATE TABLE users_temp (
+            id INTEGER PRIMARY KEY,
+            email TEXT NOT NULL UNIQUE,
+            password_hash TEXT NOT NULL,
+            name TEXT,
+            profile_image TEXT,
+            daily_calorie_goal INTEGER DEFAULT 2000,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    '''))
+    conn.execute(text('''
+        INSERT INTO users_temp (id, email, password_hash, name, profile_image, daily_calorie_goal, created_at)
+        SELECT id, COALESCE(email, 'temp_' || id || '@example.com'),
+               COALESCE(password_hash, 'temp_password'), name, profile_image,
+               daily_calorie_goal, created_at
+        FROM users
+    '''))
+    conn.execute(text("DROP TABLE users"))
+    conn.execute(text("ALTER TABLE users_temp RENAME TO users"))
@@ -0,0 +1,9 @@
+"""사용자별 기간 조회를 위한 meals (user_id, timestamp) 복합 인덱스"""
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+
+def upgrade(conn: Connection):
+    if not inspect(conn).has_table("meals"):
+        return
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_meals_user_id_timestamp ON meals (user_id, timestamp)"))
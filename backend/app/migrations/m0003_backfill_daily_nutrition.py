@@ -0,0 +1,82 @@
+"""기존 meals 기록으로 daily_nutrition 롤업 채우기 (이후에는 식사 변경 시 증분 갱신)
+
+모델/서비스가 바뀌어도 결과가 같도록 버전 3 시점의 테이블 정의와 집계, 밸런스 점수 계산을 그대로 둡니다.
+"""
+from typing import Optional
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+# 버전 3 시점의 탄수화물/단백질/지방 권장 비율 (BalanceService.nutrient_ranges)
+NUTRIENT_RANGES = {
+    'carbohydrates': (0.45, 0.65),
+    'protein': (0.10, 0.35),
+    'fat': (0.20, 0.35),
+}
+
+
+def _balance_score(carbohydrates: float, protein: float, fat: float) -> Optional[int]:
+    """버전 3 시점의 BalanceService.calculate_balance_score"""
+    nutrients = {'carbohydrates': carbohydrates, 'protein': protein, 'fat': fat}
+    total = sum(nutrients.values())
+    if total == 0:
+        return 0
+    score = 100
+    for nutrient, (min_ratio, max_ratio) in NUTRIENT_RANGES.items():
+        actual = nutrients[nutrient] / total
+        if actual < min_ratio:
+            score -= (min_ratio - actual) * 100
+        elif actual > max_ratio:
+            score -= (actual - max_ratio) * 100
+    return max(0, min(100, round(score)))
+
+
+def upgrade(conn: Connection):
+    if not inspect(conn).has_table("meals"):
+        return
+
+    conn.execute(text('''
+        CREATE TABLE IF NOT EXISTS daily_nutrition (
+            user_id INTEGER NOT NULL REFERENCES users (id),
+            local_date DATE NOT NULL,
+            total_calories FLOAT NOT NULL,
+            total_carbohydrates FLOAT NOT NULL,
+            total_protein FLOAT NOT NULL,
+            total_fat FLOAT NOT NULL,
+            breakfast_count INTEGER NOT NULL,
+            lunch_count INTEGER NOT NULL,
+            dinner_count INTEGER NOT NULL,
+            balance_score INTEGER,
+            PRIMARY KEY (user_id, local_date)
+        )
+    '''))
+
+    # 저장된 시각은 한국 시간 naive이므로 날짜 부분이 한국 시간 기준 날짜
+    local_date = "CAST(timestamp AS DATE)" if conn.dialect.name == "postgresql" else "date(timestamp)"
+    conn.execute(text("DELETE FROM daily_nutrition"))
+    conn.execute(text(f'''
+        INSERT INTO daily_nutrition (
+            user_id, local_date, total_calories, total_carbohydrates, total_protein, total_fat,
+            breakfast_count, lunch_count, dinner_count
+        )
+        SELECT user_id, {local_date},
+               SUM(COALESCE(calories, 0)), SUM(COALESCE(carbohydrates, 0)),
+               SUM(COALESCE(protein, 0)), SUM(COALESCE(fat, 0)),
+               SUM(CASE WHEN meal_type = 'breakfast' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN meal_type = 'lunch' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN meal_type = 'dinner' THEN 1 ELSE 0 END)
+        FROM meals
+        WHERE user_id IS NOT NULL AND timestamp IS NOT NULL
+        GROUP BY user_id, {local_date}
+    '''))
+
+    rows = conn.execute(text(
+        "SELECT user_id, local_date, total_carbohydrates, total_protein, total_fat FROM daily_nutrition"
+    )).fetchall()
+    if rows:
+        conn.execute(
+            text("UPDATE daily_nutrition SET balance_score = :score WHERE user_id = :user_id AND local_date = :local_date"),
+            [
+                {"score": _balance_score(carbohydrates, protein, fat), "user_id": user_id, "local_date": local_date}
+                for user_id, local_date, carbohydrates, protein, fat in rows
+            ]
+        )
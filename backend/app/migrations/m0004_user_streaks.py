@@ -0,0 +1,64 @@
+"""daily_nutrition 롤업으로부터 user_streaks 초기 상태 계산
+
+모델/서비스가 바뀌어도 결과가 같도록 버전 4 시점의 테이블 정의와 연속 기록 계산을 그대로 둡니다.
+"""
+from datetime import date, timedelta
+from itertools import groupby
+from typing import Dict, List
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+
+def _as_date(value) -> date:
+    # SQLite는 'YYYY-MM-DD' 문자열, PostgreSQL은 date
+    return value if isinstance(value, date) else date.fromisoformat(str(value)[:10])
+
+
+def _streak(perfect_days: List[date]) -> Dict[str, object]:
+    """버전 4 시점의 compute_streak (정렬된 완벽한 날 목록)"""
+    current = longest = 0
+    previous = None
+    for day in perfect_days:
+        current = current + 1 if previous is not None and day == previous + timedelta(days=1) else 1
+        longest = max(longest, current)
+        previous = day
+    return {
+        "current_streak": current,
+        "longest_streak": longest,
+        "last_perfect_date": previous.isoformat() if previous else None,
+        "total_perfect_days": len(perfect_days),
+    }
+
+
+def upgrade(conn: Connection):
+    if not inspect(conn).has_table("daily_nutrition"):
+        return
+
+    conn.execute(text('''
+        CREATE TABLE IF NOT EXISTS user_streaks (
+            user_id INTEGER NOT NULL PRIMARY KEY REFERENCES users (id),
+            current_streak INTEGER NOT NULL,
+            longest_streak INTEGER NOT NULL,
+            last_perfect_date DATE,
+            total_perfect_days INTEGER NOT NULL
+        )
+    '''))
+
+    # 롤업이 있는 사용자마다 한 행 (완벽한 날이 없으면 0)
+    rows = conn.execute(text('''
+        SELECT user_id, local_date,
+               CASE WHEN breakfast_count > 0 AND lunch_count > 0 AND dinner_count > 0 THEN 1 ELSE 0 END
+        FROM daily_nutrition
+        ORDER BY user_id, local_date
+    ''')).fetchall()
+    states = []
+    for user_id, days in groupby(rows, key=lambda row: row[0]):
+        perfect_days = [_as_date(local_date) for _, local_date, perfect in days if perfect]
+        states.append({"user_id": user_id, **_streak(perfect_days)})
+
+    conn.execute(text("DELETE FROM user_streaks"))
+    if states:
+        conn.execute(text('''
+            INSERT INTO user_streaks (user_id, current_streak, longest_streak, last_perfect_date, total_perfect_days)
+            VALUES (:user_id, :current_streak, :longest_streak, :last_perfect_date, :total_perfect_days)
+        '''), states)
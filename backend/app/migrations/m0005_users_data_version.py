@@ -0,0 +1,12 @@
+"""조건부 요청(ETag)을 위한 users.data_version 컬럼 (식사/목표 변경 시 증가)"""
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+
+def upgrade(conn: Connection):
+    inspector = inspect(conn)
+    if not inspector.has_table("users"):
+        return
+    if "data_version" in {column["name"] for column in inspector.get_columns("users")}:
+        return
+    conn.execute(text("ALTER TABLE users ADD COLUMN data_version INTEGER NOT NULL DEFAULT 0"))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, String, Enum as SQLAlchemyEnum
+from sqlalchemy import Column, Integer, Float, Date, DateTime, ForeignKey, String, Index, Enum as SQLAlchemyEnum
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -16,6 +16,10 @@ class MealType(str, enum.Enum):
 
 class Meal(Base):
     __tablename__ = "meals"
+    __table_args__ = (
+        # 사용자별 기간 조회 (user_id = ? AND timestamp >= ? AND timestamp < ?)
+        Index("ix_meals_user_id_timestamp", "user_id", "timestamp"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -39,4 +43,31 @@ class User(Base):
     profile_image = Column(String, nullable=True)
     daily_calorie_goal = Column(Integer, default=2000)
     created_at = Column(DateTime, default=lambda: datetime.now(KST))
-    meals = relationship("Meal", back_populates="user") 
\ No newline at end of file
+    # 식사/목표/프로필이 바뀔 때마다 증가 (조회 API의 ETag에 사용)
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")
+    meals = relationship("Meal", back_populates="user")
+
+class DailyNutrition(Base):
+    """사용자별 하루 영양 섭취 합계 (식사 추가/수정/삭제와 같은 트랜잭션에서 갱신)"""
+    __tablename__ = "daily_nutrition"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    local_date = Column(Date, primary_key=True)  # 한국 시간 기준 날짜
+    total_calories = Column(Float, nullable=False, default=0)
+    total_carbohydrates = Column(Float, nullable=False, default=0)
+    total_protein = Column(Float, nullable=False, default=0)
+    total_fat = Column(Float, nullable=False, default=0)
+    breakfast_count = Column(Integer, nullable=False, default=0)
+    lunch_count = Column(Integer, nullable=False, default=0)
+    dinner_count = Column(Integer, nullable=False, default=0)
+    balance_score = Column(Integer, nullable=True)
+
+class UserStreak(Base):
+    """사용자별 완벽한 날(아침/점심/저녁 모두 기록) 연속 기록 상태"""
+    __tablename__ = "user_streaks"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    current_streak = Column(Integer, nullable=False, default=0)  # last_perfect_date에서 끝나는 연속 일수
+    longest_streak = Column(Integer, nullable=False, default=0)
+    last_perfect_date = Column(Date, nullable=True)
+    total_perfect_days = Column(Integer, nullable=False, default=0)
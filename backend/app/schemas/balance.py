@@ -1,9 +1,9 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import Dict, Optional, List
 from datetime import datetime
 from enum import Enum
 
-__all__ = ['BalanceCreate', 'Balance', 'DailyBalance', 'MealCreate', 'BalanceResponse', 'UserCreate', 'Token', 'UserProfile', 'UserProfileUpdate', 'UserLogin']
+__all__ = ['BalanceCreate', 'Balance', 'DailyBalance', 'MealCreate', 'MealBulkCreate', 'MealBulkResponse', 'MealHistoryItem', 'MealHistoryPage', 'BalanceResponse', 'UserCreate', 'Token', 'UserProfile', 'UserProfileUpdate', 'UserLogin']
 
 class MealType(str, Enum):
     breakfast = "breakfast"
@@ -21,6 +21,26 @@ class MealCreate(BaseModel):
     class Config:
         from_attributes = True
 
+class MealBulkCreate(BaseModel):
+    meals: List[MealCreate] = Field(..., min_items=1, max_items=50)
+
+class MealBulkResponse(BaseModel):
+    ids: List[int]
+    timestamp: datetime
+
+class MealHistoryItem(BaseModel):
+    id: int
+    meal_type: str
+    food_name: Optional[str]
+    timestamp: datetime
+    calories: float
+    nutrients: Dict[str, float]
+
+class MealHistoryPage(BaseModel):
+    items: List[MealHistoryItem]
+    # 다음 페이지 요청에 cursor로 전달 (마지막 페이지면 None)
+    next_cursor: Optional[str]
+
 class BalanceResponse(BaseModel):
     balance_score: int
     total_calories: float
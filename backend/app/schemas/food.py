@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Dict
+from pydantic import BaseModel, Field
+from typing import Dict, List
 
 class NutrientInfo(BaseModel):
     amount: float
@@ -9,4 +9,21 @@ class NutrientInfo(BaseModel):
 class FoodRecognitionResponse(BaseModel):
     name: str
     calories: int
-    nutrients: Dict[str, NutrientInfo] 
\ No newline at end of file
+    nutrients: Dict[str, NutrientInfo]
+
+class MenuMatchRequest(BaseModel):
+    texts: List[str] = Field(..., min_items=1, max_items=100)
+    top_k: int = Field(5, ge=1, le=20)
+    cutoff: float = Field(0.6, ge=0.0, le=1.0)
+
+class MenuCandidate(BaseModel):
+    menu: str
+    score: float
+
+class MenuMatchResult(BaseModel):
+    text: str
+    candidates: List[MenuCandidate]
+
+class MenuMatchResponse(BaseModel):
+    dictionary_version: str
+    results: List[MenuMatchResult]
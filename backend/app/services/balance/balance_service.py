@@ -1,14 +1,66 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, Tuple, Optional, List
+import base64
 import logging
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, extract, select
-from app.models.balance import Meal, User
+from sqlalchemy import func, and_, select, case, cast, extract, tuple_, Date, Integer
+from app.models.balance import DailyNutrition, Meal, MealType, User
 from app.schemas.balance import Balance,BalanceCreate
-from decimal import Decimal
+from app.services.balance.streak_service import StreakService
 
 logger = logging.getLogger(__name__)
 
+def day_range(day: date, days: int = 1) -> Tuple[datetime, datetime]:
+    """day 00:00부터 days일 뒤 00:00까지의 반열린 구간 [start, end)"""
+    start = datetime.combine(day, datetime.min.time())
+    return start, start + timedelta(days=days)
+
+def month_range(year: int, month: int) -> Tuple[datetime, datetime]:
+    """해당 월 1일 00:00부터 다음 달 1일 00:00까지의 반열린 구간 [start, end)"""
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
+
+def local_date_expr(column, dialect: str):
+    """저장된 시각(한국 시간 naive)의 날짜. SQLite는 'YYYY-MM-DD' 문자열, PostgreSQL은 date"""
+    if dialect == 'postgresql':
+        return cast(column, Date)
+    return func.date(column)
+
+def local_hour_expr(column, dialect: str):
+    """저장된 시각(한국 시간 naive)의 시(0-23)"""
+    if dialect == 'postgresql':
+        return cast(extract('hour', column), Integer)
+    return cast(func.strftime('%H', column), Integer)
+
+def as_date(value) -> date:
+    """local_date_expr 결과를 date로 변환"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+def encode_cursor(timestamp: datetime, meal_id: int) -> str:
+    """식사 기록 목록의 다음 페이지 위치 (마지막 항목의 timestamp, id)"""
+    return base64.urlsafe_b64encode(f"{timestamp.isoformat()}|{meal_id}".encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """encode_cursor 결과를 (timestamp, id)로 변환. 형식이 잘못되면 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, meal_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(timestamp), int(meal_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"잘못된 cursor: {cursor}") from e
+
+def bump_data_versions(db: Session, user_id: Optional[int] = None):
+    """사용자(없으면 전체)의 응답 내용이 바뀌었음을 기록해 이전 ETag가 304를 받지 않게 함"""
+    query = db.query(User)
+    if user_id is not None:
+        query = query.filter(User.id == user_id)
+    query.update({User.data_version: User.data_version + 1}, synchronize_session=False)
+
 class BalanceService:
     def __init__(self, db: Session):
         self.db = db
@@ -174,59 +226,76 @@ class BalanceService:
         self.db.refresh(db_balance)
         return db_balance
 
-    def get_monthly_balance(self, user_id: int, year: int, month: int) -> dict:
-        # 해당 월의 모든 식사 기록 조회
-        meals = self.db.query(Meal).filter(
-            and_(
-                Meal.user_id == user_id,
-                extract('year', Meal.timestamp) == year,
-                extract('month', Meal.timestamp) == month
-            )
+    @property
+    def dialect(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    def get_daily_totals(self, user_id: int, start: datetime, end: datetime) -> List[Tuple[date, float, float, float, float, int, int, int]]:
+        """[start, end) 구간 식사를 날짜별로 집계한 (날짜, 칼로리, 탄수화물, 단백질, 지방, 아침/점심/저녁 횟수) 목록"""
+        day = local_date_expr(Meal.timestamp, self.dialect)
+        rows = self.db.query(
+            day,
+            func.coalesce(func.sum(Meal.calories), 0),
+            func.coalesce(func.sum(Meal.carbohydrates), 0),
+            func.coalesce(func.sum(Meal.protein), 0),
+            func.coalesce(func.sum(Meal.fat), 0),
+            *[func.sum(case((Meal.meal_type == meal_type, 1), else_=0)) for meal_type in MealType]
+        ).filter(
+            Meal.user_id == user_id,
+            Meal.timestamp >= start,
+            Meal.timestamp < end
+        ).group_by(day).order_by(day).all()
+        return [(as_date(row[0]),) + tuple(float(v) for v in row[1:5]) + tuple(int(v) for v in row[5:]) for row in rows]
+
+    def get_meals_between(self, user_id: int, start: datetime, end: datetime) -> List[Meal]:
+        """[start, end) 구간의 식사 기록 (ix_meals_user_id_timestamp 범위 검색)"""
+        return self.db.query(Meal).filter(
+            Meal.user_id == user_id,
+            Meal.timestamp >= start,
+            Meal.timestamp < end
         ).all()
 
-        # 날짜별로 식사 기록 그룹화
+    def get_meal_history(self, user_id: int, limit: int, after: Optional[Tuple[datetime, int]] = None,
+                         meal_type: Optional[str] = None, start: Optional[datetime] = None,
+                         end: Optional[datetime] = None) -> List[Meal]:
+        """최신순 식사 기록 한 페이지 (keyset 페이지네이션)
+
+        (timestamp, id) < after 조건으로 이전 페이지의 마지막 항목 다음부터 읽으므로
+        ix_meals_user_id_timestamp 범위 검색만으로 처리되고 페이지가 깊어져도 비용이 같습니다.
+        """
+        query = self.db.query(Meal).filter(Meal.user_id == user_id)
+        if start is not None:
+            query = query.filter(Meal.timestamp >= start)
+        if end is not None:
+            query = query.filter(Meal.timestamp < end)
+        if meal_type is not None:
+            query = query.filter(Meal.meal_type == meal_type)
+        if after is not None:
+            query = query.filter(tuple_(Meal.timestamp, Meal.id) < tuple_(*after))
+        return query.order_by(Meal.timestamp.desc(), Meal.id.desc()).limit(limit).all()
+
+    def get_daily_nutrition(self, user_id: int, start_date: date, end_date: date) -> List[DailyNutrition]:
+        """[start_date, end_date) 구간의 일별 영양 합계 (날짜순)"""
+        return self.db.query(DailyNutrition).filter(
+            DailyNutrition.user_id == user_id,
+            DailyNutrition.local_date >= start_date,
+            DailyNutrition.local_date < end_date
+        ).order_by(DailyNutrition.local_date).all()
+
+    def summarize_month(self, rows: List[DailyNutrition]) -> dict:
+        """롤업 행들로 월간 밸런스 응답(식사 상세 제외)을 만듦"""
         daily_meals = {}
         perfect_balance_count = 0  # 완벽 밸런스 달성 일수
 
-        for meal in meals:
-            date_str = meal.timestamp.strftime("%Y-%m-%d")
-            if date_str not in daily_meals:
-                daily_meals[date_str] = {
-                    "total_calories": 0,
-                    "balance_score": 0,
-                    "meals": []
-                }
-            
-            # 식사 정보 추가
-            daily_meals[date_str]["meals"].append({
-                "type": meal.meal_type,
-                "food_name": meal.food_name,
-                "calories": float(Decimal(str(meal.calories or 0))),
-                "nutrients": {
-                    "carbohydrates": float(Decimal(str(meal.carbohydrates or 0))),
-                    "protein": float(Decimal(str(meal.protein or 0))),
-                    "fat": float(Decimal(str(meal.fat or 0)))
-                }
-            })
-            
-            # 총 칼로리 계산
-            daily_meals[date_str]["total_calories"] += float(Decimal(str(meal.calories or 0)))
-
-        # 각 날짜별 밸런스 점수 계산 및 완벽 밸런스 체크
-        for date_str, day_data in daily_meals.items():
-            # 해당 날짜의 총 영양소 계산
-            total_nutrients = {
-                "carbohydrates": sum(float(Decimal(str(meal["nutrients"]["carbohydrates"]))) for meal in day_data["meals"]),
-                "protein": sum(float(Decimal(str(meal["nutrients"]["protein"]))) for meal in day_data["meals"]),
-                "fat": sum(float(Decimal(str(meal["nutrients"]["fat"]))) for meal in day_data["meals"])
+        for row in rows:
+            daily_meals[row.local_date.strftime("%Y-%m-%d")] = {
+                "total_calories": row.total_calories,
+                "balance_score": row.balance_score or 0,
+                "meals": []
             }
             
-            # 밸런스 점수 계산
-            balance_score = self.calculate_balance_score(total_nutrients)
-            day_data["balance_score"] = balance_score
-            
             # 완벽 밸런스 체크 (90점 이상)
-            if balance_score >= 90:
+            if (row.balance_score or 0) >= 90:
                 perfect_balance_count += 1
 
         return {
@@ -235,128 +304,88 @@ class BalanceService:
             "total_days": len(daily_meals)
         }
 
+    def get_monthly_balance(self, user_id: int, year: int, month: int, include_meals: bool = True) -> dict:
+        # 일별 합계와 밸런스 점수는 롤업 테이블에서 조회
+        start, end = month_range(year, month)
+        result = self.summarize_month(self.get_daily_nutrition(user_id, start.date(), end.date()))
+        daily_meals = result["daily_meals"]
+
+        # 식사별 상세가 필요한 경우에만 필요한 컬럼만 튜플로 조회
+        if include_meals:
+            rows = self.db.query(
+                Meal.timestamp, Meal.meal_type, Meal.food_name,
+                Meal.calories, Meal.carbohydrates, Meal.protein, Meal.fat
+            ).filter(
+                Meal.user_id == user_id,
+                Meal.timestamp >= start,
+                Meal.timestamp < end
+            ).order_by(Meal.timestamp)
+            for timestamp, meal_type, food_name, calories, carbohydrates, protein, fat in rows:
+                day_data = daily_meals.get(timestamp.strftime("%Y-%m-%d"))
+                if day_data is None:
+                    continue
+                day_data["meals"].append({
+                    "type": meal_type,
+                    "food_name": food_name,
+                    "calories": float(calories or 0),
+                    "nutrients": {
+                        "carbohydrates": float(carbohydrates or 0),
+                        "protein": float(protein or 0),
+                        "fat": float(fat or 0)
+                    }
+                })
+
+        return result
+
     def get_user_stats(self, user_id: int) -> dict:
         # 현재 달의 통계 계산
         now = datetime.now()
-        start_of_month = datetime(now.year, now.month, 1)
-        end_of_month = (start_of_month + timedelta(days=32)).replace(day=1) - timedelta(days=1)
-
-        monthly_meals = self.db.query(Meal).filter(
-            and_(
-                Meal.user_id == user_id,
-                Meal.meal_date >= start_of_month,
-                Meal.meal_date <= end_of_month
-            )
-        ).all()
+        start_of_month, start_of_next_month = month_range(now.year, now.month)
+        days_in_month = (start_of_next_month - start_of_month).days
 
-        # 통계 계산
+        # 날짜별 합계 (GROUP BY 날짜) 후 일별 밸런스 점수 계산
         total_balance = 0
         total_calories = 0
         breakfast_count = 0
-        meal_counts = {}
-        water_goal_achieved = 0
-
-        for meal in monthly_meals:
-            # 밸런스 점수
-            balance_score = self.calculate_balance_score({
-                "protein": meal.protein.real,
-                "carbs": meal.carbs.real,
-                "fat": meal.fat.real,
-                "fiber": meal.fiber.real
+        for _, calories, carbohydrates, protein, fat, breakfasts, _, _ in self.get_daily_totals(user_id, start_of_month, start_of_next_month):
+            total_balance += self.calculate_balance_score({
+                "carbohydrates": carbohydrates,
+                "protein": protein,
+                "fat": fat
             })
-            total_balance += balance_score
-            
-            # 칼로리
-            total_calories += meal.calories.real
-            
-            # 아침 식사 횟수
-            if str(meal.meal_type) == "breakfast":
-                breakfast_count += 1
-            
-            # 가장 자주 먹은 음식
-            if meal.menu in meal_counts:
-                meal_counts[meal.menu] += 1
-            else:
-                meal_counts[meal.menu] = 1
-            
-            # 물 섭취 목표 달성
-            if meal.water_intake >= 2000:
-                water_goal_achieved += 1
-
-        days_in_month = (end_of_month - start_of_month).days + 1
-        meals_count = len(monthly_meals)
+            total_calories += calories
+            breakfast_count += breakfasts
 
         return {
-            "averageBalance": round(total_balance / days_in_month if days_in_month > 0 else 0, 1),
-            "averageCalories": round(total_calories / days_in_month if days_in_month > 0 else 0),
-            "waterGoalAchievement": round((water_goal_achieved / days_in_month) * 100 if days_in_month > 0 else 0),
+            "averageBalance": round(total_balance / days_in_month, 1),
+            "averageCalories": round(total_calories / days_in_month),
+            # 물 섭취량은 기록하지 않음
+            "waterGoalAchievement": None,
             "breakfastCount": breakfast_count,
-            "mostFrequentMenu": max(meal_counts.items(), key=lambda x: x[1])[0] if meal_counts else None,
+            "mostFrequentMenu": self._get_most_frequent_menu(user_id, start_of_month, start_of_next_month),
             "preferredMealTime": self._get_preferred_meal_time(user_id)
         }
 
-    def get_user_streak(self, user_id: int) -> dict:
-        # 최근 60일간의 기록 조회
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=60)
-        
-        meals = self.db.query(Meal).filter(
-            and_(
-                Meal.user_id == user_id,
-                Meal.meal_date >= start_date,
-                Meal.meal_date <= end_date
-            )
-        ).order_by(Meal.meal_date.desc()).all()
-
-        # 날짜별 식사 기록 그룹화
-        daily_records = {}
-        for meal in meals:
-            date_str = meal.meal_date.strftime("%Y-%m-%d")
-            if date_str not in daily_records:
-                daily_records[date_str] = {
-                    "meals": [],
-                    "perfect": False
-                }
-            daily_records[date_str]["meals"].append(meal)
-
-        # 완벽한 날 계산 (3끼 식사 + 물 2L 이상)
-        for date_str, record in daily_records.items():
-            meal_types = set(meal.meal_type for meal in record["meals"])
-            water_intake = sum(meal.water_intake for meal in record["meals"])
-            record["perfect"] = len(meal_types) >= 3 and water_intake >= 2000
-
-        # 현재 연속일수 계산
-        current_streak = 0
-        current_date = end_date
-        while current_date >= start_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            if date_str in daily_records and daily_records[date_str]["perfect"]:
-                current_streak += 1
-            else:
-                break
-            current_date -= timedelta(days=1)
-
-        # 최장 연속일수 계산
-        longest_streak = 0
-        current_streak_count = 0
-        perfect_days = 0
-
-        for i in range((end_date - start_date).days + 1):
-            check_date = start_date + timedelta(days=i)
-            date_str = check_date.strftime("%Y-%m-%d")
-            
-            if date_str in daily_records and daily_records[date_str]["perfect"]:
-                current_streak_count += 1
-                perfect_days += 1
-                longest_streak = max(longest_streak, current_streak_count)
-            else:
-                current_streak_count = 0
+    def _get_most_frequent_menu(self, user_id: int, start: datetime, end: datetime) -> Optional[str]:
+        """[start, end) 구간에서 가장 자주 먹은 음식 (횟수가 같으면 이름순)"""
+        row = self.db.query(
+            Meal.food_name,
+            func.count().label('count')
+        ).filter(
+            Meal.user_id == user_id,
+            Meal.timestamp >= start,
+            Meal.timestamp < end,
+            Meal.food_name.isnot(None)
+        ).group_by(
+            Meal.food_name
+        ).order_by(
+            func.count().desc(), Meal.food_name
+        ).first()
+        return row[0] if row else None
 
-        return {
-            "currentStreak": current_streak,
-            "longestStreak": longest_streak,
-            "totalPerfectDays": perfect_days
-        }
+    def get_user_streak(self, user_id: int) -> dict:
+        # 식사 변경 시 갱신해 둔 연속 기록 상태 조회
+        return StreakService(self.db).get_streak(user_id)
 
     def _generate_tags(self, meal: Meal) -> List[str]:
         tags = []
@@ -386,16 +415,18 @@ class BalanceService:
         return tags
 
     def _get_preferred_meal_time(self, user_id: int) -> str:
-        # 가장 자주 먹는 시간대 계산
+        # 가장 자주 먹는 시간대 계산 (횟수가 같으면 이른 시간)
+        hour = local_hour_expr(Meal.timestamp, self.dialect)
         meal_times = self.db.query(
-            func.date_part('hour', Meal.meal_date).label('hour'),
+            hour.label('hour'),
             func.count().label('count')
         ).filter(
-            Meal.user_id == user_id
+            Meal.user_id == user_id,
+            Meal.timestamp.isnot(None)
         ).group_by(
-            func.date_part('hour', Meal.meal_date)
+            hour
         ).order_by(
-            func.count().desc()
+            func.count().desc(), hour
         ).first()
 
         if meal_times:
@@ -409,38 +440,13 @@ class BalanceService:
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=6)  # 7일 전
         
-        # 각 날짜별 식사 기록 조회
-        daily_scores = []
-        
-        for day_offset in range(7):
-            current_date = end_date - timedelta(days=day_offset)
-            start_of_day = datetime.combine(current_date, datetime.min.time())
-            end_of_day = datetime.combine(current_date, datetime.max.time())
-            
-            # 해당 날짜의 모든 식사 조회
-            daily_meals = self.db.query(Meal).filter(
-                Meal.user_id == user_id,
-                Meal.timestamp >= start_of_day,
-                Meal.timestamp <= end_of_day
-            ).all()
-            
-            if daily_meals:
-                # 일일 총 영양소 계산
-                daily_nutrients = {
-                    'carbohydrates': sum(Decimal(str(meal.carbohydrates or 0)) for meal in daily_meals),
-                    'protein': sum(Decimal(str(meal.protein or 0)) for meal in daily_meals),
-                    'fat': sum(Decimal(str(meal.fat or 0)) for meal in daily_meals)
-                }
-                
-                # float로 변환
-                daily_nutrients = {k: float(v) for k, v in daily_nutrients.items()}
-                
-                # 일일 밸런스 점수 계산
-                daily_score = self.calculate_balance_score(daily_nutrients)
-                if daily_score is not None:
-                    daily_scores.append(daily_score)
+        return self.average_score(self.get_daily_nutrition(user_id, start_date, end_date + timedelta(days=1)))
+
+    def average_score(self, rows: List[DailyNutrition]) -> float:
+        """롤업 행들의 평균 밸런스 점수 (식사 기록이 있는 날의 행만 존재)"""
+        daily_scores = [row.balance_score or 0 for row in rows]
         
         # 평균 점수 계산
         if daily_scores:
             return sum(daily_scores) / len(daily_scores)
-        return 0  # 데이터가 없는 경우 0 반환 
\ No newline at end of file
+        return 0  # 데이터가 없는 경우 0 반환
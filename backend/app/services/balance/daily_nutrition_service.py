@@ -0,0 +1,186 @@
+from datetime import date, datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import logging
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from app.models.balance import DailyNutrition, Meal, KST
+from app.services.balance.balance_service import BalanceService
+from app.services.balance.streak_service import StreakService, is_perfect_day
+
+logger = logging.getLogger(__name__)
+
+NUTRIENT_COLUMNS = {
+    'calories': 'total_calories',
+    'carbohydrates': 'total_carbohydrates',
+    'protein': 'total_protein',
+    'fat': 'total_fat'
+}
+MEAL_COUNT_COLUMNS = {
+    'breakfast': 'breakfast_count',
+    'lunch': 'lunch_count',
+    'dinner': 'dinner_count'
+}
+
+def local_date_of(timestamp: datetime) -> date:
+    """식사 시각의 한국 시간 기준 날짜 (DB에서 읽은 값은 이미 한국 시간 naive datetime)"""
+    if timestamp.tzinfo is not None:
+        return timestamp.astimezone(KST).date()
+    return timestamp.date()
+
+class MealContribution(NamedTuple):
+    """한 끼가 일별 합계에 더하는 값"""
+    user_id: int
+    local_date: date
+    meal_type: str
+    calories: float
+    carbohydrates: float
+    protein: float
+    fat: float
+
+    @classmethod
+    def of(cls, meal: Meal) -> 'MealContribution':
+        meal_type = meal.meal_type.value if hasattr(meal.meal_type, 'value') else str(meal.meal_type)
+        return cls(
+            user_id=meal.user_id,
+            local_date=local_date_of(meal.timestamp),
+            meal_type=meal_type,
+            calories=float(meal.calories or 0),
+            carbohydrates=float(meal.carbohydrates or 0),
+            protein=float(meal.protein or 0),
+            fat=float(meal.fat or 0)
+        )
+
+    def deltas(self, sign: int) -> Dict[str, float]:
+        values = {column: sign * getattr(self, field) for field, column in NUTRIENT_COLUMNS.items()}
+        for meal_type, column in MEAL_COUNT_COLUMNS.items():
+            values[column] = sign if meal_type == self.meal_type else 0
+        return values
+
+class DailyNutritionService:
+    """daily_nutrition 롤업 테이블 갱신 및 재계산
+
+    식사 변경 시 호출한 쪽의 세션에서 증감만 반영하고 커밋은 호출한 쪽에서 함께 수행합니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.balance_service = BalanceService(db)
+        self.streak_service = StreakService(db)
+
+    def add_meal(self, meal: Meal):
+        self._apply(MealContribution.of(meal), 1)
+
+    def add_meals(self, contributions: List[MealContribution]):
+        """여러 끼를 한 번에 반영 (같은 날짜는 합산해 한 번만 갱신)"""
+        for (user_id, local_date), deltas in sum_deltas(contributions).items():
+            self._apply_deltas(user_id, local_date, deltas)
+
+    def remove_meal(self, contribution: MealContribution):
+        self._apply(contribution, -1)
+
+    def replace_meal(self, before: MealContribution, meal: Meal):
+        """수정 전 기여분을 빼고 수정 후 기여분을 더함 (날짜가 바뀐 경우 두 날짜 모두 갱신)"""
+        self._apply(before, -1)
+        self._apply(MealContribution.of(meal), 1)
+
+    def _apply(self, contribution: MealContribution, sign: int):
+        self._apply_deltas(contribution.user_id, contribution.local_date, contribution.deltas(sign))
+
+    def _apply_deltas(self, user_id: int, local_date: date, deltas: Dict[str, float]):
+        was_perfect = is_perfect_day(self._get_row(user_id, local_date))
+        self._increment(user_id, local_date, deltas)
+        row = self._refresh_score(user_id, local_date)
+        self.streak_service.on_day_changed(user_id, local_date, was_perfect, is_perfect_day(row))
+
+    def _get_row(self, user_id: int, local_date: date) -> Optional[DailyNutrition]:
+        return self.db.query(DailyNutrition).filter(
+            DailyNutrition.user_id == user_id,
+            DailyNutrition.local_date == local_date
+        ).populate_existing().first()
+
+    def _increment(self, user_id: int, local_date: date, deltas: Dict[str, float]):
+        """(user_id, local_date) 행에 증감분을 원자적으로 더함 (행이 없으면 생성)"""
+        dialect = self.db.get_bind().dialect.name
+        if dialect in ('sqlite', 'postgresql'):
+            insert = sqlite_insert if dialect == 'sqlite' else postgresql_insert
+            stmt = insert(DailyNutrition).values(user_id=user_id, local_date=local_date, **deltas)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['user_id', 'local_date'],
+                set_={column: getattr(DailyNutrition, column) + stmt.excluded[column] for column in deltas}
+            )
+            self.db.execute(stmt)
+            return
+
+        row = self.db.query(DailyNutrition).filter(
+            DailyNutrition.user_id == user_id,
+            DailyNutrition.local_date == local_date
+        ).with_for_update().first()
+        if row is None:
+            self.db.add(DailyNutrition(user_id=user_id, local_date=local_date, **deltas))
+        else:
+            for column, delta in deltas.items():
+                setattr(row, column, getattr(row, column) + delta)
+        self.db.flush()
+
+    def _refresh_score(self, user_id: int, local_date: date) -> Optional[DailyNutrition]:
+        """합계가 바뀐 날의 밸런스 점수를 다시 계산하고, 식사가 남지 않은 날은 행을 삭제"""
+        row = self._get_row(user_id, local_date)
+        if row is None:
+            return None
+        if sum(getattr(row, column) for column in MEAL_COUNT_COLUMNS.values()) <= 0:
+            self.db.delete(row)
+            row = None
+        else:
+            row.balance_score = self.balance_service.calculate_balance_score(nutrients_of(row))
+        self.db.flush()
+        return row
+
+    def backfill(self, user_id: Optional[int] = None, batch_size: int = 1000) -> int:
+        """meals 원본으로부터 롤업을 다시 만듦 (user_id가 없으면 전체 사용자). 생성한 행 수를 반환"""
+        rows = self.db.query(DailyNutrition)
+        meals = self.db.query(Meal)
+        if user_id is not None:
+            rows = rows.filter(DailyNutrition.user_id == user_id)
+            meals = meals.filter(Meal.user_id == user_id)
+        rows.delete(synchronize_session='fetch')
+
+        totals = sum_deltas(
+            MealContribution.of(meal)
+            for meal in meals.order_by(Meal.user_id, Meal.timestamp).yield_per(batch_size)
+            if meal.timestamp is not None
+        )
+
+        new_rows: List[DailyNutrition] = []
+        for (row_user_id, local_date), values in totals.items():
+            row = DailyNutrition(user_id=row_user_id, local_date=local_date, **values)
+            row.balance_score = self.balance_service.calculate_balance_score(nutrients_of(row))
+            new_rows.append(row)
+        self.db.add_all(new_rows)
+        self.db.flush()
+
+        # 롤업이 바뀌었으므로 연속 기록도 다시 계산
+        if user_id is not None:
+            self.streak_service.recompute(user_id)
+        else:
+            self.streak_service.recompute_all()
+        logger.info(f"일별 영양 합계 재생성: {len(new_rows)}일 (사용자: {user_id if user_id is not None else '전체'})")
+        return len(new_rows)
+
+def sum_deltas(contributions: Iterable[MealContribution]) -> Dict[Tuple[int, date], Dict[str, float]]:
+    """(user_id, local_date)별로 기여분 합산"""
+    totals: Dict[Tuple[int, date], Dict[str, float]] = {}
+    for contribution in contributions:
+        day = totals.setdefault((contribution.user_id, contribution.local_date),
+                                dict.fromkeys(list(NUTRIENT_COLUMNS.values()) + list(MEAL_COUNT_COLUMNS.values()), 0))
+        for column, delta in contribution.deltas(1).items():
+            day[column] += delta
+    return totals
+
+def nutrients_of(row: DailyNutrition) -> Dict[str, float]:
+    """롤업 행의 탄수화물/단백질/지방 합계 (calculate_balance_score 입력 형식)"""
+    return {
+        'carbohydrates': float(row.total_carbohydrates or 0),
+        'protein': float(row.total_protein or 0),
+        'fat': float(row.total_fat or 0)
+    }
@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+import logging
+from sqlalchemy.orm import Session
+from app.models.balance import DailyNutrition, Meal
+from app.services.balance.balance_service import BalanceService, day_range, month_range
+from app.services.balance.daily_nutrition_service import nutrients_of
+
+logger = logging.getLogger(__name__)
+
+# /dashboard에서 고를 수 있는 항목 (fields 미지정 시 전체)
+DASHBOARD_FIELDS = ("profile", "stats", "meals", "weekly_score", "monthly", "days_since_joined")
+
+def stats_payload(balance_service: BalanceService, row: Optional[DailyNutrition], daily_calorie_goal: Optional[int]) -> dict:
+    """오늘의 롤업 행으로 /stats 응답을 만듦"""
+    if not row:
+        return {
+            "balance_score": None,
+            "total_calories": None,
+            "daily_calorie_goal": daily_calorie_goal,
+            "highlight": "",
+            "needs_improvement": "",
+            "nutrients": {
+                'carbohydrates': None,
+                'protein': None,
+                'fat': None
+            }
+        }
+
+    total_nutrients = nutrients_of(row)
+    # 영양소 분석 (밸런스 점수는 식사 변경 시 계산해 둔 값 사용)
+    nutrient_analysis = balance_service.analyze_nutrients(total_nutrients)
+    return {
+        "balance_score": row.balance_score,
+        "total_calories": row.total_calories,
+        "daily_calorie_goal": daily_calorie_goal,
+        "highlight": nutrient_analysis["highlight"],
+        "needs_improvement": nutrient_analysis["needsImprovement"],
+        "nutrients": total_nutrients
+    }
+
+def group_meals(meals: Iterable[Meal]) -> Dict[str, List[dict]]:
+    """식사 기록을 /meals 응답 형식으로 식사 타입별 그룹화"""
+    meal_groups = {
+        'breakfast': [],
+        'lunch': [],
+        'dinner': []
+    }
+
+    for meal in meals:
+        meal_type = meal.meal_type.lower()
+        if meal_type in meal_groups:
+            meal_groups[meal_type].append({
+                'id': meal.id,
+                'name': meal.food_name or '식사',
+                'calories': float(str(meal.calories or 0)),
+                'nutrients': {
+                    'carbohydrates': float(str(meal.carbohydrates or 0)),
+                    'protein': float(str(meal.protein or 0)),
+                    'fat': float(str(meal.fat or 0))
+                },
+                'timestamp': meal.timestamp.isoformat() if meal.timestamp else None
+            })
+
+    return meal_groups
+
+def days_since_joined(created_at: Optional[datetime], now: datetime) -> int:
+    if not created_at:
+        return 0
+    return max(1, (now - created_at).days)  # 최소 1일로 표시
+
+class DashboardService:
+    """프로필/메인 화면에 필요한 항목을 한 세션에서 모아 계산
+
+    오늘 통계, 주간 점수, 이번 달 요약은 모두 daily_nutrition 롤업의 한 번의 범위 조회로 만들고,
+    오늘의 식사 목록이 필요한 경우에만 meals를 한 번 더 조회합니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.balance_service = BalanceService(db)
+
+    def build(self, user, fields: Iterable[str], now: Optional[datetime] = None) -> dict:
+        """user는 id, email, name, daily_calorie_goal, created_at을 가진 인증 사용자"""
+        fields = set(fields)
+        now = now or datetime.now()
+        today = now.date()
+        result = {}
+
+        if "profile" in fields:
+            result["profile"] = {
+                "id": user.id,
+                "email": user.email,
+                "name": user.name,
+                "created_at": user.created_at
+            }
+        if "days_since_joined" in fields:
+            result["days_since_joined"] = days_since_joined(user.created_at, now)
+
+        if fields & {"stats", "weekly_score", "monthly"}:
+            month_start, month_end = month_range(today.year, today.month)
+            week_start = today - timedelta(days=6)
+            rows = self.balance_service.get_daily_nutrition(
+                user.id, min(week_start, month_start.date()), month_end.date()
+            )
+            if "stats" in fields:
+                today_row = next((row for row in rows if row.local_date == today), None)
+                result["stats"] = stats_payload(self.balance_service, today_row, user.daily_calorie_goal)
+            if "weekly_score" in fields:
+                week = [row for row in rows if week_start <= row.local_date <= today]
+                result["weekly_score"] = round(self.balance_service.average_score(week), 1)
+            if "monthly" in fields:
+                month = [row for row in rows if row.local_date >= month_start.date()]
+                result["monthly"] = self.balance_service.summarize_month(month)
+
+        if "meals" in fields:
+            result["meals"] = group_meals(self.balance_service.get_meals_between(user.id, *day_range(today)))
+
+        return result
+
+def parse_fields(fields: Optional[str]) -> List[str]:
+    """쉼표로 구분한 fields 값을 검증 (없으면 전체). 알 수 없는 항목은 ValueError"""
+    if not fields:
+        return list(DASHBOARD_FIELDS)
+    selected = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in selected if field not in DASHBOARD_FIELDS]
+    if unknown:
+        raise ValueError(f"알 수 없는 항목: {', '.join(unknown)} (사용 가능: {', '.join(DASHBOARD_FIELDS)})")
+    return selected
@@ -0,0 +1,98 @@
+import csv
+import io
+import json
+import logging
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.balance import Meal
+
+logger = logging.getLogger(__name__)
+
+EXPORT_COLUMNS = ("id", "user_id", "meal_type", "food_name", "timestamp", "calories", "carbohydrates", "protein", "fat")
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8"
+}
+
+def iter_meal_rows(db: Session, user_id: Optional[int] = None, user_id_start: Optional[int] = None,
+                   user_id_end: Optional[int] = None, batch_size: int = 1000) -> Iterator[tuple]:
+    """식사 기록을 (user_id, timestamp, id) 순서의 컬럼 튜플로 batch_size씩 읽어 반환
+
+    ORM 객체를 만들지 않고 서버 측 커서(stream_results, PostgreSQL은 named cursor)로 읽으므로
+    전체 기록 수와 관계없이 메모리 사용량이 일정합니다.
+    """
+    query = db.query(*[getattr(Meal, column) for column in EXPORT_COLUMNS])
+    if user_id is not None:
+        query = query.filter(Meal.user_id == user_id)
+    if user_id_start is not None:
+        query = query.filter(Meal.user_id >= user_id_start)
+    if user_id_end is not None:
+        query = query.filter(Meal.user_id < user_id_end)
+    query = query.order_by(Meal.user_id, Meal.timestamp, Meal.id)
+    return iter(query.execution_options(stream_results=True).yield_per(batch_size))
+
+def _record(row: tuple) -> dict:
+    record = dict(zip(EXPORT_COLUMNS, row))
+    record["meal_type"] = record["meal_type"].value if hasattr(record["meal_type"], "value") else record["meal_type"]
+    record["timestamp"] = record["timestamp"].isoformat() if record["timestamp"] else None
+    return record
+
+def _chunked(rows: Iterable[tuple], write: Callable[[tuple], str], chunk_rows: int) -> Iterator[bytes]:
+    """행을 chunk_rows개씩 묶어 한 번에 전송 (행마다 전송하면 쓰기 호출이 너무 많아짐)"""
+    lines: List[str] = []
+    for row in rows:
+        lines.append(write(row))
+        if len(lines) >= chunk_rows:
+            yield "".join(lines).encode("utf-8")
+            lines.clear()
+    if lines:
+        yield "".join(lines).encode("utf-8")
+
+def format_ndjson(rows: Iterable[tuple], chunk_rows: int = 500) -> Iterator[bytes]:
+    return _chunked(rows, lambda row: json.dumps(_record(row), ensure_ascii=False) + "\n", chunk_rows)
+
+def format_csv(rows: Iterable[tuple], chunk_rows: int = 500) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def write(row: tuple) -> str:
+        record = _record(row)
+        writer.writerow([record[column] for column in EXPORT_COLUMNS])
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+    yield ("\ufeff" + ",".join(EXPORT_COLUMNS) + "\r\n").encode("utf-8")
+    yield from _chunked(rows, write, chunk_rows)
+
+def stream_export(session_factory: Callable[[], Session], fmt: str, **filters) -> Iterator[bytes]:
+    """전용 세션을 열어 식사 기록을 fmt 형식으로 스트리밍 (전송이 끝나거나 중단되면 세션을 닫음)
+
+    응답 본문은 요청 의존성(get_db)이 정리된 뒤에도 전송될 수 있으므로 별도 세션을 사용합니다.
+    """
+    db = session_factory()
+    count = 0
+    try:
+        rows = iter_meal_rows(db, **filters)
+
+        def counted() -> Iterator[tuple]:
+            nonlocal count
+            for row in rows:
+                count += 1
+                yield row
+
+        formatter = format_ndjson if fmt == "ndjson" else format_csv
+        yield from formatter(counted())
+    finally:
+        db.close()
+        logger.info(f"식사 기록 내보내기: {count}건 ({fmt}, 조건: {filters})")
+
+def user_id_shards(db: Session, shard_size: int) -> List[Tuple[int, int]]:
+    """전체 사용자 ID 범위를 shard_size 크기의 [start, end) 구간으로 나눔"""
+    low, high = db.query(func.min(Meal.user_id), func.max(Meal.user_id)).one()
+    if low is None:
+        return []
+    return [(start, min(start + shard_size, high + 1)) for start in range(low, high + 1, shard_size)]
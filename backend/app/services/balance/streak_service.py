@@ -0,0 +1,114 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+import logging
+from sqlalchemy.orm import Session
+from app.models.balance import DailyNutrition, UserStreak
+
+logger = logging.getLogger(__name__)
+
+def is_perfect_day(row: Optional[DailyNutrition]) -> bool:
+    """아침/점심/저녁을 모두 기록한 날 (물 섭취량은 기록하지 않으므로 제외)"""
+    if row is None:
+        return False
+    return row.breakfast_count > 0 and row.lunch_count > 0 and row.dinner_count > 0
+
+def compute_streak(perfect_days: List[date]) -> Dict[str, object]:
+    """정렬된 완벽한 날 목록으로부터 연속 기록 상태 계산"""
+    current = longest = 0
+    previous = None
+    for day in perfect_days:
+        current = current + 1 if previous is not None and day == previous + timedelta(days=1) else 1
+        longest = max(longest, current)
+        previous = day
+    return {
+        "current_streak": current,
+        "longest_streak": longest,
+        "last_perfect_date": previous,
+        "total_perfect_days": len(perfect_days)
+    }
+
+class StreakService:
+    """user_streaks 상태 갱신
+
+    날짜별 롤업이 바뀔 때 on_day_changed로 증분 갱신하고, 과거 날짜가 바뀌어
+    연속 구간이 끊기거나 이어질 수 있는 경우에만 롤업으로부터 다시 계산합니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _get_state(self, user_id: int) -> UserStreak:
+        state = self.db.query(UserStreak).filter(
+            UserStreak.user_id == user_id
+        ).with_for_update().populate_existing().first()
+        if state is None:
+            state = UserStreak(user_id=user_id, current_streak=0, longest_streak=0,
+                               last_perfect_date=None, total_perfect_days=0)
+            self.db.add(state)
+        return state
+
+    def on_day_changed(self, user_id: int, day: date, was_perfect: bool, is_perfect: bool):
+        if was_perfect == is_perfect:
+            return
+        state = self._get_state(user_id)
+        last = state.last_perfect_date
+        if is_perfect and (last is None or day > last):
+            # 가장 최근 완벽한 날 이후의 날이 완벽해진 경우 (일반적인 경우)
+            state.current_streak = state.current_streak + 1 if last == day - timedelta(days=1) else 1
+            state.longest_streak = max(state.longest_streak, state.current_streak)
+            state.last_perfect_date = day
+            state.total_perfect_days += 1
+            self.db.flush()
+        else:
+            # 과거 날짜가 완벽해지거나, 완벽했던 날이 깨진 경우 구간이 합쳐지거나 나뉠 수 있음
+            self.recompute(user_id)
+
+    def perfect_days(self, user_id: int) -> List[date]:
+        rows = self.db.query(DailyNutrition.local_date).filter(
+            DailyNutrition.user_id == user_id,
+            DailyNutrition.breakfast_count > 0,
+            DailyNutrition.lunch_count > 0,
+            DailyNutrition.dinner_count > 0
+        ).order_by(DailyNutrition.local_date).all()
+        return [row[0] for row in rows]
+
+    def recompute(self, user_id: int) -> UserStreak:
+        state = self._get_state(user_id)
+        for field, value in compute_streak(self.perfect_days(user_id)).items():
+            setattr(state, field, value)
+        self.db.flush()
+        return state
+
+    def recompute_all(self) -> int:
+        # 롤업이 없어진 사용자도 0으로 초기화
+        user_ids = {row[0] for row in self.db.query(DailyNutrition.user_id).distinct()}
+        user_ids |= {row[0] for row in self.db.query(UserStreak.user_id)}
+        for user_id in sorted(user_ids):
+            self.recompute(user_id)
+        logger.info(f"연속 기록 재계산: 사용자 {len(user_ids)}명")
+        return len(user_ids)
+
+    def find_mismatches(self) -> List[Dict[str, object]]:
+        """저장된 상태와 롤업으로부터 다시 계산한 상태가 다른 사용자 목록 (수정하지 않음)"""
+        stored = {state.user_id: state for state in self.db.query(UserStreak)}
+        user_ids = set(stored) | {row[0] for row in self.db.query(DailyNutrition.user_id).distinct()}
+        mismatches = []
+        for user_id in sorted(user_ids):
+            expected = compute_streak(self.perfect_days(user_id))
+            state = stored.get(user_id)
+            actual = {field: getattr(state, field) for field in expected} if state else compute_streak([])
+            if actual != expected:
+                mismatches.append({"user_id": user_id, "stored": actual, "expected": expected})
+        return mismatches
+
+    def get_streak(self, user_id: int, today: Optional[date] = None) -> dict:
+        """연속 기록 조회. 현재 연속일수는 오늘이 완벽한 날일 때만 유효"""
+        today = today or datetime.now().date()
+        state = self.db.query(UserStreak).filter(UserStreak.user_id == user_id).first()
+        if state is None:
+            return {"currentStreak": 0, "longestStreak": 0, "totalPerfectDays": 0}
+        return {
+            "currentStreak": state.current_streak if state.last_perfect_date == today else 0,
+            "longestStreak": state.longest_streak,
+            "totalPerfectDays": state.total_perfect_days
+        }
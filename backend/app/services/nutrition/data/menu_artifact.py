@@ -0,0 +1,311 @@
+import os
+import sys
+import json
+import mmap
+import time
+import struct
+import hashlib
+import logging
+from array import array
+from collections.abc import Set as AbstractSet
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 메뉴 사전 바이너리 아티팩트 포맷
+# [헤더: magic(8) | 포맷 버전(u32) | 메타 길이(u32)] [메타 JSON] [섹션들 (8바이트 정렬)]
+# 모든 정수 배열은 little-endian (u32, 바이그램 키는 u64)
+# 파일 전체가 읽기 전용 mmap이므로 같은 파일을 여는 모든 워커가 페이지 캐시를 공유함
+MAGIC = b"MENUDICT"
+FORMAT_VERSION = 2
+ARTIFACT_FILENAME = "menu_dict.bin"
+
+_HEADER = struct.Struct("<8sII")
+_ALIGN = 8
+
+
+def artifact_path_for(csv_path: str) -> str:
+    """CSV 경로에 대응하는 아티팩트 경로를 반환"""
+    return os.path.join(os.path.dirname(os.path.abspath(csv_path)), ARTIFACT_FILENAME)
+
+
+def jamo_key(text: str) -> str:
+    """매칭용 자모 분리 형태 (OCRService._decompose_hangul 결과의 문자열 표현과 동일)"""
+    import hgtk
+    return str([hgtk.text.decompose(char) if hgtk.checker.is_hangul(char) else char for char in text])
+
+
+def bigram_keys(text: str) -> List[int]:
+    """공백을 제외한 문자 바이그램을 정수 키로 변환 (중복 제거, 한 글자는 단독 키)"""
+    chars = [c for c in text if not c.isspace()]
+    if len(chars) == 1:
+        return [ord(chars[0]) << 21]
+    return sorted({(ord(a) << 21) | ord(b) for a, b in zip(chars, chars[1:])})
+
+
+def _int_array(typecode: str, size: int, values: Iterable[int]) -> array:
+    arr = array(typecode, values)
+    if arr.itemsize != size:
+        raise ValueError(f"{size * 8}비트 정수 배열을 지원하지 않는 플랫폼입니다")
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr
+
+
+def _u32_array(values: Iterable[int]) -> array:
+    return _int_array("I", 4, values)
+
+
+def _u64_array(values: Iterable[int]) -> array:
+    return _int_array("Q", 8, values)
+
+
+def _bigram_index(names: List[str]) -> Tuple[bytes, bytes, bytes, bytes]:
+    """바이그램 역색인을 (정렬된 키, 포스팅 오프셋, 포스팅 id, 메뉴별 바이그램 수) 배열로 직렬화"""
+    postings: Dict[int, List[int]] = {}
+    gram_counts = []
+    for i, name in enumerate(names):
+        keys = bigram_keys(name)
+        gram_counts.append(len(keys))
+        for key in keys:
+            postings.setdefault(key, []).append(i)
+
+    sorted_keys = sorted(postings)
+    offsets = [0]
+    ids: List[int] = []
+    for key in sorted_keys:
+        ids.extend(postings[key])
+        offsets.append(len(ids))
+    return (
+        _u64_array(sorted_keys).tobytes(),
+        _u32_array(offsets).tobytes(),
+        _u32_array(ids).tobytes(),
+        _u32_array(gram_counts).tobytes(),
+    )
+
+
+def _string_table(strings: List[str]) -> Tuple[bytes, bytes]:
+    """문자열 목록을 (offsets, UTF-8 blob) 으로 직렬화"""
+    offsets = [0]
+    chunks = []
+    total = 0
+    for s in strings:
+        encoded = s.encode("utf-8")
+        chunks.append(encoded)
+        total += len(encoded)
+        offsets.append(total)
+    return _u32_array(offsets).tobytes(), b"".join(chunks)
+
+
+def _source_info(csv_path: Optional[str]) -> Optional[Dict]:
+    if not csv_path or not os.path.exists(csv_path):
+        return None
+    stat = os.stat(csv_path)
+    return {"path": os.path.abspath(csv_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def build_menu_artifact(menus: Iterable[str], basic_menus: Iterable[str], out_path: str,
+                        csv_path: Optional[str] = None) -> str:
+    """메뉴 목록으로 바이너리 아티팩트를 생성하고 버전 문자열을 반환"""
+    basic = set(basic_menus)
+    # UTF-8 바이트 순으로 정렬해야 mmap 상에서 이진 탐색 가능
+    names = sorted(set(menus) | basic, key=lambda s: s.encode("utf-8"))
+    index = {name: i for i, name in enumerate(names)}
+
+    menu_offsets, menu_blob = _string_table(names)
+    jamo_offsets, jamo_blob = _string_table([jamo_key(name) for name in names])
+    basic_ids = _u32_array(sorted(index[name] for name in basic)).tobytes()
+    gram_keys, gram_offsets, gram_ids, gram_counts = _bigram_index(names)
+
+    version = hashlib.sha1(menu_blob).hexdigest()[:12]
+    sections = [
+        ("menus.offsets", menu_offsets),
+        ("menus.blob", menu_blob),
+        ("jamo.offsets", jamo_offsets),
+        ("jamo.blob", jamo_blob),
+        ("basic.ids", basic_ids),
+        ("grams.keys", gram_keys),
+        ("grams.offsets", gram_offsets),
+        ("grams.ids", gram_ids),
+        ("grams.counts", gram_counts),
+    ]
+
+    # 섹션 위치는 메타 블록 뒤 데이터 영역 기준의 상대 오프셋
+    layout = {}
+    offset = 0
+    for name, data in sections:
+        layout[name] = [offset, len(data)]
+        offset = _pad(offset + len(data))
+    meta = {
+        "version": version,
+        "built_at": int(time.time()),
+        "count": len(names),
+        "basic_count": len(basic),
+        "source": _source_info(csv_path),
+        "sections": layout,
+    }
+    meta_bytes = json.dumps(meta, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    data_start = _pad(_HEADER.size + len(meta_bytes))
+
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(meta_bytes)))
+        f.write(meta_bytes)
+        for name, data in sections:
+            f.seek(data_start + layout[name][0])
+            f.write(data)
+        f.truncate(_pad(f.tell()))
+    # 다른 워커가 읽는 중이어도 안전하도록 원자적으로 교체
+    os.replace(tmp_path, out_path)
+    logger.info(f"메뉴 사전 아티팩트 생성 완료: {out_path} (버전: {version}, {len(names)}개)")
+    return version
+
+
+def _pad(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def read_artifact_meta(path: str) -> Dict:
+    """아티팩트 헤더와 메타 정보만 읽음 (data_start 포함)"""
+    with open(path, "rb") as f:
+        magic, fmt, meta_len = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"메뉴 사전 아티팩트가 아닙니다: {path}")
+        if fmt != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 아티팩트 포맷 버전: {fmt}")
+        meta = json.loads(f.read(meta_len).decode("utf-8"))
+    meta["data_start"] = _pad(_HEADER.size + meta_len)
+    return meta
+
+
+def is_artifact_fresh(path: str, csv_path: Optional[str]) -> bool:
+    """아티팩트가 존재하고 원본 CSV와 일치하는지 확인 (CSV가 없으면 아티팩트를 그대로 사용)"""
+    if not os.path.exists(path):
+        return False
+    try:
+        meta = read_artifact_meta(path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"메뉴 사전 아티팩트 메타 읽기 실패: {str(e)}")
+        return False
+    current = _source_info(csv_path)
+    if current is None:
+        return True
+    source = meta.get("source") or {}
+    return source.get("size") == current["size"] and source.get("mtime_ns") == current["mtime_ns"]
+
+
+class MenuTable(AbstractSet):
+    """mmap 기반 읽기 전용 메뉴 집합 (정렬된 문자열 테이블 + 오프셋 + 바이그램 색인)
+
+    Python 객체를 만들지 않고 파일 페이지를 직접 읽으므로 워커 수가 늘어도
+    메뉴 사전과 색인의 메모리는 OS 페이지 캐시에 한 벌만 존재함.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.meta = read_artifact_meta(path)
+        self.version: str = self.meta["version"]
+        self._count: int = self.meta["count"]
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._menu_offsets = self._u32_section("menus.offsets")
+        self._menu_base = self._section_start("menus.blob")
+        self._jamo_offsets = self._u32_section("jamo.offsets")
+        self._jamo_base = self._section_start("jamo.blob")
+        self._basic_ids = self._u32_section("basic.ids")
+        self._gram_keys = self._int_section("grams.keys", "Q")
+        self._gram_offsets = self._u32_section("grams.offsets")
+        self._gram_ids = self._u32_section("grams.ids")
+        self._gram_counts = self._u32_section("grams.counts")
+        self._basic_menus: Optional[FrozenSet[str]] = None
+
+    def _section_start(self, name: str) -> int:
+        return self.meta["data_start"] + self.meta["sections"][name][0]
+
+    def _int_section(self, name: str, typecode: str):
+        offset = self._section_start(name)
+        length = self.meta["sections"][name][1]
+        view = memoryview(self._mm)[offset:offset + length]
+        if sys.byteorder == "little":
+            return view.cast(typecode)
+        # big-endian 플랫폼에서는 복사 후 변환
+        arr = array(typecode, view.tobytes())
+        arr.byteswap()
+        return arr
+
+    def _u32_section(self, name: str):
+        return self._int_section(name, "I")
+
+    def _menu_bytes(self, i: int) -> bytes:
+        return self._mm[self._menu_base + self._menu_offsets[i]:self._menu_base + self._menu_offsets[i + 1]]
+
+    @classmethod
+    def _from_iterable(cls, it):
+        # 집합 연산 결과는 일반 set으로 반환
+        return set(it)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> str:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return self._menu_bytes(i).decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._menu_bytes(i).decode("utf-8")
+
+    def __contains__(self, item) -> bool:
+        return isinstance(item, str) and self.index(item) >= 0
+
+    def index(self, menu: str) -> int:
+        """메뉴의 id를 이진 탐색으로 찾음 (없으면 -1)"""
+        key = menu.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._menu_bytes(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._menu_bytes(lo) == key:
+            return lo
+        return -1
+
+    def jamo(self, i: int) -> str:
+        """i번째 메뉴의 미리 계산된 자모 분리 형태"""
+        start = self._jamo_base + self._jamo_offsets[i]
+        end = self._jamo_base + self._jamo_offsets[i + 1]
+        return self._mm[start:end].decode("utf-8")
+
+    def items_with_jamo(self) -> Iterator[Tuple[str, str]]:
+        for i in range(self._count):
+            yield self[i], self.jamo(i)
+
+    def postings(self, key: int):
+        """바이그램 키를 포함하는 메뉴 id 목록 (없으면 빈 시퀀스)"""
+        keys = self._gram_keys
+        lo, hi = 0, len(keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if keys[mid] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(keys) and keys[lo] == key:
+            return self._gram_ids[self._gram_offsets[lo]:self._gram_offsets[lo + 1]]
+        return ()
+
+    def gram_count(self, i: int) -> int:
+        """i번째 메뉴의 서로 다른 바이그램 수"""
+        return self._gram_counts[i]
+
+    @property
+    def basic_menus(self) -> FrozenSet[str]:
+        if self._basic_menus is None:
+            self._basic_menus = frozenset(self[i] for i in self._basic_ids)
+        return self._basic_menus
+
+    def __repr__(self) -> str:
+        return f"MenuTable(path={self.path!r}, version={self.version!r}, count={self._count})"
@@ -1,12 +1,33 @@
-import pandas as pd
+import os
 import logging
+import argparse
 from typing import Dict, List, Set
+from app.services.nutrition.keyword_matcher import KeywordMatcher
+from app.services.nutrition.data.menu_artifact import (
+    MenuTable, artifact_path_for, build_menu_artifact, is_artifact_fresh
+)
 
 logger = logging.getLogger(__name__)
 
 class MenuDictGenerator:
     _instance = None
     _menu_dict = None
+    _basic_matcher = None
+
+    # 기본 메뉴명 패턴
+    BASIC_MENU_PATTERNS = [
+        # 한식
+        "비빔밥", "김치찌개", "된장찌개", "갈비탕", "만두국", "육회비빔밥",
+        "제육덮밥", "오징어볶음", "돼지김치찌개", "참치순두부찌개", "부대찌개",
+        "골뱅이비빔면", "라면", "라면사리",
+        
+        # 일반 메뉴
+        "돈까스", "치킨가라아게", "소세지", "피자", "햄버거", "샌드위치",
+        "불고기", "닭볶음탕", "해물탕", "감자튀김", "치킨", "스테이크", "파스타",
+        
+        # 기본 메뉴 구성요소
+        "비빔", "덮밥", "볶음", "찌개", "탕", "국", "밥", "면"
+    ]
     
     def __new__(cls):
         if cls._instance is None:
@@ -21,20 +42,54 @@ class MenuDictGenerator:
     def get_menu_dict(self, csv_path: str) -> Set[str]:
         """메뉴 목록을 가져옴 (없으면 생성)"""
         if self._menu_dict is None:
-            self._menu_dict = self._generate_menu_dict(csv_path)
+            self._menu_dict = self.load_menu_dict(csv_path)
         return self._menu_dict
-    
+
+    def load_menu_dict(self, csv_path: str) -> Set[str]:
+        """미리 빌드된 아티팩트를 mmap으로 로드 (없거나 오래되면 CSV로 재빌드)"""
+        artifact_path = artifact_path_for(csv_path)
+        if not is_artifact_fresh(artifact_path, csv_path):
+            if not os.path.exists(csv_path):
+                return self._generate_menu_dict(csv_path)
+            try:
+                self.build_artifact(csv_path, artifact_path)
+            except Exception as e:
+                logger.warning(f"메뉴 사전 아티팩트 빌드 실패, CSV에서 직접 생성: {str(e)}")
+                return self._generate_menu_dict(csv_path)
+
+        try:
+            menu_table = MenuTable(artifact_path)
+            logger.info(f"메뉴 사전 아티팩트 로드 완료: {len(menu_table)}개 (버전: {menu_table.version})")
+            return menu_table
+        except (OSError, ValueError) as e:
+            logger.warning(f"메뉴 사전 아티팩트 로드 실패, CSV에서 직접 생성: {str(e)}")
+            return self._generate_menu_dict(csv_path)
+
+    def build_artifact(self, csv_path: str, artifact_path: str = None) -> str:
+        """CSV에서 메뉴 사전 아티팩트를 빌드하고 버전을 반환"""
+        artifact_path = artifact_path or artifact_path_for(csv_path)
+        menu_set = self._read_menu_names(csv_path)
+        basic_menus = self._extract_basic_menus(menu_set)
+        return build_menu_artifact(menu_set, basic_menus, artifact_path, csv_path=csv_path)
+
+    def _read_menu_names(self, csv_path: str) -> Set[str]:
+        """CSV의 '식품명' 열에서 메뉴 이름만 읽음"""
+        # 아티팩트 로드 경로에서는 pandas를 import하지 않도록 지연 import
+        import pandas as pd
+
+        logger.info("[DEBUG] CSV 읽기 시작")
+        df = pd.read_csv(csv_path, usecols=['식품명'], low_memory=False)
+        logger.info("[DEBUG] CSV 읽기 완료")
+
+        # '식품명' 열에서 메뉴 이름만 추출 + 중복 제거
+        menu_set = set(df['식품명'].dropna().unique())
+        logger.info(f"[DEBUG] 메뉴 이름 추출 완료: {len(menu_set)}개")
+        return menu_set
+
     def _generate_menu_dict(self, csv_path: str) -> Set[str]:
         """CSV 파일에서 메뉴 목록을 생성"""
         try:
-            logger.info("[DEBUG] CSV 읽기 시작")
-            df = pd.read_csv(csv_path, low_memory=False)
-            logger.info("[DEBUG] CSV 읽기 완료")
-            
-            logger.info("[DEBUG] 메뉴 이름 추출 시작")
-            # '식품명' 열에서 메뉴 이름만 추출 + 중복 제거
-            menu_set = set(df['식품명'].dropna().unique())
-            logger.info(f"[DEBUG] 메뉴 이름 추출 완료: {len(menu_set)}개")
+            menu_set = self._read_menu_names(csv_path)
             
             # 기본 메뉴명 추가
             basic_menus = self._extract_basic_menus(menu_set)
@@ -59,40 +114,38 @@ class MenuDictGenerator:
     
     def _extract_basic_menus(self, menu_set: Set[str]) -> Set[str]:
         """복합 메뉴명에서 기본 메뉴명을 추출"""
-        basic_menus = set()
-        
-        # 기본 메뉴명 패턴
-        basic_patterns = [
-            # 한식
-            "비빔밥", "김치찌개", "된장찌개", "갈비탕", "만두국", "육회비빔밥",
-            "제육덮밥", "오징어볶음", "돼지김치찌개", "참치순두부찌개", "부대찌개",
-            "골뱅이비빔면", "라면", "라면사리",
-            
-            # 일반 메뉴
-            "돈까스", "치킨가라아게", "소세지", "피자", "햄버거", "샌드위치",
-            "불고기", "닭볶음탕", "해물탕", "감자튀김", "치킨", "스테이크", "파스타",
-            
-            # 기본 메뉴 구성요소
-            "비빔", "덮밥", "볶음", "찌개", "탕", "국", "밥", "면"
-        ]
-        
         # 기본 메뉴 추가
-        basic_menus.update(basic_patterns)
+        basic_menus = set(self.BASIC_MENU_PATTERNS)
         
-        # 복합 메뉴에서 기본 메뉴 추출
+        # 패턴을 포함한 복합 메뉴도 추가 (메뉴마다 한 번의 순회로 모든 패턴 검사)
+        matcher = self._basic_menu_matcher()
         for menu in menu_set:
-            for pattern in basic_patterns:
-                if pattern in menu:
-                    basic_menus.add(pattern)
-                    # 복합 메뉴도 추가
-                    if len(menu.split()) > 1:
-                        basic_menus.add(menu)
+            if len(menu.split()) > 1 and matcher.contains_any(menu):
+                basic_menus.add(menu)
         
         return basic_menus
 
+    @classmethod
+    def _basic_menu_matcher(cls) -> KeywordMatcher:
+        if cls._basic_matcher is None:
+            cls._basic_matcher = KeywordMatcher(cls.BASIC_MENU_PATTERNS)
+        return cls._basic_matcher
+
 # 전역 인스턴스 생성
 menu_dict_generator = MenuDictGenerator()
 
 def get_menu_dict(csv_path: str) -> Set[str]:
     """메뉴 목록을 가져오는 편의 함수"""
-    return menu_dict_generator.get_menu_dict(csv_path) 
\ No newline at end of file
+    return menu_dict_generator.get_menu_dict(csv_path)
+
+if __name__ == "__main__":
+    # 빌드 단계: python -m app.services.nutrition.data.menu_dict_generator --csv <nutrition_db.csv>
+    default_csv = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nutrition_db.csv')
+    parser = argparse.ArgumentParser(description="메뉴 사전 바이너리 아티팩트 빌드")
+    parser.add_argument("--csv", default=default_csv, help="원본 영양 정보 CSV 경로")
+    parser.add_argument("--out", default=None, help="아티팩트 출력 경로 (기본: CSV와 같은 디렉토리)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    version = menu_dict_generator.build_artifact(args.csv, args.out)
+    print(f"메뉴 사전 아티팩트 빌드 완료 (버전: {version})") 
\ No newline at end of file
@@ -0,0 +1,207 @@
+import os
+import json
+import time
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections.abc import Set as AbstractSet
+from typing import Dict, FrozenSet, Iterator, Optional, Set, Tuple
+from app.services.nutrition.data.menu_artifact import MenuTable, artifact_path_for, jamo_key
+from app.services.nutrition.data.menu_dict_generator import menu_dict_generator
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CSV_PATH = os.path.join(DATA_DIR, 'nutrition_db.csv')
+DEFAULT_CORRECTIONS_PATH = os.path.join(DATA_DIR, 'menu_corrections.json')
+
+
+class ExtendedMenuSet(AbstractSet):
+    """아티팩트 메뉴 집합 + 교정 데이터의 추가 메뉴 (읽기 전용)"""
+
+    def __init__(self, base: Set[str], extras: FrozenSet[str]):
+        self._base = base
+        self._extras = frozenset(m for m in extras if m not in base)
+        self._extra_jamo = {menu: jamo_key(menu) for menu in self._extras}
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    @property
+    def base(self) -> Set[str]:
+        return self._base
+
+    def extra_items_with_jamo(self) -> Iterator[Tuple[str, str]]:
+        return iter(self._extra_jamo.items())
+
+    def __len__(self) -> int:
+        return len(self._base) + len(self._extras)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._base
+        yield from self._extras
+
+    def __contains__(self, item) -> bool:
+        return item in self._extras or item in self._base
+
+    def items_with_jamo(self) -> Iterator[Tuple[str, str]]:
+        if isinstance(self._base, MenuTable):
+            yield from self._base.items_with_jamo()
+        else:
+            for menu in self._base:
+                yield menu, jamo_key(menu)
+        yield from self.extra_items_with_jamo()
+
+
+class MenuSnapshot:
+    """메뉴 사전과 OCR 교정 테이블의 불변 스냅샷 (요청 단위로 하나만 사용)"""
+
+    def __init__(self, menu_set: Set[str], menu_version: str, corrections: Dict):
+        self.menu_set = menu_set
+        self.menu_version = menu_version
+        self.corrections_version = str(corrections.get('version', '0'))
+        self.version = f"{menu_version}+{self.corrections_version}"
+        self.eng_to_kor: Dict[str, str] = dict(corrections.get('eng_to_kor', {}))
+        self.common_ocr_errors: Dict[str, str] = dict(corrections.get('common_ocr_errors', {}))
+        self.menu_mapping: Dict[str, str] = dict(corrections.get('menu_mapping', {}))
+        self.loaded_at = time.time()
+
+    def describe(self) -> Dict:
+        return {
+            "version": self.version,
+            "menu_version": self.menu_version,
+            "corrections_version": self.corrections_version,
+            "menu_count": len(self.menu_set),
+            "loaded_at": self.loaded_at,
+        }
+
+
+_active_snapshot: ContextVar[Optional[MenuSnapshot]] = ContextVar('menu_snapshot', default=None)
+
+
+class MenuRegistry:
+    """버전 관리되는 메뉴 사전 저장소 (백그라운드 빌드 후 원자적 교체)"""
+
+    def __init__(self, csv_path: str = DEFAULT_CSV_PATH, corrections_path: str = DEFAULT_CORRECTIONS_PATH):
+        self.csv_path = csv_path
+        self.corrections_path = corrections_path
+        self._snapshot: Optional[MenuSnapshot] = None
+        self._build_lock = threading.Lock()
+        self._reload_thread: Optional[threading.Thread] = None
+        self._source_stamp = None
+        self.last_error: Optional[str] = None
+
+    def current(self) -> MenuSnapshot:
+        """현재 스냅샷 (최초 호출 시 동기 로드)"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._build_lock:
+                if self._snapshot is None:
+                    self._snapshot = self._build()
+            snapshot = self._snapshot
+        return snapshot
+
+    @property
+    def reloading(self) -> bool:
+        return self._reload_thread is not None and self._reload_thread.is_alive()
+
+    def _stat(self, path: str):
+        try:
+            stat = os.stat(path)
+            return stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return None
+
+    def _current_stamp(self):
+        # 다른 프로세스가 아티팩트만 다시 빌드한 경우도 감지
+        return (
+            self._stat(self.csv_path),
+            self._stat(artifact_path_for(self.csv_path)),
+            self._stat(self.corrections_path),
+        )
+
+    def _load_corrections(self) -> Dict:
+        with open(self.corrections_path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _build(self) -> MenuSnapshot:
+        """새 스냅샷을 빌드 (기존 스냅샷은 건드리지 않음)"""
+        corrections = self._load_corrections()
+        menu_set = menu_dict_generator.load_menu_dict(self.csv_path)
+        # 아티팩트 재빌드가 일어날 수 있으므로 로드 이후의 상태를 기록
+        stamp = self._current_stamp()
+        menu_version = getattr(menu_set, 'version', 'csv')
+
+        extras = frozenset(corrections.get('extra_menus', []))
+        if extras:
+            menu_set = ExtendedMenuSet(menu_set, extras)
+
+        snapshot = MenuSnapshot(menu_set, menu_version, corrections)
+        self._source_stamp = stamp
+        logger.info(f"메뉴 사전 스냅샷 빌드 완료: 버전 {snapshot.version} ({len(menu_set)}개)")
+        return snapshot
+
+    def reload(self) -> MenuSnapshot:
+        """동기적으로 재빌드 후 교체 (요청 처리 중인 스냅샷은 그대로 유지됨)"""
+        with self._build_lock:
+            try:
+                snapshot = self._build()
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"메뉴 사전 재빌드 실패, 기존 버전 유지: {str(e)}")
+                raise
+            self.last_error = None
+            # 참조 교체는 원자적이므로 읽는 쪽은 잠금 없이 이전/새 버전 중 하나를 봄
+            self._snapshot = snapshot
+        return snapshot
+
+    def reload_in_background(self) -> bool:
+        """백그라운드 스레드에서 재빌드 시작 (이미 진행 중이면 False)"""
+        if self.reloading:
+            return False
+
+        def _run():
+            try:
+                self.reload()
+            except Exception:
+                # reload()에서 이미 기록하고 기존 버전을 유지함
+                pass
+
+        self._reload_thread = threading.Thread(target=_run, name='menu-dict-reload', daemon=True)
+        self._reload_thread.start()
+        return True
+
+    def has_source_changes(self) -> bool:
+        return self._source_stamp is not None and self._current_stamp() != self._source_stamp
+
+    async def watch(self, interval: float):
+        """원본 파일 변경을 주기적으로 확인하여 자동 재빌드"""
+        logger.info(f"메뉴 사전 파일 감시 시작 (주기: {interval}초)")
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if self.has_source_changes() and self.reload_in_background():
+                    logger.info("메뉴 사전 원본 변경 감지, 재빌드 시작")
+            except Exception as e:
+                logger.error(f"메뉴 사전 파일 감시 중 오류 발생: {str(e)}")
+
+
+menu_registry = MenuRegistry()
+
+
+def current_snapshot() -> MenuSnapshot:
+    """현재 요청에 고정된 스냅샷 (없으면 최신 스냅샷)"""
+    return _active_snapshot.get() or menu_registry.current()
+
+
+@contextmanager
+def use_snapshot(snapshot: MenuSnapshot):
+    """블록 안의 매칭이 모두 같은 사전 버전을 사용하도록 고정"""
+    token = _active_snapshot.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _active_snapshot.reset(token)
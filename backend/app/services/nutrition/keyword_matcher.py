@@ -0,0 +1,150 @@
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class KeywordMatcher:
+    """여러 키워드를 텍스트 한 번 순회로 찾는 다중 패턴 매처 (Aho-Corasick)
+
+    - find_all / longest_in: 텍스트 안에 포함된 키워드 (키워드 in 텍스트)
+    - longest_containing: 텍스트를 포함하는 키워드 (텍스트 in 키워드), 키워드 접미사 트라이 사용
+    길이가 같은 키워드끼리는 먼저 등록된 키워드를 우선함 (dict 순서 + max()와 동일).
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        seen: Set[str] = set()
+        for keyword in keywords:
+            if keyword and keyword not in seen:
+                seen.add(keyword)
+                self.keywords.append(keyword)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._best: List[int] = [-1]
+        for idx, keyword in enumerate(self.keywords):
+            self._insert(keyword, idx)
+        self._build_failure_links()
+
+        self._sub_goto: List[Dict[str, int]] = [{}]
+        self._sub_best: List[int] = [-1]
+        for idx, keyword in enumerate(self.keywords):
+            for start in range(len(keyword)):
+                self._insert_substring(keyword, start, idx)
+        for idx in range(len(self.keywords)):
+            self._sub_best[0] = self._better(self._sub_best[0], idx)
+
+    def _better(self, current: int, candidate: int) -> int:
+        """더 긴 키워드, 길이가 같으면 먼저 등록된 키워드"""
+        if current < 0:
+            return candidate
+        if candidate < 0:
+            return current
+        cur_len, cand_len = len(self.keywords[current]), len(self.keywords[candidate])
+        if cand_len > cur_len or (cand_len == cur_len and candidate < current):
+            return candidate
+        return current
+
+    def _insert(self, keyword: str, idx: int):
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._best.append(-1)
+            state = nxt
+        self._out[state].append(idx)
+        self._best[state] = self._better(self._best[state], idx)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # 실패 링크를 따라가며 끝나는 키워드까지 미리 합쳐둠
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+                self._best[nxt] = self._better(self._best[nxt], self._best[self._fail[nxt]])
+
+    def _insert_substring(self, keyword: str, start: int, idx: int):
+        state = 0
+        for ch in keyword[start:]:
+            nxt = self._sub_goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._sub_goto)
+                self._sub_goto[state][ch] = nxt
+                self._sub_goto.append({})
+                self._sub_best.append(-1)
+            state = nxt
+            self._sub_best[state] = self._better(self._sub_best[state], idx)
+
+    def _states(self, text: str):
+        goto, fail = self._goto, self._fail
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            yield state
+
+    def find_all(self, text: str) -> Set[str]:
+        """텍스트에 포함된 모든 키워드"""
+        found: Set[int] = set()
+        for state in self._states(text):
+            found.update(self._out[state])
+        return {self.keywords[idx] for idx in found}
+
+    def contains_any(self, text: str) -> bool:
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                return True
+        return False
+
+    def _longest_in_idx(self, text: str) -> int:
+        goto, fail, node_best = self._goto, self._fail, self._best
+        state = 0
+        best = -1
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if node_best[state] >= 0 and node_best[state] != best:
+                best = self._better(best, node_best[state])
+        return best
+
+    def _longest_containing_idx(self, text: str) -> int:
+        state = 0
+        for ch in text:
+            state = self._sub_goto[state].get(ch)
+            if state is None:
+                return -1
+        return self._sub_best[state]
+
+    def longest_in(self, text: str) -> Optional[str]:
+        """텍스트에 포함된 가장 긴 키워드"""
+        idx = self._longest_in_idx(text)
+        return self.keywords[idx] if idx >= 0 else None
+
+    def longest_containing(self, text: str) -> Optional[str]:
+        """텍스트를 포함하는 가장 긴 키워드"""
+        idx = self._longest_containing_idx(text)
+        return self.keywords[idx] if idx >= 0 else None
+
+    def longest_overlap(self, text: str) -> Optional[str]:
+        """양방향 부분 일치(키워드 in 텍스트 또는 텍스트 in 키워드) 중 가장 긴 키워드"""
+        idx = self._better(self._longest_in_idx(text), self._longest_containing_idx(text))
+        return self.keywords[idx] if idx >= 0 else None
@@ -0,0 +1,89 @@
+import re
+import heapq
+import logging
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+from app.services.nutrition.data.menu_artifact import MenuTable, bigram_keys, jamo_key
+from app.services.nutrition.data.menu_registry import ExtendedMenuSet, MenuSnapshot, current_snapshot
+
+logger = logging.getLogger(__name__)
+
+# 자모 유사도로 재정렬할 후보 수 (top_k 대비 배수, 최소값)
+CANDIDATE_POOL_FACTOR = 4
+MIN_CANDIDATE_POOL = 20
+
+
+class MenuMatcher:
+    """여러 텍스트를 한 번에 메뉴 사전과 매칭하여 순위가 매겨진 후보를 반환"""
+
+    def _normalize(self, text: str) -> str:
+        return re.sub(r'\s+', ' ', text).strip()
+
+    def _split_menu_set(self, menu_set) -> Tuple[Optional[object], Dict[str, str]]:
+        """바이그램 색인이 있는 아티팩트와 색인 없는 메뉴(추가 메뉴, CSV 폴백)를 분리"""
+        if isinstance(menu_set, MenuTable):
+            return menu_set, {}
+        if isinstance(menu_set, ExtendedMenuSet) and isinstance(menu_set.base, MenuTable):
+            return menu_set.base, dict(menu_set.extra_items_with_jamo())
+        if hasattr(menu_set, 'items_with_jamo'):
+            return None, dict(menu_set.items_with_jamo())
+        return None, {menu: jamo_key(menu) for menu in menu_set}
+
+    def _collect_common_grams(self, table, query_grams: List[List[int]]) -> List[Dict[int, int]]:
+        """모든 질의의 바이그램을 모아 포스팅 목록을 한 번씩만 읽으며 질의별 공통 바이그램 수를 셈"""
+        queries_by_gram: Dict[int, List[int]] = {}
+        for q, grams in enumerate(query_grams):
+            for gram in grams:
+                queries_by_gram.setdefault(gram, []).append(q)
+
+        common: List[Dict[int, int]] = [{} for _ in query_grams]
+        # 키 순서대로 읽으면 mmap 상의 색인도 앞에서부터 순차적으로 접근함
+        for gram in sorted(queries_by_gram):
+            postings = table.postings(gram)
+            if not len(postings):
+                continue
+            for q in queries_by_gram[gram]:
+                counts = common[q]
+                for menu_id in postings:
+                    counts[menu_id] = counts.get(menu_id, 0) + 1
+        return common
+
+    def match_batch(self, texts: List[str], top_k: int = 5, cutoff: float = 0.6,
+                    snapshot: Optional[MenuSnapshot] = None) -> List[List[Tuple[str, float]]]:
+        """각 텍스트에 대해 (메뉴, 점수) 후보를 점수 내림차순으로 최대 top_k개 반환"""
+        snapshot = snapshot or current_snapshot()
+        table, unindexed = self._split_menu_set(snapshot.menu_set)
+
+        queries = [self._normalize(text) for text in texts]
+        query_grams = [bigram_keys(q) if q else [] for q in queries]
+        common = self._collect_common_grams(table, query_grams) if table is not None else [{} for _ in queries]
+        pool_size = max(MIN_CANDIDATE_POOL, top_k * CANDIDATE_POOL_FACTOR)
+
+        results = []
+        for q, query in enumerate(queries):
+            if not query:
+                results.append([])
+                continue
+
+            candidates: Dict[str, str] = {}
+            if table is not None:
+                # 1차: 바이그램 Dice 계수로 후보 축소
+                n_grams = len(query_grams[q])
+                pool = heapq.nlargest(
+                    pool_size, common[q].items(),
+                    key=lambda item: 2 * item[1] / (n_grams + table.gram_count(item[0]))
+                )
+                candidates = {table[menu_id]: table.jamo(menu_id) for menu_id, _ in pool}
+            candidates.update(unindexed)
+
+            # 2차: 자모 단위 유사도로 재정렬 (_find_best_menu_match와 같은 기준)
+            query_jamo = jamo_key(query)
+            scored: List[Tuple[str, float]] = []
+            for menu, menu_jamo in candidates.items():
+                score = 1.0 if menu == query else SequenceMatcher(None, query_jamo, menu_jamo).ratio()
+                if score >= cutoff:
+                    scored.append((menu, round(score, 4)))
+            scored.sort(key=lambda item: (-item[1], len(item[0]), item[0]))
+            results.append(scored[:top_k])
+
+        return results
@@ -5,24 +5,18 @@ import aiohttp
 import ssl
 from typing import Dict, Optional
 import pandas as pd
+from app.services.nutrition.keyword_matcher import KeywordMatcher
+from app.core.metrics import PIPELINE_STAGE_SECONDS, UPSTREAM_ERRORS
 
 logger = logging.getLogger(__name__)
 
 class NutritionService:
     def __init__(self):
         """영양 정보 서비스 초기화"""
-        try:
-            # CSV 파일 경로
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            csv_path = os.path.join(current_dir, 'data', 'nutrition_db.csv')
-            
-            # CSV 파일 읽기
-            self.nutrition_db = pd.read_csv(csv_path)
-            logger.info(f"영양 정보 DB 로드 완료: {len(self.nutrition_db)} 개의 메뉴")
-            
-        except Exception as e:
-            logger.error(f"영양 정보 DB 로드 중 오류 발생: {str(e)}")
-            self.nutrition_db = pd.DataFrame()  # 빈 DataFrame으로 초기화
+        # CSV 파일 경로 (DataFrame은 실제로 필요할 때만 워커별로 로드)
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        self.csv_path = os.path.join(current_dir, 'data', 'nutrition_db.csv')
+        self._nutrition_db = None
 
         # 1인분 기준량 정의
         self.serving_size_guess = {
@@ -79,6 +73,8 @@ class NutritionService:
             "된장라면": 500,
             "공기밥": 210
         }
+        # 부분 일치 검색용 다중 패턴 매처
+        self.serving_size_matcher = KeywordMatcher(self.serving_size_guess)
 
         logger.info("영양 정보 서비스 초기화")
         # API 키는 이미 인코딩되어 있으므로 그대로 사용
@@ -89,12 +85,26 @@ class NutritionService:
         logger.info(f"API 키 설정 확인: {self.api_key[:10]}... (길이: {len(self.api_key)})")
         logger.info(f"Base URL: {self.base_url}")
 
+    @property
+    def nutrition_db(self) -> pd.DataFrame:
+        """로컬 영양 정보 DB (요청 경로에서는 식약처 API를 사용하므로 지연 로드)"""
+        if self._nutrition_db is None:
+            try:
+                # CSV 파일 읽기
+                self._nutrition_db = pd.read_csv(self.csv_path)
+                logger.info(f"영양 정보 DB 로드 완료: {len(self._nutrition_db)} 개의 메뉴")
+            except Exception as e:
+                logger.error(f"영양 정보 DB 로드 중 오류 발생: {str(e)}")
+                self._nutrition_db = pd.DataFrame()  # 빈 DataFrame으로 초기화
+        return self._nutrition_db
+
     async def _search_food(self, food_name: str) -> Optional[Dict]:
         """식약처 API를 통해 식품 영양정보를 검색합니다."""
         try:
             # API 키가 비어있는지 확인
             if not self.api_key:
                 logger.error("API 키가 설정되지 않았습니다!")
+                UPSTREAM_ERRORS.inc(upstream="nutrition_api", reason="no_api_key")
                 return None
                 
             params = {
@@ -129,12 +139,14 @@ class NutritionService:
                             return None
                     else:
                         logger.error(f"API 호출 실패: {response.status}")
+                        UPSTREAM_ERRORS.inc(upstream="nutrition_api", reason=f"http_{response.status // 100}xx")
                         response_text = await response.text()
                         logger.error(f"응답 내용: {response_text}")
                     return None
                     
         except Exception as e:
             logger.error(f"식약처 API 호출 중 오류 발생: {str(e)}")
+            UPSTREAM_ERRORS.inc(upstream="nutrition_api", reason=type(e).__name__)
             return None
 
     def _clean_food_name(self, food_name: str) -> str:
@@ -240,14 +252,10 @@ class NutritionService:
         if food_name in self.serving_size_guess:
             return self.serving_size_guess[food_name]
         
-        # 부분 일치 검색 (가장 긴 일치하는 키워드 찾기)
-        matching_items = [(key, value) for key, value in self.serving_size_guess.items() 
-                         if key in food_name or food_name in key]
-        
-        if matching_items:
-            # 가장 긴 키워드와 매칭되는 값 반환
-            longest_match = max(matching_items, key=lambda x: len(x[0]))
-            return longest_match[1]
+        # 부분 일치 검색 (양방향 부분 일치 중 가장 긴 키워드를 한 번의 순회로 찾음)
+        longest_match = self.serving_size_matcher.longest_overlap(food_name)
+        if longest_match:
+            return self.serving_size_guess[longest_match]
         
         return default_serving
 
@@ -265,7 +273,8 @@ class NutritionService:
         """음식 이름으로 영양 정보를 검색하고 1인분 기준으로 변환합니다."""
         try:
             # 음식 이름 정제
-            cleaned_name = self._clean_food_name(food_name)
+            with PIPELINE_STAGE_SECONDS.time(stage="name_cleanup"):
+                cleaned_name = self._clean_food_name(food_name)
             logger.info(f"정제된 음식 이름: {cleaned_name} (원본: {food_name})")
             
             # 정제된 텍스트가 2글자 이하면 검색하지 않음
@@ -274,11 +283,13 @@ class NutritionService:
                 return None
             
             # 식약처 API로 검색
-            result = await self._search_food(cleaned_name)
+            with PIPELINE_STAGE_SECONDS.time(stage="nutrition_api"):
+                result = await self._search_food(cleaned_name)
             
             if result:
                 # 1인분 기준량 계산
-                serving_size = self.get_serving_size(cleaned_name)
+                with PIPELINE_STAGE_SECONDS.time(stage="serving_size"):
+                    serving_size = self.get_serving_size(cleaned_name)
                 logger.info(f"1인분 기준량: {serving_size}g")
 
                 # 100g 기준 영양성분
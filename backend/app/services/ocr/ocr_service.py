@@ -1,4 +1,6 @@
 import easyocr
+from easyocr.utils import reformat_input
+import time
 import logging
 import numpy as np
 from PIL import Image, ImageEnhance, ImageFilter
@@ -7,29 +9,34 @@ import re
 import cv2
 from difflib import SequenceMatcher, get_close_matches
 import hgtk  # 한글 자모 분리/결합 라이브러리
-from app.services.nutrition.data.menu_dict_generator import get_menu_dict
-from typing import List, Tuple, Optional
+from app.services.nutrition.data.menu_registry import current_snapshot
+from app.core.metrics import PIPELINE_STAGE_SECONDS
+from typing import Dict, List, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# OCR에서 서로 잘못 읽히기 쉬운 자모 묶음
+SIMILAR_JAMO_GROUPS = [
+    ['ㄱ', 'ㄴ', 'ㄷ', 'ㄹ'],  # 초성 유사 그룹
+    ['ㅁ', 'ㅂ', 'ㅃ', 'ㅅ'],  # 초성 유사 그룹
+    ['ㅇ', 'ㅈ', 'ㅉ', 'ㅊ'],  # 초성 유사 그룹
+    ['ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'],  # 초성 유사 그룹
+    ['ㅏ', 'ㅑ', 'ㅓ', 'ㅕ'],  # 중성 유사 그룹
+    ['ㅗ', 'ㅛ', 'ㅜ', 'ㅠ'],  # 중성 유사 그룹
+    ['ㅡ', 'ㅣ', 'ㅐ', 'ㅒ'],  # 중성 유사 그룹
+    ['ㅔ', 'ㅖ', 'ㅘ', 'ㅙ'],  # 중성 유사 그룹
+    ['ㅚ', 'ㅝ', 'ㅞ', 'ㅟ'],  # 중성 유사 그룹
+    ['ㅢ', 'ㅚ', 'ㅟ', 'ㅡ'],  # 중성 유사 그룹
+]
+
 class OCRService:
-    def __init__(self):
+    def __init__(self, load_reader: bool = True):
         logger.info("OCR 서비스 초기화 중...")
-        # 한국어와 영어를 인식하도록 설정
-        self.reader = easyocr.Reader(['ko', 'en'])
-        
-        # 메뉴 목록 초기화
-        self.menu_set = get_menu_dict('app/services/nutrition/data/nutrition_db.csv')
+        # 한국어와 영어를 인식하도록 설정 (텍스트 매칭만 쓰는 벤치마크 등은 모델을 로드하지 않음)
+        self.reader = easyocr.Reader(['ko', 'en']) if load_reader else None
         
-        # 영문 메뉴 매핑
-        self.eng_to_kor = {
-            "MANDUGUK": "만두국",
-            "GALBITUNG": "갈비탕",
-            "BIBIMBAP": "비빔밥",
-            "KIMCHIJJIGAE": "김치찌개",
-            "DOENJANGJJIGAE": "된장찌개",
-            "BUDAEJJIGAE": "부대찌개"
-        }
+        # 메뉴 목록과 OCR 교정 테이블은 메뉴 사전 스냅샷에서 가져옴 (미리 로드)
+        current_snapshot()
 
         # 메뉴가 아닌 텍스트 패턴
         self.non_menu_patterns = [
@@ -40,37 +47,6 @@ class OCRService:
             r'^[A-Za-z\s\d]+$',  # 영어로만 된 텍스트
         ]
         
-        # 자주 발생하는 OCR 오류 수정
-        self.common_ocr_errors = {
-            "째개": "찌개",
-            "찌게": "찌개",
-            "덜밥": "덮밥",
-            "댐밥": "덮밥",
-            "방밥": "밥",
-            "비방": "비빔",
-            "멩이": "뱅이",
-            "콜면이": "골뱅이",
-            "째": "찌개",     # "부대째" -> "부대찌개"
-            "불고": "불고기",  # "불고 덮밥" -> "불고기덮밥"
-            "비범": "비빔",    # "육회비범밥" -> "육회비빔밥"
-            "뷰음": "볶음",    # "오징어뷰음" -> "오징어볶음"
-            "뒷밥": "덮밥"     # "제육뒷밥" -> "제육덮밥"
-        }
-        
-        # 메뉴 매핑
-        self.menu_mapping = {
-            "부대째": "부대찌개",
-            "김치째개": "김치찌개",
-            "불고기댐밥": "불고기덮밥",
-            "불고기덜밥": "불고기덮밥",
-            "불고 덮밥": "불고기덮밥",
-            "불고기 덮밥": "불고기덮밥",
-            "육회비범밥": "육회비빔밥",
-            "제육뒷밥": "제육덮밥",
-            "오징어뷰음": "오징어볶음",
-            "골멩이비방면": "골뱅이비빔면"
-        }
-
         self.modifiers = [
             # 맛 관련
             "매콤한", "매운", "달콤한", "달콤", "얼큰한", "얼큰", "맵고", "맛있는",
@@ -105,6 +81,22 @@ class OCRService:
         
         logger.info("OCR 서비스 초기화 완료")
 
+    @property
+    def menu_set(self):
+        return current_snapshot().menu_set
+
+    @property
+    def eng_to_kor(self):
+        return current_snapshot().eng_to_kor
+
+    @property
+    def common_ocr_errors(self):
+        return current_snapshot().common_ocr_errors
+
+    @property
+    def menu_mapping(self):
+        return current_snapshot().menu_mapping
+
     def _preprocess_image(self, image: Image.Image) -> Image.Image:
         """이미지 전처리를 수행합니다 (기본 버전)."""
         try:
@@ -157,6 +149,13 @@ class OCRService:
                 
         return text
 
+    def _iter_menus_with_jamo(self):
+        """메뉴와 자모 분리 형태를 함께 순회 (아티팩트에 미리 계산된 값이 있으면 사용)"""
+        menu_set = self.menu_set
+        if hasattr(menu_set, 'items_with_jamo'):
+            return menu_set.items_with_jamo()
+        return ((menu, str(self._decompose_hangul(menu))) for menu in menu_set)
+
     def _find_best_menu_match(self, text):
         """메뉴 사전에서 가장 유사한 메뉴 찾기 (set 기반)"""
         # 영문인 경우 한글로 변환 시도
@@ -167,12 +166,11 @@ class OCRService:
         best_match = text
 
         # 입력 텍스트의 자모 분리
-        text_decomposed = self._decompose_hangul(text)
+        text_decomposed = str(self._decompose_hangul(text))
 
-        for correct_menu in self.menu_set:  # ✅ dict -> set
+        for correct_menu, correct_decomposed in self._iter_menus_with_jamo():
             # 자모 단위 유사도 비교
-            correct_decomposed = self._decompose_hangul(correct_menu)
-            score = SequenceMatcher(None, str(text_decomposed), str(correct_decomposed)).ratio()
+            score = SequenceMatcher(None, text_decomposed, correct_decomposed).ratio()
 
             # 유사도가 매우 높은 경우(0.8 이상)에만 매칭
             if score > best_score and score > 0.8:
@@ -353,20 +351,7 @@ class OCRService:
 
     def _is_similar_jamo(self, jamo1: str, jamo2: str) -> bool:
         """유사한 자모인지 확인"""
-        similar_groups = [
-            ['ㄱ', 'ㄴ', 'ㄷ', 'ㄹ'],  # 초성 유사 그룹
-            ['ㅁ', 'ㅂ', 'ㅃ', 'ㅅ'],  # 초성 유사 그룹
-            ['ㅇ', 'ㅈ', 'ㅉ', 'ㅊ'],  # 초성 유사 그룹
-            ['ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'],  # 초성 유사 그룹
-            ['ㅏ', 'ㅑ', 'ㅓ', 'ㅕ'],  # 중성 유사 그룹
-            ['ㅗ', 'ㅛ', 'ㅜ', 'ㅠ'],  # 중성 유사 그룹
-            ['ㅡ', 'ㅣ', 'ㅐ', 'ㅒ'],  # 중성 유사 그룹
-            ['ㅔ', 'ㅖ', 'ㅘ', 'ㅙ'],  # 중성 유사 그룹
-            ['ㅚ', 'ㅝ', 'ㅞ', 'ㅟ'],  # 중성 유사 그룹
-            ['ㅢ', 'ㅚ', 'ㅟ', 'ㅡ'],  # 중성 유사 그룹
-        ]
-        
-        for group in similar_groups:
+        for group in SIMILAR_JAMO_GROUPS:
             if jamo1 in group and jamo2 in group:
                 return True
         return False
@@ -516,52 +501,97 @@ class OCRService:
             logger.error(f"메뉴 추출 중 오류 발생: {str(e)}")
             return None
 
+    def _decode_image(self, image_bytes: bytes) -> Image.Image:
+        """이미지 바이트를 PIL Image로 변환 (실제 디코딩까지 수행)"""
+        image = Image.open(io.BytesIO(image_bytes))
+        image.load()
+        return image
+
+    def _detect(self, image_np: np.ndarray):
+        """텍스트 영역 검출 (easyocr readtext의 검출 단계, 기본 옵션 동일)"""
+        img, img_cv_grey = reformat_input(image_np)
+        horizontal_list, free_list = self.reader.detect(img, reformat=False)
+        # detect는 이미지별 목록을 반환하므로 첫 번째 이미지 결과만 사용
+        return img_cv_grey, horizontal_list[0], free_list[0]
+
+    def _recognize(self, img_cv_grey: np.ndarray, horizontal_list, free_list) -> list:
+        """검출된 영역의 글자 인식 (easyocr readtext의 인식 단계)"""
+        return self.reader.recognize(img_cv_grey, horizontal_list, free_list, reformat=False)
+
+    def _postprocess(self, result: list) -> List[dict]:
+        """OCR 결과에서 메뉴가 아닌 텍스트를 거르고 정제"""
+        extracted_texts = []
+        logger.info(f"원본 이미지 OCR 결과 수: {len(result)}")
+        
+        for bbox, text, confidence in result:
+            # bbox 좌표를 float로 변환
+            bbox = [[float(coord) for coord in point] for point in bbox]
+            
+            # 텍스트 정제
+            normalized = self._normalize_text(text)
+            
+            # 메뉴가 아닌 텍스트는 제외
+            if not self._is_menu_text(normalized):
+                logger.info(f"메뉴가 아닌 텍스트로 제외: {text}")
+                continue
+            
+            # 정제된 텍스트
+            cleaned = self._clean_and_normalize_text(text)
+            
+            if cleaned:  # 빈 문자열이 아닌 경우만 추가
+                # 최종 결과에서 수식어가 포함된 경우 다시 한 번 제거
+                final_text = self._remove_modifiers(cleaned)
+                if final_text:  # 수식어 제거 후에도 텍스트가 남아있는 경우만 추가
+                    extracted_texts.append({
+                        "text": final_text,
+                        "confidence": confidence,
+                        "bbox": bbox
+                    })
+                    logger.info(f"원본 텍스트: {text} -> 정제된 텍스트: {final_text} (신뢰도: {confidence:.2f})")
+                else:
+                    logger.info(f"수식어 제거 후 빈 텍스트: {text}")
+            else:
+                logger.info(f"제외된 텍스트: {text} (신뢰도: {confidence:.2f})")
+        
+        return extracted_texts
+
+    def extract_text_with_timings(self, image_bytes: bytes) -> Tuple[List[dict], Dict[str, float]]:
+        """extract_text와 같은 결과와 단계별 소요 시간(초)을 함께 반환 (오류는 호출한 쪽으로 전달)"""
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+
+        # 이미지 바이트를 PIL Image로 변환
+        image = self._decode_image(image_bytes)
+        timings["decode"] = time.perf_counter() - started
+
+        # 이미지 전처리
+        stage_started = time.perf_counter()
+        processed_image = self._preprocess_image(image)
+        image_np = np.array(processed_image)
+        timings["preprocess"] = time.perf_counter() - stage_started
+
+        # OCR 수행 (검출 -> 인식)
+        stage_started = time.perf_counter()
+        img_cv_grey, horizontal_list, free_list = self._detect(image_np)
+        timings["detect"] = time.perf_counter() - stage_started
+
+        stage_started = time.perf_counter()
+        result = self._recognize(img_cv_grey, horizontal_list, free_list)
+        timings["recognize"] = time.perf_counter() - stage_started
+
+        # 결과 정제
+        stage_started = time.perf_counter()
+        extracted_texts = self._postprocess(result)
+        timings["postprocess"] = time.perf_counter() - stage_started
+
+        for stage, seconds in timings.items():
+            PIPELINE_STAGE_SECONDS.observe(seconds, stage=stage)
+        return extracted_texts, timings
+
     async def extract_text(self, image_bytes: bytes) -> List[dict]:
         """이미지에서 텍스트 추출"""
         try:
-            # 이미지 바이트를 PIL Image로 변환
-            image = Image.open(io.BytesIO(image_bytes))
-            
-            # 이미지 전처리
-            processed_image = self._preprocess_image(image)
-            
-            # OCR 수행
-            result = self.reader.readtext(np.array(processed_image))
-            
-            # 결과 정제
-            extracted_texts = []
-            logger.info(f"원본 이미지 OCR 결과 수: {len(result)}")
-            
-            for bbox, text, confidence in result:
-                # bbox 좌표를 float로 변환
-                bbox = [[float(coord) for coord in point] for point in bbox]
-                
-                # 텍스트 정제
-                normalized = self._normalize_text(text)
-                
-                # 메뉴가 아닌 텍스트는 제외
-                if not self._is_menu_text(normalized):
-                    logger.info(f"메뉴가 아닌 텍스트로 제외: {text}")
-                    continue
-                
-                # 정제된 텍스트
-                cleaned = self._clean_and_normalize_text(text)
-                
-                if cleaned:  # 빈 문자열이 아닌 경우만 추가
-                    # 최종 결과에서 수식어가 포함된 경우 다시 한 번 제거
-                    final_text = self._remove_modifiers(cleaned)
-                    if final_text:  # 수식어 제거 후에도 텍스트가 남아있는 경우만 추가
-                        extracted_texts.append({
-                            "text": final_text,
-                            "confidence": confidence,
-                            "bbox": bbox
-                        })
-                        logger.info(f"원본 텍스트: {text} -> 정제된 텍스트: {final_text} (신뢰도: {confidence:.2f})")
-                    else:
-                        logger.info(f"수식어 제거 후 빈 텍스트: {text}")
-                else:
-                    logger.info(f"제외된 텍스트: {text} (신뢰도: {confidence:.2f})")
-            
+            extracted_texts, _ = self.extract_text_with_timings(image_bytes)
             return extracted_texts
             
         except Exception as e:
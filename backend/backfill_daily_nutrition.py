@@ -0,0 +1,26 @@
+import argparse
+from app.database import SessionLocal, create_tables
+from app.services.balance.balance_service import bump_data_versions
+from app.services.balance.daily_nutrition_service import DailyNutritionService
+
+def backfill(user_id=None):
+    db = SessionLocal()
+    try:
+        count = DailyNutritionService(db).backfill(user_id)
+        bump_data_versions(db, user_id)
+        db.commit()
+        target = f"사용자 {user_id}" if user_id is not None else "전체 사용자"
+        print(f"일별 영양 합계 재생성 완료: {target}, {count}일")
+    except Exception as e:
+        db.rollback()
+        print(f"일별 영양 합계 재생성 중 오류 발생: {str(e)}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="meals 기록으로 daily_nutrition 롤업 재생성")
+    parser.add_argument("--user-id", type=int, default=None, help="특정 사용자만 재생성")
+    args = parser.parse_args()
+    create_tables()
+    backfill(args.user_id)
@@ -0,0 +1,3 @@
+"""
+벤치마크와 부하 테스트 스크립트
+"""
@@ -0,0 +1,70 @@
+import os
+import random
+from typing import Dict, List, Optional
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        'app', 'services', 'nutrition', 'data')
+DEFAULT_CSV_PATH = os.path.join(DATA_DIR, 'nutrition_db.csv')
+
+# 합성 메뉴 이름 생성용 구성 요소
+_PREFIXES = ["김치", "된장", "순두부", "부대", "제육", "불고기", "오징어", "낙지", "닭", "돼지",
+             "소고기", "참치", "해물", "새우", "치즈", "매운", "차돌", "육회", "골뱅이", "버섯",
+             "감자", "고구마", "계란", "두부", "콩나물", "시금치", "멸치", "고등어", "삼치", "갈치"]
+_BASES = ["찌개", "덮밥", "볶음", "비빔밥", "국수", "냉면", "탕", "국", "전골", "볶음밥",
+          "김밥", "라면", "우동", "구이", "조림", "무침", "전", "튀김", "죽", "샐러드"]
+_SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추"
+
+
+def synthetic_menu_names(n: int, seed: int = 42) -> List[str]:
+    """실제 메뉴 사전과 비슷한 형태의 합성 메뉴 이름 n개"""
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < n:
+        name = rng.choice(_PREFIXES) + rng.choice(_BASES)
+        roll = rng.random()
+        if roll < 0.5:
+            # 실제 DB의 '식품명'처럼 수식어/변형이 붙은 이름
+            name = ''.join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 3))) + name
+        elif roll < 0.7:
+            name = f"{rng.choice(_PREFIXES)} {name}"
+        names.add(name)
+    return sorted(names)
+
+
+def load_menu_names(csv_path: str = DEFAULT_CSV_PATH, size: Optional[int] = None, seed: int = 42) -> List[str]:
+    """실제 메뉴 사전 이름 (CSV가 없거나 size가 더 크면 합성 이름으로 채움)"""
+    names: List[str] = []
+    if os.path.exists(csv_path):
+        from app.services.nutrition.data.menu_dict_generator import menu_dict_generator
+        real = menu_dict_generator._read_menu_names(csv_path)
+        names = sorted(real | menu_dict_generator._extract_basic_menus(real))
+    if size is None:
+        return names or synthetic_menu_names(10000, seed)
+    if len(names) >= size:
+        return random.Random(seed).sample(names, size)
+    extra = [m for m in synthetic_menu_names(size * 2, seed) if m not in set(names)]
+    return names + extra[:size - len(names)]
+
+
+def process_memory() -> Dict[str, float]:
+    """현재 프로세스 메모리 (MB). 리눅스에서는 RSS 구성과 PSS까지 포함"""
+    result: Dict[str, float] = {}
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in ('VmRSS', 'RssAnon', 'RssFile', 'RssShmem'):
+                    result[key] = int(value.split()[0]) / 1024
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                if line.startswith('Pss:'):
+                    result['Pss'] = int(line.split()[1]) / 1024
+    except OSError:
+        # 리눅스가 아니면 최대 RSS만 제공 (macOS는 바이트 단위)
+        try:
+            import resource
+        except ImportError:
+            return result
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        result['VmRSS'] = maxrss / (1024 * 1024 if os.uname().sysname == 'Darwin' else 1024)
+    return result
@@ -0,0 +1,178 @@
+"""
+대시보드 API 동시 부하 중 이벤트 루프 지연 측정
+
+balance 라우터를 띄운 uvicorn 서버 안에서 10ms마다 깨어나는 태스크가
+예정보다 늦게 깨어난 시간(이벤트 루프 지연)을 기록합니다. 별도 프로세스의
+클라이언트들이 /balance/stats, /meals, /weekly-score, /monthly를 반복 호출하는 동안
+지연이 유휴 상태와 비슷하게 유지되는지 확인합니다.
+
+--legacy를 주면 같은 핸들러를 async def 안에서 직접 호출하는 라우트(이전 방식)에도
+같은 부하를 걸어 비교합니다.
+
+    python -m benchmarks.event_loop_lag
+    python -m benchmarks.event_loop_lag --clients 16 --duration 5 --legacy
+"""
+import os
+import time
+import asyncio
+import argparse
+import tempfile
+import threading
+import urllib.request
+import multiprocessing as mp
+from datetime import datetime, timedelta
+from typing import List
+
+LAG_INTERVAL = 0.01
+DASHBOARD_PATHS = ["/stats", "/meals", "/weekly-score", "/monthly/1/{year}/{month}?include_meals=false"]
+
+
+def _client(base_url: str, prefix: str, token: str, deadline: float, queue):
+    now = datetime.now()
+    paths = [p.format(year=now.year, month=now.month) for p in DASHBOARD_PATHS]
+    done = errors = 0
+    i = 0
+    while time.time() < deadline:
+        request = urllib.request.Request(f"{base_url}{prefix}{paths[i % len(paths)]}",
+                                         headers={"Authorization": f"Bearer {token}"})
+        i += 1
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                response.read()
+            done += 1
+        except Exception:
+            errors += 1
+    queue.put((done, errors))
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+def _seed(meals_per_day: int, days: int):
+    from app.database import Base, SessionLocal, engine
+    from app.models.balance import Meal, User
+    from app.services.balance.daily_nutrition_service import DailyNutritionService
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.add(User(id=1, email="lag@example.com", password_hash="x", name="bench"))
+        now = datetime.now()
+        db.add_all([
+            Meal(user_id=1, meal_type=["breakfast", "lunch", "dinner"][i % 3], food_name="김치찌개",
+                 timestamp=now - timedelta(days=d, hours=i), calories=500, carbohydrates=60, protein=20, fat=15)
+            for d in range(days) for i in range(meals_per_day)
+        ])
+        db.flush()
+        DailyNutritionService(db).backfill()
+        db.commit()
+    finally:
+        db.close()
+
+
+def _build_app(lag_samples: List[float], legacy: bool):
+    from fastapi import FastAPI, Depends, Request
+    from sqlalchemy.orm import Session
+    from app.api.v1 import balance
+    from app.database import get_db
+
+    app = FastAPI()
+    app.include_router(balance.router, prefix="/api/v1")
+
+    if legacy:
+        # 이전 방식: async def 안에서 동기 DB 코드를 그대로 실행
+        @app.get("/legacy/stats")
+        async def legacy_stats(request: Request, user=Depends(balance.get_current_user), db: Session = Depends(get_db)):
+            return balance.get_balance_stats(request, user, db)
+
+        @app.get("/legacy/meals")
+        async def legacy_meals(request: Request, user=Depends(balance.get_current_user), db: Session = Depends(get_db)):
+            return balance.get_meals(request, None, user, db)
+
+        @app.get("/legacy/weekly-score")
+        async def legacy_weekly(user=Depends(balance.get_current_user), db: Session = Depends(get_db)):
+            return balance.get_weekly_balance_score(user, db)
+
+        @app.get("/legacy/monthly/{user_id}/{year}/{month}")
+        async def legacy_monthly(request: Request, user_id: int, year: int, month: int, include_meals: bool = True,
+                                 user=Depends(balance.get_current_user), db: Session = Depends(get_db)):
+            return balance.get_monthly_balance(request, user_id, year, month, include_meals, user, db)
+
+    @app.on_event("startup")
+    async def start_lag_monitor():
+        async def monitor():
+            loop = asyncio.get_running_loop()
+            while True:
+                start = loop.time()
+                await asyncio.sleep(LAG_INTERVAL)
+                lag_samples.append(loop.time() - start - LAG_INTERVAL)
+        asyncio.create_task(monitor())
+
+    return app
+
+
+def _phase(name: str, lag_samples: List[float], duration: float, clients: int, base_url: str, prefix: str, token: str):
+    lag_samples.clear()
+    results = []
+    if clients:
+        ctx = mp.get_context("spawn")
+        queue = ctx.Queue()
+        deadline = time.time() + duration
+        procs = [ctx.Process(target=_client, args=(base_url, prefix, token, deadline, queue)) for _ in range(clients)]
+        for p in procs:
+            p.start()
+        results = [queue.get() for _ in procs]
+        for p in procs:
+            p.join()
+    else:
+        time.sleep(duration)
+    samples = list(lag_samples)
+    requests_done = sum(r[0] for r in results)
+    errors = sum(r[1] for r in results)
+    print(f"{name:>14} {requests_done / duration:>9.1f}/s {errors:>6} "
+          f"{_percentile(samples, 0.5) * 1000:>8.2f}ms {_percentile(samples, 0.99) * 1000:>8.2f}ms "
+          f"{(max(samples) if samples else 0) * 1000:>8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 부하 중 이벤트 루프 지연 측정")
+    parser.add_argument("--clients", type=int, default=8, help="부하 클라이언트 프로세스 수")
+    parser.add_argument("--duration", type=float, default=5.0, help="단계별 실행 시간 (초)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--legacy", action="store_true", help="async def 안에서 동기 DB를 호출하는 이전 방식도 측정")
+    args = parser.parse_args()
+
+    # 실제 sql_app.db 대신 임시 DB 사용 (app.database import 전에 설정)
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'lag.db')}")
+    import uvicorn
+    from app.api.v1.balance import create_access_token
+
+    _seed(meals_per_day=6, days=60)
+    lag_samples: List[float] = []
+    app = _build_app(lag_samples, args.legacy)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning"))
+    server.install_signal_handlers = lambda: None
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    token = create_access_token(data={"sub": "1"})
+    print(f"클라이언트 {args.clients}개, 단계별 {args.duration:.0f}초, 측정 간격 {LAG_INTERVAL * 1000:.0f}ms")
+    print(f"{'단계':>14} {'처리량':>11} {'오류':>6} {'지연 p50':>10} {'지연 p99':>10} {'최대':>10}")
+    _phase("유휴", lag_samples, args.duration, 0, base_url, "", token)
+    _phase("def 라우트", lag_samples, args.duration, args.clients, base_url, "/api/v1/balance", token)
+    if args.legacy:
+        _phase("async+동기 DB", lag_samples, args.duration, args.clients, base_url, "/legacy", token)
+
+    server.should_exit = True
+    thread.join(timeout=5)
+
+
+if __name__ == "__main__":
+    main()
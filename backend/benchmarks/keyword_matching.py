@@ -0,0 +1,86 @@
+"""
+다중 패턴 매칭 벤치마크 (기존 substring 스캔 vs KeywordMatcher)
+
+전체 메뉴 사전 크기에서 기본 메뉴 추출(_extract_basic_menus)과
+1인분 기준량 최장 키워드 검색(get_serving_size)을 두 방식으로 실행하고
+결과가 같은지 확인한 뒤 소요 시간을 비교합니다.
+
+    python -m benchmarks.keyword_matching
+    python -m benchmarks.keyword_matching --size 100000
+"""
+import time
+import argparse
+from typing import Dict, List, Optional, Set
+
+from benchmarks.common import DEFAULT_CSV_PATH, load_menu_names
+from app.services.nutrition.keyword_matcher import KeywordMatcher
+from app.services.nutrition.data.menu_dict_generator import MenuDictGenerator
+from app.services.nutrition.nutrition_service import NutritionService
+
+
+def naive_extract_basic_menus(menu_set: List[str], patterns: List[str]) -> Set[str]:
+    """기존 구현: 메뉴 × 패턴 substring 검사"""
+    basic_menus = set(patterns)
+    for menu in menu_set:
+        for pattern in patterns:
+            if pattern in menu:
+                basic_menus.add(pattern)
+                if len(menu.split()) > 1:
+                    basic_menus.add(menu)
+    return basic_menus
+
+
+def naive_serving_size(food_name: str, serving_size_guess: Dict[str, int]) -> Optional[int]:
+    """기존 구현: 모든 키를 양방향 substring 검사 후 최장 키 선택"""
+    if food_name in serving_size_guess:
+        return serving_size_guess[food_name]
+    matching_items = [(key, value) for key, value in serving_size_guess.items()
+                      if key in food_name or food_name in key]
+    if matching_items:
+        return max(matching_items, key=lambda x: len(x[0]))[1]
+    return 100
+
+
+def _timed(fn, repeat: int):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="다중 패턴 매칭 벤치마크")
+    parser.add_argument("--csv", default=DEFAULT_CSV_PATH)
+    parser.add_argument("--size", type=int, default=None, help="사전 크기 (기본: 실제 사전 전체)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    menus = load_menu_names(args.csv, args.size)
+    print(f"메뉴 {len(menus)}개 (최소 소요 시간, {args.repeat}회 반복)")
+
+    patterns = MenuDictGenerator.BASIC_MENU_PATTERNS
+    generator = MenuDictGenerator()
+    naive_basic, naive_time = _timed(lambda: naive_extract_basic_menus(menus, patterns), args.repeat)
+    fast_basic, fast_time = _timed(lambda: generator._extract_basic_menus(menus), args.repeat)
+    assert naive_basic == fast_basic, "기본 메뉴 추출 결과가 다릅니다"
+    print(f"[기본 메뉴 추출] 패턴 {len(patterns)}개: substring {naive_time * 1000:.1f}ms, "
+          f"KeywordMatcher {fast_time * 1000:.1f}ms (x{naive_time / fast_time:.1f})")
+
+    service = NutritionService()
+    guess = service.serving_size_guess
+    naive_sizes, naive_time = _timed(lambda: [naive_serving_size(m, guess) for m in menus], args.repeat)
+    fast_sizes, fast_time = _timed(lambda: [service.get_serving_size(m) for m in menus], args.repeat)
+    assert naive_sizes == fast_sizes, "1인분 기준량 결과가 다릅니다"
+    print(f"[1인분 기준량 검색] 키워드 {len(guess)}개: substring {naive_time * 1000:.1f}ms, "
+          f"KeywordMatcher {fast_time * 1000:.1f}ms (x{naive_time / fast_time:.1f})")
+
+    build_start = time.perf_counter()
+    KeywordMatcher(guess)
+    print(f"[매처 빌드] {(time.perf_counter() - build_start) * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
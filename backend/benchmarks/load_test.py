@@ -0,0 +1,260 @@
+"""
+밸런스/대시보드 API 부하 테스트
+
+목표 RPS로 요청을 일정 간격에 예약하고(open-loop) 워커 스레드들이 실행합니다.
+지연 시간은 예약 시각부터 측정하므로 서버가 밀리면 대기 시간까지 반영됩니다.
+응답의 Server-Timing 헤더에서 DB 시간과 쿼리 수를 읽어 함께 보고합니다.
+
+기본으로는 임시 SQLite DB에 합성 데이터(benchmarks.synthetic_data)를 만들고
+밸런스 라우터만 띄운 uvicorn 서버를 별도 프로세스로 실행합니다.
+--url을 주면 이미 실행 중인 서버(같은 SECRET_KEY)에 요청합니다.
+
+    python -m benchmarks.load_test
+    python -m benchmarks.load_test --users 500 --days 180 --rps 200 --duration 30
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --user-ids 1-100 --revalidate
+"""
+import os
+import re
+import time
+import queue
+import random
+import argparse
+import tempfile
+import threading
+import http.client
+import multiprocessing as mp
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+PREFIX = "/api/v1/balance"
+# (이름, 가중치)
+SCENARIOS = [
+    ("dashboard_profile", 3),
+    ("dashboard_main", 6),
+    ("stats", 2),
+    ("meals", 3),
+    ("monthly", 2),
+    ("weekly_score", 1),
+    ("history", 2),
+    ("add_meal", 1),
+]
+SERVER_TIMING_DB = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries"')
+
+
+def _request_for(scenario: str, user_id: int, rng: random.Random, now: datetime) -> Tuple[str, str, Optional[bytes]]:
+    if scenario == "dashboard_profile":
+        return "GET", f"{PREFIX}/dashboard?fields=profile,stats,days_since_joined,monthly,weekly_score", None
+    if scenario == "dashboard_main":
+        return "GET", f"{PREFIX}/dashboard?fields=stats,meals", None
+    if scenario == "stats":
+        return "GET", f"{PREFIX}/stats", None
+    if scenario == "meals":
+        day = (now - timedelta(days=rng.randint(0, 30))).strftime("%Y-%m-%d")
+        return "GET", f"{PREFIX}/meals?date={day}", None
+    if scenario == "monthly":
+        return "GET", f"{PREFIX}/monthly/{user_id}/{now.year}/{now.month}", None
+    if scenario == "weekly_score":
+        return "GET", f"{PREFIX}/weekly-score", None
+    if scenario == "history":
+        return "GET", f"{PREFIX}/meals/history?limit=20", None
+    body = ('{"meal_type": "%s", "food_name": "김치찌개", "calories": 450, '
+            '"carbohydrates": 40, "protein": 25, "fat": 18}' % rng.choice(["breakfast", "lunch", "dinner"]))
+    return "POST", f"{PREFIX}/meals", body.encode("utf-8")
+
+
+class Result:
+    __slots__ = ("scenario", "status", "latency", "service_time", "db_time", "db_queries")
+
+    def __init__(self, scenario, status, latency, service_time, db_time, db_queries):
+        self.scenario = scenario
+        self.status = status
+        self.latency = latency
+        self.service_time = service_time
+        self.db_time = db_time
+        self.db_queries = db_queries
+
+
+def _worker(base_url: str, tokens: Dict[int, str], jobs: "queue.Queue", results: List[Result],
+            lock: threading.Lock, revalidate: bool, seed: int):
+    parts = urlsplit(base_url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+    rng = random.Random(seed)
+    etags: Dict[Tuple[int, str], str] = {}
+    local: List[Result] = []
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        scheduled, scenario, user_id = job
+        method, path, body = _request_for(scenario, user_id, rng, datetime.now())
+        headers = {"Authorization": f"Bearer {tokens[user_id]}"}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        if revalidate and (user_id, path) in etags:
+            headers["If-None-Match"] = etags[(user_id, path)]
+        started = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            status = response.status
+            if revalidate and response.getheader("ETag"):
+                etags[(user_id, path)] = response.getheader("ETag")
+            match = SERVER_TIMING_DB.search(response.getheader("Server-Timing") or "")
+            db_time = float(match.group(1)) / 1000 if match else None
+            db_queries = int(match.group(2)) if match else None
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+            status, db_time, db_queries = 0, None, None
+        finished = time.perf_counter()
+        local.append(Result(scenario, status, finished - scheduled, finished - started, db_time, db_queries))
+    conn.close()
+    with lock:
+        results.extend(local)
+
+
+def run_load(base_url: str, tokens: Dict[int, str], rps: float, duration: float, concurrency: int,
+             revalidate: bool = False, seed: int = 0) -> Tuple[List[Result], float]:
+    """목표 RPS로 duration초 동안 요청을 예약해 실행. (결과, 실제 경과 시간)"""
+    jobs: "queue.Queue" = queue.Queue()
+    results: List[Result] = []
+    lock = threading.Lock()
+    workers = [threading.Thread(target=_worker, args=(base_url, tokens, jobs, results, lock, revalidate, seed + i))
+               for i in range(concurrency)]
+    for worker in workers:
+        worker.start()
+
+    rng = random.Random(seed)
+    names = [name for name, _ in SCENARIOS]
+    weights = [weight for _, weight in SCENARIOS]
+    user_ids = list(tokens)
+    interval = 1 / rps
+    started = time.perf_counter()
+    total = int(rps * duration)
+    for i in range(total):
+        scheduled = started + i * interval
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        jobs.put((scheduled, rng.choices(names, weights=weights)[0], rng.choice(user_ids)))
+    for _ in workers:
+        jobs.put(None)
+    for worker in workers:
+        worker.join()
+    return results, time.perf_counter() - started
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+def report(results: List[Result], elapsed: float, target_rps: float):
+    print(f"\n목표 {target_rps:.0f} req/s, 실제 {len(results) / elapsed:.1f} req/s ({len(results)}건, {elapsed:.1f}초)")
+    print(f"{'시나리오':>18} {'건수':>6} {'오류':>5} {'304':>5} {'p50':>9} {'p95':>9} {'p99':>9} "
+          f"{'서비스 p50':>11} {'DB 평균':>9} {'쿼리':>5}")
+    for name in [name for name, _ in SCENARIOS] + ["전체"]:
+        rows = results if name == "전체" else [r for r in results if r.scenario == name]
+        if not rows:
+            continue
+        ok = [r for r in rows if 200 <= r.status < 400]
+        latencies = [r.latency for r in ok]
+        db_rows = [r for r in ok if r.db_time is not None]
+        db_mean = sum(r.db_time for r in db_rows) / len(db_rows) * 1000 if db_rows else float("nan")
+        queries = sum(r.db_queries for r in db_rows) / len(db_rows) if db_rows else float("nan")
+        print(f"{name:>18} {len(rows):>6} {len(rows) - len(ok):>5} {sum(1 for r in rows if r.status == 304):>5} "
+              f"{_percentile(latencies, 0.5) * 1000:>7.1f}ms {_percentile(latencies, 0.95) * 1000:>7.1f}ms "
+              f"{_percentile(latencies, 0.99) * 1000:>7.1f}ms "
+              f"{_percentile([r.service_time for r in ok], 0.5) * 1000:>9.1f}ms {db_mean:>7.2f}ms {queries:>5.1f}")
+
+
+def _serve(database_url: str, port: int):
+    """부하 테스트 대상 서버 (별도 프로세스에서 실행)"""
+    os.environ["DATABASE_URL"] = database_url
+    import logging
+    import uvicorn
+    from fastapi import FastAPI
+    from app.api.v1 import balance
+    from app.core.timing import ServerTimingMiddleware, instrument_engine
+    from app.database import engine
+
+    logging.getLogger("app").setLevel(logging.WARNING)
+    instrument_engine(engine)
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware)
+    app.include_router(balance.router, prefix="/api/v1")
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def _wait_for(base_url: str, timeout: float = 30):
+    parts = urlsplit(base_url)
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=1)
+            conn.request("GET", "/docs")
+            conn.getresponse().read()
+            conn.close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"서버가 시작되지 않음: {base_url}")
+
+
+def _parse_user_ids(value: str) -> List[int]:
+    start, _, end = value.partition("-")
+    return list(range(int(start), int(end or start) + 1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="밸런스/대시보드 API 부하 테스트")
+    parser.add_argument("--url", help="실행 중인 서버 주소 (없으면 임시 DB와 서버를 띄움)")
+    parser.add_argument("--user-ids", default=None, help="--url 사용 시 요청할 사용자 ID 범위 (예: 1-100)")
+    parser.add_argument("--users", type=int, default=100, help="합성 데이터 사용자 수")
+    parser.add_argument("--days", type=int, default=90, help="합성 데이터 기간 (일)")
+    parser.add_argument("--rps", type=float, default=100)
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--concurrency", type=int, default=16, help="요청 워커 스레드 수")
+    parser.add_argument("--revalidate", action="store_true", help="이전 응답의 ETag로 If-None-Match 전송")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        base_url = args.url.rstrip("/")
+        user_ids = _parse_user_ids(args.user_ids or "1")
+    else:
+        database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'load.db')}"
+        os.environ["DATABASE_URL"] = database_url
+        from app.database import engine
+        from benchmarks.synthetic_data import generate
+        started = time.perf_counter()
+        user_ids = generate(engine, args.users, args.days, seed=args.seed)
+        engine.dispose()
+        print(f"합성 데이터 생성: {time.perf_counter() - started:.1f}초 ({database_url})")
+        base_url = f"http://127.0.0.1:{args.port}"
+        server = mp.get_context("spawn").Process(target=_serve, args=(database_url, args.port), daemon=True)
+        server.start()
+        _wait_for(base_url)
+
+    from app.api.v1.balance import create_access_token
+    tokens = {user_id: create_access_token(data={"sub": str(user_id)}) for user_id in user_ids}
+    try:
+        # 연결/캐시 예열 후 측정
+        run_load(base_url, tokens, rps=min(args.rps, 50), duration=1, concurrency=args.concurrency, seed=args.seed)
+        results, elapsed = run_load(base_url, tokens, args.rps, args.duration, args.concurrency,
+                                    revalidate=args.revalidate, seed=args.seed + 1)
+        report(results, elapsed, args.rps)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join(timeout=5)
+
+
+if __name__ == "__main__":
+    main()
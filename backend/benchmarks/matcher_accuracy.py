@@ -0,0 +1,207 @@
+"""
+메뉴 매칭 정확도/처리량 벤치마크 (자모 단위 OCR 잡음 주입)
+
+메뉴 사전에서 음식 이름을 뽑아 OCR에서 실제로 생기는 오류를 흉내 낸 질의를 만들고,
+매칭 방식별로 원래 이름을 얼마나 되찾는지(top-1/top-k)와 초당 질의 수를 사전 크기별로 측정합니다.
+
+잡음 종류 (질의마다 1~2개를 섞어 적용)
+- jamo: 초성/중성 하나를 SIMILAR_JAMO_GROUPS의 같은 묶음 자모로 바꿈 (찌개 -> 찌게)
+- ocr_error: common_ocr_errors의 교정을 거꾸로 적용 (덮밥 -> 덜밥)
+- spacing: 띄어쓰기를 없애거나 단어 중간에 공백을 넣음
+- modifier: OCRService.modifiers의 수식어를 앞에 붙임 (매콤한 제육볶음)
+
+방식별로 사전 크기마다 --time-budget 초 안에 처리한 질의만 집계합니다
+(사전 전체를 훑는 방식은 큰 사전에서 일부 질의만 측정됨).
+
+    python -m benchmarks.matcher_accuracy
+    python -m benchmarks.matcher_accuracy --sizes 1000,10000,100000 --queries 500 --time-budget 30
+"""
+import os
+import json
+import time
+import random
+import logging
+import argparse
+import tempfile
+from collections import defaultdict
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.common import load_menu_names
+from app.services.nutrition.menu_matcher import MenuMatcher
+from app.services.nutrition.data.menu_artifact import MenuTable, build_menu_artifact
+from app.services.nutrition.data.menu_registry import DEFAULT_CORRECTIONS_PATH, MenuSnapshot, use_snapshot
+from app.services.ocr.ocr_service import SIMILAR_JAMO_GROUPS, OCRService
+
+# 한글 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+NOISE_KINDS = ("jamo", "ocr_error", "spacing", "modifier")
+
+
+def _similar_jamo(jamo: str, alphabet: str, rng: random.Random) -> str:
+    """같은 유사 묶음에 있는 다른 자모 (같은 위치에 올 수 있는 것만)"""
+    choices = {other for group in SIMILAR_JAMO_GROUPS if jamo in group
+               for other in group if other != jamo and other in alphabet}
+    return rng.choice(sorted(choices)) if choices else jamo
+
+
+def substitute_jamo(text: str, rng: random.Random) -> str:
+    positions = [i for i, char in enumerate(text) if "가" <= char <= "힣"]
+    if not positions:
+        return text
+    i = rng.choice(positions)
+    code = ord(text[i]) - 0xAC00
+    cho, jung, jong = code // 588, (code % 588) // 28, code % 28
+    if rng.random() < 0.5:
+        cho = CHOSEONG.index(_similar_jamo(CHOSEONG[cho], CHOSEONG, rng))
+    else:
+        jung = JUNGSEONG.index(_similar_jamo(JUNGSEONG[jung], JUNGSEONG, rng))
+    return text[:i] + chr(0xAC00 + (cho * 21 + jung) * 28 + jong) + text[i + 1:]
+
+
+def inject_ocr_error(text: str, rng: random.Random, ocr_errors: Dict[str, str]) -> str:
+    applicable = [(error, correction) for error, correction in ocr_errors.items()
+                  if correction in text and error != correction]
+    if not applicable:
+        return substitute_jamo(text, rng)
+    error, correction = rng.choice(applicable)
+    return text.replace(correction, error, 1)
+
+
+def perturb_spacing(text: str, rng: random.Random) -> str:
+    if " " in text and rng.random() < 0.7:
+        return text.replace(" ", "")
+    if len(text) < 3:
+        return text
+    i = rng.randint(1, len(text) - 1)
+    return f"{text[:i]} {text[i:]}".replace("  ", " ")
+
+
+def add_modifier(text: str, rng: random.Random, modifiers: List[str]) -> str:
+    return f"{rng.choice(modifiers)} {text}"
+
+
+def make_queries(names: List[str], count: int, service: OCRService, seed: int) -> List[Tuple[str, str, Tuple[str, ...]]]:
+    """(정답, 잡음 섞인 질의, 적용한 잡음 종류) 목록"""
+    rng = random.Random(seed)
+    hangul_names = [name for name in names if len(name) >= 2 and any("가" <= char <= "힣" for char in name)]
+    modifiers = [m for m in service.modifiers if any("가" <= char <= "힣" for char in m)]
+    ocr_errors = service.common_ocr_errors
+    queries = []
+    for truth in rng.sample(hangul_names, min(count, len(hangul_names))):
+        kinds = tuple(sorted(rng.sample(NOISE_KINDS, rng.choice([1, 1, 2]))))
+        text = truth
+        for kind in kinds:
+            if kind == "jamo":
+                text = substitute_jamo(text, rng)
+            elif kind == "ocr_error":
+                text = inject_ocr_error(text, rng, ocr_errors)
+            elif kind == "spacing":
+                text = perturb_spacing(text, rng)
+            else:
+                text = add_modifier(text, rng, modifiers)
+        queries.append((truth, text, kinds))
+    return queries
+
+
+def _single(fn: Callable[[str], object]) -> Callable[[List[str], int], List[List[str]]]:
+    """후보 하나만 돌려주는 기존 매칭 함수를 (질의 목록 -> 후보 목록) 형태로 감쌈"""
+    def run(texts: List[str], top_k: int) -> List[List[str]]:
+        results = []
+        for text in texts:
+            result = fn(text)
+            if isinstance(result, tuple):
+                result = result[0]
+            results.append([result] if result else [])
+        return results
+    return run
+
+
+def strategies(service: OCRService, matcher: MenuMatcher, cutoff: float) -> Dict[str, Tuple[Callable, bool]]:
+    """이름 -> (매칭 함수, top-k 후보를 돌려주는지 여부)"""
+    return {
+        "menu_matcher": (lambda texts, top_k: [[menu for menu, _ in candidates] for candidates in
+                                               matcher.match_batch(texts, top_k=top_k, cutoff=cutoff)], True),
+        "find_best_menu_match": (_single(service._find_best_menu_match), False),
+        "correct_with_levenshtein": (_single(service.correct_with_levenshtein), False),
+        "extract_with_similarity": (_single(service.extract_menu_from_text_with_similarity), False),
+        "normalize_menu": (_single(service.normalize_menu), False),
+    }
+
+
+def build_snapshot(names: List[str], directory: str) -> MenuSnapshot:
+    """메뉴 목록으로 아티팩트를 만들어 서비스와 같은 형태(mmap MenuTable)의 스냅샷 생성"""
+    path = os.path.join(directory, f"menu_{len(names)}.bin")
+    version = build_menu_artifact(names, [], path)
+    with open(DEFAULT_CORRECTIONS_PATH, encoding="utf-8") as f:
+        corrections = json.load(f)
+    return MenuSnapshot(MenuTable(path), version, corrections)
+
+
+def evaluate(run: Callable, queries: List[Tuple[str, str, Tuple[str, ...]]], top_k: int,
+             time_budget: float, batch_size: int = 32) -> Dict:
+    measured = 0
+    top1 = topk = 0
+    by_kind: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+    elapsed = 0.0
+    for start in range(0, len(queries), batch_size):
+        batch = queries[start:start + batch_size]
+        started = time.perf_counter()
+        results = run([text for _, text, _ in batch], top_k)
+        elapsed += time.perf_counter() - started
+        for (truth, _, kinds), candidates in zip(batch, results):
+            measured += 1
+            hit = bool(candidates) and candidates[0] == truth
+            top1 += hit
+            topk += truth in candidates[:top_k]
+            for kind in kinds:
+                by_kind[kind][0] += 1
+                by_kind[kind][1] += hit
+        if elapsed > time_budget:
+            break
+    return {
+        "queries": measured,
+        "qps": measured / elapsed if elapsed else 0.0,
+        "top1": top1 / measured if measured else 0.0,
+        "topk": topk / measured if measured else 0.0,
+        "by_kind": {kind: hits / total for kind, (total, hits) in by_kind.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="메뉴 매칭 정확도/처리량 벤치마크")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="사전 크기 (쉼표로 구분)")
+    parser.add_argument("--queries", type=int, default=300, help="사전 크기별 질의 수")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--cutoff", type=float, default=0.6, help="menu_matcher 최소 유사도")
+    parser.add_argument("--time-budget", type=float, default=20.0, help="방식/사전 크기별 최대 측정 시간 (초)")
+    parser.add_argument("--strategies", default=None, help="측정할 방식 (쉼표로 구분, 기본: 전체)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # 질의마다 남기는 info 로그가 측정에 섞이지 않도록 함
+    logging.getLogger("app").setLevel(logging.WARNING)
+    service = OCRService(load_reader=False)
+    matcher = MenuMatcher()
+    selected = args.strategies.split(",") if args.strategies else None
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in [int(s) for s in args.sizes.split(",")]:
+            names = load_menu_names(size=size, seed=args.seed)
+            snapshot = build_snapshot(names, directory)
+            with use_snapshot(snapshot):
+                queries = make_queries(names, args.queries, service, seed=args.seed + size)
+                print(f"\n사전 {len(snapshot.menu_set)}개, 질의 {len(queries)}개 (예: {queries[0][0]} -> {queries[0][1]})")
+                print(f"{'방식':>26} {'측정':>6} {'qps':>10} {'top-1':>7} {f'top-{args.top_k}':>7}  "
+                      + " ".join(f"{kind:>9}" for kind in NOISE_KINDS))
+                for name, (run, ranked) in strategies(service, matcher, args.cutoff).items():
+                    if selected and name not in selected:
+                        continue
+                    result = evaluate(run, queries, args.top_k, args.time_budget)
+                    topk = f"{result['topk']:>7.3f}" if ranked else f"{'-':>7}"
+                    print(f"{name:>26} {result['queries']:>6} {result['qps']:>10.1f} {result['top1']:>7.3f} {topk}  "
+                          + " ".join(f"{result['by_kind'].get(kind, 0.0):>9.3f}" for kind in NOISE_KINDS))
+
+
+if __name__ == "__main__":
+    main()
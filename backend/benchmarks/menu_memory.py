@@ -0,0 +1,106 @@
+"""
+워커별 메뉴 사전 메모리 비교 (Python set 방식 vs mmap 아티팩트 공유 방식)
+
+각 워커 프로세스가 사전과 색인을 로드한 뒤 전체를 한 번 순회(페이지 터치)하고
+로드 전/후 RSS와 PSS를 보고합니다. PSS는 공유 페이지를 프로세스 수로 나눈 값이라
+mmap 방식에서 워커 수가 늘어날수록 워커당 PSS가 줄어드는 것을 확인할 수 있습니다.
+
+    python -m benchmarks.menu_memory --workers 4
+    python -m benchmarks.menu_memory --workers 4 --size 100000
+"""
+import os
+import gc
+import argparse
+import tempfile
+import multiprocessing as mp
+from typing import Dict, List
+
+from benchmarks.common import DEFAULT_CSV_PATH, load_menu_names, process_memory
+from app.services.nutrition.data.menu_artifact import (
+    MenuTable, bigram_keys, build_menu_artifact, jamo_key
+)
+
+
+def _load_as_set(names: List[str], artifact_path: str):
+    """기존 방식: 워커마다 메뉴 set + 자모 형태 + 바이그램 색인을 Python 객체로 보유"""
+    menu_set = set(names)
+    jamo = {menu: jamo_key(menu) for menu in menu_set}
+    index: Dict[int, List[str]] = {}
+    for menu in menu_set:
+        for key in bigram_keys(menu):
+            index.setdefault(key, []).append(menu)
+    return menu_set, jamo, index
+
+
+def _load_as_mmap(names: List[str], artifact_path: str):
+    """아티팩트 방식: 파일을 mmap하고 전체 페이지를 한 번씩 읽음"""
+    table = MenuTable(artifact_path)
+    touched = 0
+    for i in range(len(table)):
+        touched += len(table.jamo(i)) + table.gram_count(i)
+    for key in table._gram_keys:
+        touched += len(table.postings(key))
+    return table, touched
+
+
+def _worker(mode: str, names: List[str], artifact_path: str, barrier, queue):
+    gc.collect()
+    before = process_memory()
+    loaded = (_load_as_set if mode == 'set' else _load_as_mmap)(names, artifact_path)
+    gc.collect()
+    after = process_memory()
+    # 모든 워커가 로드를 마친 상태에서 PSS를 측정해야 공유 효과가 드러남
+    barrier.wait()
+    shared = process_memory()
+    queue.put((os.getpid(), before, after, shared))
+    barrier.wait()
+    del loaded
+
+
+def _run(mode: str, workers: int, names: List[str], artifact_path: str):
+    ctx = mp.get_context('spawn')
+    barrier = ctx.Barrier(workers)
+    queue = ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(mode, names, artifact_path, barrier, queue))
+             for _ in range(workers)]
+    for p in procs:
+        p.start()
+    results = [queue.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return results
+
+
+def _report(mode: str, results):
+    print(f"\n=== {mode} ===")
+    print(f"{'pid':>8} {'RSS 전':>9} {'RSS 후':>9} {'증가':>9} {'Anon 증가':>10} {'PSS(동시)':>10}")
+    total_pss = 0.0
+    for pid, before, after, shared in results:
+        delta = after.get('VmRSS', 0) - before.get('VmRSS', 0)
+        anon = after.get('RssAnon', 0) - before.get('RssAnon', 0)
+        pss = shared.get('Pss', 0)
+        total_pss += pss
+        print(f"{pid:>8} {before.get('VmRSS', 0):>8.1f}M {after.get('VmRSS', 0):>8.1f}M "
+              f"{delta:>8.1f}M {anon:>9.1f}M {pss:>9.1f}M")
+    print(f"전체 PSS 합계: {total_pss:.1f}M (워커 {len(results)}개)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커별 메뉴 사전 메모리 비교")
+    parser.add_argument("--csv", default=DEFAULT_CSV_PATH)
+    parser.add_argument("--size", type=int, default=None, help="사전 크기 (기본: 실제 사전 전체)")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    names = load_menu_names(args.csv, args.size)
+    # 앱 데이터 디렉토리의 아티팩트는 서버가 그대로 읽으므로 벤치마크용은 항상 임시 디렉토리에 생성
+    artifact_path = os.path.join(tempfile.mkdtemp(), 'menu_dict.bin')
+    build_menu_artifact(names, [], artifact_path)
+
+    print(f"메뉴 {len(names)}개, 아티팩트 {os.path.getsize(artifact_path) / 1024 / 1024:.1f}MB, 워커 {args.workers}개")
+    for mode in ('set', 'mmap'):
+        _report(mode, _run(mode, args.workers, names, artifact_path))
+
+
+if __name__ == "__main__":
+    main()
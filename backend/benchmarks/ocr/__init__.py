@@ -0,0 +1,6 @@
+"""
+OCR 파이프라인 벤치마크 (합성 메뉴판 이미지 코퍼스)
+
+    python -m benchmarks.ocr --images 60 --save-baseline benchmarks/ocr/baseline.json
+    python -m benchmarks.ocr --images 60 --baseline benchmarks/ocr/baseline.json
+"""
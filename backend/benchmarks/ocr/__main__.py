@@ -0,0 +1,3 @@
+from benchmarks.ocr.run import main
+
+main()
@@ -0,0 +1,201 @@
+"""
+합성 한국어 메뉴판 이미지 생성
+
+메뉴 사전의 음식 이름을 PIL로 그려 정답(음식 이름 목록)이 있는 이미지를 만듭니다.
+레이아웃(목록/2단/칠판/영수증), 글자 크기, 잡음, 흐림, 회전을 바꿔 가며 생성하고,
+가게 이름/전화번호/가격처럼 메뉴가 아닌 텍스트도 함께 넣습니다.
+
+한글 글꼴은 다음 순서로 찾습니다.
+1. OCR_BENCH_FONTS 환경 변수 (경로, os.pathsep로 구분)
+2. benchmarks/ocr/fonts/ 아래의 .ttf/.otf/.ttc (로컬에 글꼴을 두는 위치, 저장소에는 포함하지 않음)
+3. 시스템 글꼴 디렉토리의 나눔/Noto CJK/맑은 고딕/Apple SD 고딕 등
+"""
+import io
+import os
+import glob
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from benchmarks.common import DEFAULT_CSV_PATH, load_menu_names
+
+FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+SYSTEM_FONT_DIRS = [
+    "/usr/share/fonts", "/usr/local/share/fonts", os.path.expanduser("~/.fonts"),
+    os.path.expanduser("~/.local/share/fonts"), "/Library/Fonts", "/System/Library/Fonts",
+    os.path.expanduser("~/Library/Fonts"), "C:/Windows/Fonts",
+]
+KOREAN_FONT_PATTERNS = [
+    "*Nanum*", "*NotoSansKR*", "*NotoSerifKR*", "*NotoSansCJK*", "*NotoSerifCJK*", "*SourceHan*",
+    "malgun*", "*AppleSDGothicNeo*", "*AppleGothic*", "*UnDotum*", "*UnBatang*", "*Baekmuk*", "*gulim*",
+]
+FONT_EXTENSIONS = (".ttf", ".otf", ".ttc")
+
+LAYOUTS = ("list", "two_column", "board", "receipt")
+DISTORTIONS = ("clean", "noise", "blur", "rotate", "small", "combined")
+
+STORE_NAMES = ["행복식당", "엄마손백반집", "한솥도시락", "맛나분식", "시골밥상"]
+FALLBACK_MENUS = [
+    "김치찌개", "된장찌개", "순두부찌개", "부대찌개", "제육볶음", "오징어볶음", "불고기", "비빔밥",
+    "돌솥비빔밥", "물냉면", "비빔냉면", "칼국수", "떡볶이", "김밥", "라면", "잔치국수", "갈비탕",
+    "설렁탕", "육개장", "삼계탕", "돈까스", "치즈돈까스", "볶음밥", "김치볶음밥", "짜장면", "짬뽕",
+    "탕수육", "계란말이", "고등어구이", "닭갈비", "쫄면", "수제비", "떡국", "만두국", "콩나물국밥",
+]
+
+
+def _renders_hangul(path: str) -> bool:
+    """글꼴이 한글을 실제 글리프로 그리는지 확인 (없는 글자는 같은 빈 상자로 그려짐)"""
+    try:
+        font = ImageFont.truetype(path, 32)
+        masks = [bytes(font.getmask(char)) for char in ("가", "힣", "□")]
+    except (OSError, ValueError):
+        return False
+    return bool(masks[0]) and masks[0] != masks[1] and masks[0] != masks[2]
+
+
+def find_korean_fonts(limit: int = 4) -> List[str]:
+    """한글을 그릴 수 있는 글꼴 경로 (우선순위 순, 최대 limit개)"""
+    candidates: List[str] = []
+    env = os.getenv("OCR_BENCH_FONTS")
+    if env:
+        candidates.extend(path for path in env.split(os.pathsep) if path)
+    if os.path.isdir(FONT_DIR):
+        candidates.extend(sorted(path for path in glob.glob(os.path.join(FONT_DIR, "**", "*"), recursive=True)
+                                 if path.lower().endswith(FONT_EXTENSIONS)))
+    for directory in SYSTEM_FONT_DIRS:
+        if not os.path.isdir(directory):
+            continue
+        for pattern in KOREAN_FONT_PATTERNS:
+            candidates.extend(sorted(path for path in glob.glob(os.path.join(directory, "**", pattern), recursive=True)
+                                     if path.lower().endswith(FONT_EXTENSIONS)))
+
+    fonts: List[str] = []
+    for path in dict.fromkeys(candidates):
+        if _renders_hangul(path):
+            fonts.append(path)
+            if len(fonts) >= limit:
+                break
+    return fonts
+
+
+def menu_vocabulary(size: int = 300, seed: int = 42) -> List[str]:
+    """정답으로 쓸 음식 이름 (메뉴 사전에서 메뉴판에 나올 법한 짧은 한글 이름만, 없으면 기본 목록)"""
+    if not os.path.exists(DEFAULT_CSV_PATH):
+        # 합성 메뉴 이름은 실제 메뉴판과 달라 OCR 정확도 측정에 쓰지 않음
+        return FALLBACK_MENUS[:]
+    names = [name for name in load_menu_names(seed=seed)
+             if 2 <= len(name) <= 8 and all("가" <= char <= "힣" for char in name)]
+    if not names:
+        return FALLBACK_MENUS[:]
+    return sorted(random.Random(seed).sample(names, min(size, len(names))))
+
+
+@dataclass
+class MenuImage:
+    image_id: str
+    layout: str
+    distortion: str
+    menus: List[str]
+    image_bytes: bytes
+    size: tuple = field(default=(0, 0))
+
+    def ground_truth(self) -> Dict:
+        return {"image_id": self.image_id, "layout": self.layout, "distortion": self.distortion,
+                "menus": self.menus, "size": list(self.size)}
+
+
+def _price(rng: random.Random) -> str:
+    return f"{rng.randrange(5000, 25001, 500):,}원"
+
+
+def _lines_for(layout: str, menus: Sequence[str], rng: random.Random) -> List[tuple]:
+    """레이아웃별 (x 비율, 텍스트, 크기 배율) 줄 목록"""
+    store = rng.choice(STORE_NAMES)
+    if layout == "list":
+        lines = [(0.08, store, 1.4)] + [(0.08, f"{menu}   {_price(rng)}", 1.0) for menu in menus]
+        return lines + [(0.08, f"02-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}", 0.8)]
+    if layout == "two_column":
+        lines = [(0.3, store, 1.4)]
+        for i in range(0, len(menus), 2):
+            lines.append((0.05, menus[i], 1.0))
+            if i + 1 < len(menus):
+                lines.append((0.55, menus[i + 1], 1.0))
+        return lines
+    if layout == "board":
+        return [(0.25, "오늘의 메뉴", 1.5)] + [(0.25, menu, 1.2) for menu in menus]
+    lines = [(0.05, store, 1.0), (0.05, "-" * 24, 0.8)]
+    lines += [(0.05, f"{menu} x{rng.randint(1, 3)}  {_price(rng)}", 0.9) for menu in menus]
+    return lines + [(0.05, f"합계 {_price(rng)}", 1.0)]
+
+
+def render_menu_image(menus: Sequence[str], layout: str, distortion: str, font_path: str,
+                      rng: random.Random) -> Image.Image:
+    base_size = 18 if distortion == "small" else rng.randint(26, 40)
+    width = rng.randint(520, 900)
+    lines = _lines_for(layout, menus, rng)
+    dark = layout == "board"
+
+    # 2단 레이아웃은 같은 줄에 두 메뉴가 올라가므로 줄 위치를 따로 계산
+    rows: List[List[tuple]] = []
+    for x, text, scale in lines:
+        if layout == "two_column" and x > 0.5 and rows:
+            rows[-1].append((x, text, scale))
+        else:
+            rows.append([(x, text, scale)])
+    line_height = int(base_size * 1.9)
+    height = line_height * (len(rows) + 2)
+
+    image = Image.new("RGB", (width, height), (34, 48, 40) if dark else (250, 248, 240))
+    draw = ImageDraw.Draw(image)
+    color = (235, 235, 225) if dark else (20, 20, 20)
+    for row_index, row in enumerate(rows):
+        for x, text, scale in row:
+            font = ImageFont.truetype(font_path, max(12, int(base_size * scale)))
+            draw.text((int(width * x), line_height * (row_index + 1)), text, font=font, fill=color)
+
+    if distortion in ("blur", "combined"):
+        image = image.filter(ImageFilter.GaussianBlur(radius=rng.uniform(0.8, 1.6)))
+    if distortion in ("rotate", "combined"):
+        image = image.rotate(rng.uniform(-6, 6), expand=True, fillcolor=(250, 248, 240) if not dark else (34, 48, 40),
+                             resample=Image.BICUBIC)
+    if distortion in ("noise", "combined"):
+        pixels = np.asarray(image).astype(np.int16)
+        noise = np.random.default_rng(rng.randrange(2 ** 32)).normal(0, 18, pixels.shape)
+        image = Image.fromarray(np.clip(pixels + noise, 0, 255).astype(np.uint8))
+    return image
+
+
+def generate_corpus(count: int, fonts: List[str], seed: int = 42, vocabulary: Optional[List[str]] = None,
+                    image_format: str = "JPEG") -> List[MenuImage]:
+    """레이아웃 × 왜곡 조합을 돌아가며 count장 생성 (같은 seed면 같은 코퍼스)"""
+    if not fonts:
+        raise RuntimeError("한글 글꼴을 찾을 수 없습니다. OCR_BENCH_FONTS를 지정하거나 "
+                           "benchmarks/ocr/fonts/에 나눔고딕 등 .ttf 글꼴을 두세요.")
+    rng = random.Random(seed)
+    vocabulary = vocabulary or menu_vocabulary(seed=seed)
+    corpus = []
+    for i in range(count):
+        layout = LAYOUTS[i % len(LAYOUTS)]
+        distortion = DISTORTIONS[(i // len(LAYOUTS)) % len(DISTORTIONS)]
+        menus = rng.sample(vocabulary, min(len(vocabulary), rng.randint(3, 8)))
+        image = render_menu_image(menus, layout, distortion, fonts[i % len(fonts)], rng)
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_format, quality=90)
+        corpus.append(MenuImage(f"{i:04d}_{layout}_{distortion}", layout, distortion, list(menus),
+                                buffer.getvalue(), image.size))
+    return corpus
+
+
+def save_corpus(corpus: List[MenuImage], directory: str):
+    """이미지와 정답(ground_truth.json)을 디렉토리에 저장 (결과 확인용)"""
+    import json
+
+    os.makedirs(directory, exist_ok=True)
+    for item in corpus:
+        with open(os.path.join(directory, f"{item.image_id}.jpg"), "wb") as f:
+            f.write(item.image_bytes)
+    with open(os.path.join(directory, "ground_truth.json"), "w", encoding="utf-8") as f:
+        json.dump([item.ground_truth() for item in corpus], f, ensure_ascii=False, indent=2)
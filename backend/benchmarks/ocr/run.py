@@ -0,0 +1,203 @@
+"""
+OCR 파이프라인 종단 간 벤치마크
+
+합성 메뉴판(benchmarks.ocr.corpus)을 OCRService.extract_text_with_timings로 처리하고
+추출한 텍스트를 MenuMatcher.match_batch로 메뉴 사전에 맞춥니다.
+
+- 단계별(decode/preprocess/detect/recognize/postprocess/match) p50/p95와 처리량
+- 최대 RSS (easyocr 모델 로드 전/후)
+- 왜곡 종류별 메뉴 단위 정밀도/재현율/F1 (매칭 결과 기준), OCR 텍스트 재현율(매칭 전)
+
+--save-baseline으로 결과를 JSON에 저장하고 --baseline으로 이전 결과와 비교합니다.
+
+    python -m benchmarks.ocr --images 60 --save-baseline benchmarks/ocr/baseline.json
+    python -m benchmarks.ocr --images 60 --baseline benchmarks/ocr/baseline.json
+    python -m benchmarks.ocr --images 24 --save-corpus /tmp/ocr_corpus --corpus-only
+"""
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from benchmarks.common import process_memory
+from benchmarks.ocr.corpus import DISTORTIONS, MenuImage, find_korean_fonts, generate_corpus, save_corpus
+
+STAGES = ("decode", "preprocess", "detect", "recognize", "postprocess", "match")
+# 기준 대비 이 비율 이상 느려지거나 정확도가 이만큼 떨어지면 표시
+LATENCY_REGRESSION = 0.2
+ACCURACY_REGRESSION = 0.02
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+def _peak_rss_mb() -> float:
+    """프로세스 최대 RSS (MB)"""
+    try:
+        import resource
+    except ImportError:
+        return process_memory().get("VmRSS", 0.0)
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / (1024 * 1024 if platform.system() == "Darwin" else 1024)
+
+
+def _scores(true_positive: int, predicted: int, expected: int) -> Dict[str, float]:
+    precision = true_positive / predicted if predicted else 0.0
+    recall = true_positive / expected if expected else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {"precision": round(precision, 4), "recall": round(recall, 4), "f1": round(f1, 4)}
+
+
+def run_benchmark(corpus: List[MenuImage], cutoff: float = 0.8, warmup: int = 2) -> Dict:
+    from app.services.ocr.ocr_service import OCRService
+    from app.services.nutrition.menu_matcher import MenuMatcher
+
+    rss_before = _peak_rss_mb()
+    started = time.perf_counter()
+    service = OCRService()
+    load_time = time.perf_counter() - started
+    rss_after_load = _peak_rss_mb()
+    matcher = MenuMatcher()
+
+    # 첫 추론의 지연 초기화(모델 그래프, 스레드 풀)가 측정에 섞이지 않도록 예열
+    for item in corpus[:warmup]:
+        service.extract_text_with_timings(item.image_bytes)
+
+    stage_times: Dict[str, List[float]] = defaultdict(list)
+    totals: List[float] = []
+    # 왜곡 종류별 [정답 수, 예측 수, 맞은 수, OCR 원문에 정답이 그대로 나온 수]
+    counts: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0, 0])
+    errors = 0
+    run_started = time.perf_counter()
+    for item in corpus:
+        image_started = time.perf_counter()
+        try:
+            texts, timings = service.extract_text_with_timings(item.image_bytes)
+        except Exception as e:
+            print(f"  {item.image_id}: OCR 실패 ({e})")
+            errors += 1
+            continue
+        match_started = time.perf_counter()
+        matches = matcher.match_batch([t["text"] for t in texts], top_k=1, cutoff=cutoff)
+        timings["match"] = time.perf_counter() - match_started
+        totals.append(time.perf_counter() - image_started)
+        for stage in STAGES:
+            stage_times[stage].append(timings[stage])
+
+        expected = set(item.menus)
+        predicted = {candidates[0][0] for candidates in matches if candidates}
+        raw_text = " ".join(t["text"] for t in texts).replace(" ", "")
+        for key in (item.distortion, "all"):
+            row = counts[key]
+            row[0] += len(expected)
+            row[1] += len(predicted)
+            row[2] += len(expected & predicted)
+            row[3] += sum(1 for menu in expected if menu.replace(" ", "") in raw_text)
+    elapsed = time.perf_counter() - run_started
+
+    accuracy = {}
+    for key in list(DISTORTIONS) + ["all"]:
+        if key not in counts:
+            continue
+        expected, predicted, hit, raw_hit = counts[key]
+        accuracy[key] = dict(_scores(hit, predicted, expected),
+                             ocr_recall=round(raw_hit / expected if expected else 0.0, 4))
+
+    return {
+        "images": len(corpus),
+        "errors": errors,
+        "cutoff": cutoff,
+        "model_load_s": round(load_time, 3),
+        "throughput_ips": round(len(totals) / elapsed, 3) if elapsed else 0.0,
+        "latency_ms": {
+            stage: {"p50": round(_percentile(values, 0.5) * 1000, 2),
+                    "p95": round(_percentile(values, 0.95) * 1000, 2)}
+            for stage, values in list(stage_times.items()) + [("total", totals)]
+        },
+        "peak_rss_mb": {"before_load": round(rss_before, 1), "after_load": round(rss_after_load, 1),
+                        "end": round(_peak_rss_mb(), 1)},
+        "accuracy": accuracy,
+    }
+
+
+def report(results: Dict, baseline: Optional[Dict] = None):
+    print(f"\n이미지 {results['images']}장 (실패 {results['errors']}), 모델 로드 {results['model_load_s']:.1f}초, "
+          f"처리량 {results['throughput_ips']:.2f} 장/초")
+    rss = results["peak_rss_mb"]
+    print(f"최대 RSS: 로드 전 {rss['before_load']:.0f}MB, 로드 후 {rss['after_load']:.0f}MB, 종료 {rss['end']:.0f}MB")
+
+    base_latency = (baseline or {}).get("latency_ms", {})
+    print(f"\n{'단계':>12} {'p50':>10} {'p95':>10}" + (f" {'기준 p50':>10} {'변화':>8}" if baseline else ""))
+    for stage in list(STAGES) + ["total"]:
+        row = results["latency_ms"].get(stage)
+        if row is None:
+            continue
+        line = f"{stage:>12} {row['p50']:>8.1f}ms {row['p95']:>8.1f}ms"
+        if stage in base_latency and base_latency[stage]["p50"]:
+            change = row["p50"] / base_latency[stage]["p50"] - 1
+            flag = "  ▲ 느려짐" if change > LATENCY_REGRESSION else ""
+            line += f" {base_latency[stage]['p50']:>8.1f}ms {change:>+7.0%}{flag}"
+        print(line)
+
+    base_accuracy = (baseline or {}).get("accuracy", {})
+    print(f"\n{'왜곡':>10} {'정밀도':>8} {'재현율':>8} {'F1':>8} {'OCR재현율':>10}" + (f" {'기준 F1':>8}" if baseline else ""))
+    for key, row in results["accuracy"].items():
+        line = (f"{key:>10} {row['precision']:>8.3f} {row['recall']:>8.3f} {row['f1']:>8.3f} "
+                f"{row['ocr_recall']:>10.3f}")
+        if key in base_accuracy:
+            base_f1 = base_accuracy[key]["f1"]
+            flag = "  ▼ 하락" if row["f1"] < base_f1 - ACCURACY_REGRESSION else ""
+            line += f" {base_f1:>8.3f}{flag}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 파이프라인 종단 간 벤치마크 (합성 메뉴판)")
+    parser.add_argument("--images", type=int, default=48, help="생성할 메뉴판 이미지 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cutoff", type=float, default=0.8, help="메뉴 매칭 최소 유사도")
+    parser.add_argument("--warmup", type=int, default=2, help="측정 전 예열할 이미지 수")
+    parser.add_argument("--save-corpus", help="생성한 이미지와 정답을 저장할 디렉토리")
+    parser.add_argument("--corpus-only", action="store_true", help="코퍼스만 생성하고 OCR은 실행하지 않음")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--save-baseline", help="이번 결과를 저장할 JSON 경로")
+    args = parser.parse_args()
+
+    logging.getLogger("app").setLevel(logging.WARNING)
+    fonts = find_korean_fonts()
+    if not fonts:
+        print("한글 글꼴을 찾을 수 없습니다. OCR_BENCH_FONTS 환경 변수로 글꼴 경로를 지정하거나 "
+              "benchmarks/ocr/fonts/에 .ttf 글꼴(예: NanumGothic.ttf)을 두세요.")
+        sys.exit(1)
+    print(f"글꼴: {', '.join(fonts)}")
+
+    started = time.perf_counter()
+    corpus = generate_corpus(args.images, fonts, seed=args.seed)
+    print(f"코퍼스 생성: {len(corpus)}장, {time.perf_counter() - started:.1f}초")
+    if args.save_corpus:
+        save_corpus(corpus, args.save_corpus)
+        print(f"코퍼스 저장: {args.save_corpus}")
+    if args.corpus_only:
+        return
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results = run_benchmark(corpus, cutoff=args.cutoff, warmup=args.warmup)
+    results["seed"] = args.seed
+    report(results, baseline)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.save_baseline}")
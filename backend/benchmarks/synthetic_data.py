@@ -0,0 +1,193 @@
+"""
+합성 사용자/식사 데이터 생성
+
+사용자 N명 × M일의 식사 기록을 만들어 bulk INSERT로 넣고 일별 합계(daily_nutrition)와
+연속 기록(user_streaks)을 다시 계산합니다. 음식 이름은 메뉴 사전에서 가져오고
+(CSV가 없으면 같은 형태의 합성 이름), 사용자마다 자주 먹는 메뉴가 있도록 인기도에 치우침을 둡니다.
+
+- 아침/점심/저녁은 각각 확률적으로 거르고, 끼니마다 1~3개 음식을 같은 시각으로 기록
+- 시각은 끼니별 시간대 안에서 무작위 (한국 시간 naive, 앱과 같은 저장 형식)
+- 영양소는 메뉴별로 고정된 값에 약간의 변동을 줌
+
+--database-url를 주지 않으면 임시 디렉토리의 SQLite 파일에 만듭니다. 합성 사용자는 모두 같은
+비밀번호(DEFAULT_PASSWORD)를 쓰므로 운영 DB에는 넣지 마세요. 앱이 쓰는 DB(SQLALCHEMY_DATABASE_URL)에
+--reset을 하려면 --yes-really가 필요합니다.
+
+    python -m benchmarks.synthetic_data --users 200 --days 90
+    python -m benchmarks.synthetic_data --database-url sqlite:////tmp/load.db --users 1000 --days 365 --reset
+"""
+import os
+import time
+import tempfile
+import random
+import argparse
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func, insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import load_menu_names
+from app.database import Base, SQLALCHEMY_DATABASE_URL, create_db_engine
+from app.models.balance import Meal, User
+from app.services.balance.daily_nutrition_service import DailyNutritionService
+
+# 모든 합성 사용자의 비밀번호 (부하 테스트에서 로그인할 때 사용)
+DEFAULT_PASSWORD = "password1234"
+
+# 끼니별 (기록 확률, 시작 시각, 끝 시각(시))
+MEAL_SLOTS: Dict[str, Tuple[float, float, float]] = {
+    "breakfast": (0.6, 6.5, 9.5),
+    "lunch": (0.9, 11.5, 13.5),
+    "dinner": (0.85, 17.5, 20.5),
+}
+
+
+def _menu_profiles(names: List[str], rng: random.Random) -> Dict[str, Tuple[float, float, float, float]]:
+    """메뉴별 1인분 (칼로리, 탄수화물, 단백질, 지방)"""
+    profiles = {}
+    for name in names:
+        calories = rng.uniform(80, 900)
+        # 권장 비율(55/22.5/27.5) 근처에서 메뉴마다 치우침
+        carb_ratio = min(max(rng.gauss(0.55, 0.12), 0.1), 0.85)
+        protein_ratio = min(max(rng.gauss(0.2, 0.07), 0.03), 0.6)
+        fat_ratio = max(1 - carb_ratio - protein_ratio, 0.02)
+        profiles[name] = (
+            round(calories, 1),
+            round(calories * carb_ratio / 4, 1),
+            round(calories * protein_ratio / 4, 1),
+            round(calories * fat_ratio / 9, 1),
+        )
+    return profiles
+
+
+def generate_meal_rows(user_ids: List[int], days: int, menu: List[str], seed: int = 42,
+                       end: Optional[datetime] = None) -> Iterator[dict]:
+    """사용자별로 최근 days일 동안의 식사 기록 행(dict)을 생성"""
+    rng = random.Random(seed)
+    profiles = _menu_profiles(menu, rng)
+    end = end or datetime.now()
+    first_day = (end - timedelta(days=days - 1)).date()
+    # 인기 순위에 따른 가중치 (앞쪽 메뉴일수록 자주 선택)
+    popularity = [1 / (rank + 1) for rank in range(len(menu))]
+
+    for user_id in user_ids:
+        # 사용자마다 메뉴 순서를 섞어 자주 먹는 메뉴가 다르게 함
+        favorites = menu[:]
+        rng.shuffle(favorites)
+        diligence = rng.uniform(0.6, 1.0)  # 기록을 얼마나 꾸준히 하는지
+        for offset in range(days):
+            day = first_day + timedelta(days=offset)
+            for meal_type, (probability, start_hour, end_hour) in MEAL_SLOTS.items():
+                if rng.random() > probability * diligence:
+                    continue
+                hour = rng.uniform(start_hour, end_hour)
+                timestamp = datetime.combine(day, datetime.min.time()) + timedelta(hours=hour)
+                if timestamp > end:
+                    continue
+                timestamp = timestamp.replace(microsecond=0)
+                for food_name in rng.choices(favorites, weights=popularity, k=rng.choice([1, 1, 2, 2, 3])):
+                    calories, carbohydrates, protein, fat = profiles[food_name]
+                    scale = rng.uniform(0.7, 1.3)
+                    yield {
+                        "user_id": user_id,
+                        "meal_type": meal_type,
+                        "food_name": food_name,
+                        "timestamp": timestamp,
+                        "calories": round(calories * scale, 1),
+                        "carbohydrates": round(carbohydrates * scale, 1),
+                        "protein": round(protein * scale, 1),
+                        "fat": round(fat * scale, 1),
+                    }
+
+
+def generate(engine, users: int, days: int, seed: int = 42, menu_size: int = 2000,
+             batch_size: int = 10000, reset: bool = False) -> List[int]:
+    """합성 데이터를 넣고 생성한 사용자 ID 목록을 반환 (기존 사용자 뒤에 이어서 생성)"""
+    from app.core.password_hashing import pwd_context
+
+    if reset:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        start_id = (db.query(func.max(User.id)).scalar() or 0) + 1
+        user_ids = list(range(start_id, start_id + users))
+        password_hash = pwd_context.hash(DEFAULT_PASSWORD)
+        rng = random.Random(seed)
+        now = datetime.now()
+        db.execute(insert(User), [
+            {
+                "id": user_id,
+                "email": f"user{user_id}@example.com",
+                "password_hash": password_hash,
+                "name": f"사용자{user_id}",
+                "daily_calorie_goal": rng.choice([1600, 1800, 2000, 2200, 2500]),
+                "created_at": now - timedelta(days=days + rng.randint(0, 30)),
+                "data_version": 0,
+            }
+            for user_id in user_ids
+        ])
+
+        menu = load_menu_names(size=menu_size, seed=seed)
+        inserted = 0
+        batch: List[dict] = []
+        for row in generate_meal_rows(user_ids, days, menu, seed=seed, end=now):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                db.execute(insert(Meal), batch)
+                inserted += len(batch)
+                batch = []
+        if batch:
+            db.execute(insert(Meal), batch)
+            inserted += len(batch)
+        db.flush()
+
+        # 롤업과 연속 기록은 전체를 한 번에 다시 계산
+        DailyNutritionService(db).backfill()
+        db.commit()
+        print(f"사용자 {users}명 (ID {user_ids[0]}~{user_ids[-1]}), 식사 기록 {inserted}건 생성")
+        return user_ids
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _same_database(url: str, other: str) -> bool:
+    """두 URL이 같은 DB를 가리키는지 (SQLite는 파일 경로를 절대 경로로 비교)"""
+    first, second = make_url(url), make_url(other)
+    if first.get_backend_name() == "sqlite" and second.get_backend_name() == "sqlite":
+        return os.path.abspath(first.database or "") == os.path.abspath(second.database or "")
+    return first.set(password=None) == second.set(password=None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 사용자/식사 데이터 생성")
+    parser.add_argument("--database-url", default=None, help="대상 DB (기본: 임시 디렉토리의 SQLite 파일)")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--menu-size", type=int, default=2000, help="사용할 메뉴 이름 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="기존 테이블을 삭제하고 새로 생성")
+    parser.add_argument("--yes-really", action="store_true", help="앱이 쓰는 DB에도 --reset 허용")
+    args = parser.parse_args()
+
+    if args.database_url is None:
+        args.database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'synthetic.db')}"
+    if args.reset and _same_database(args.database_url, SQLALCHEMY_DATABASE_URL) and not args.yes_really:
+        parser.error("--reset은 앱이 쓰는 DB의 테이블을 모두 삭제합니다. 정말이면 --yes-really를 함께 주세요")
+
+    engine = create_db_engine(args.database_url)
+    started = time.perf_counter()
+    try:
+        generate(engine, args.users, args.days, seed=args.seed, menu_size=args.menu_size, reset=args.reset)
+    finally:
+        engine.dispose()
+    print(f"소요 시간: {time.perf_counter() - started:.1f}초 ({args.database_url})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+밸런스 API가 실행하는 meals 조회의 EXPLAIN QUERY PLAN 확인
+
+메모리 SQLite에 스키마를 만들고 각 엔드포인트의 서비스 코드를 실행하면서
+meals 테이블 SELECT를 가로채 실행 계획을 출력합니다. 전체 테이블 스캔이거나
+ix_meals_user_id_timestamp 인덱스를 사용하지 않는 조회가 있으면 종료 코드 1로 끝납니다.
+
+    python check_query_plans.py
+"""
+import sys
+from datetime import datetime
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.database import Base
+from app.models.balance import Meal, User
+from app.services.balance.balance_service import BalanceService, day_range
+
+INDEX_NAME = "ix_meals_user_id_timestamp"
+
+engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+SessionLocal = sessionmaker(bind=engine)
+captured = []
+
+@event.listens_for(engine, "before_cursor_execute")
+def capture_select(conn, cursor, statement, parameters, context, executemany):
+    if statement.lstrip().upper().startswith("SELECT") and "FROM meals" in statement:
+        captured.append((statement, parameters))
+
+def explain(statement, parameters):
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return [row[-1] for row in rows]
+
+def check_plans(db):
+    service = BalanceService(db)
+    now = datetime.now()
+    checks = {
+        "GET /balance/stats, GET /balance/meals": lambda: service.get_meals_between(1, *day_range(now.date())),
+        "GET /balance/meals/history": lambda: service.get_meal_history(
+            1, 21, after=(now, 100), meal_type="lunch", start=day_range(now.date(), days=-30)[1]),
+        "GET /balance/monthly": lambda: service.get_monthly_balance(1, now.year, now.month),
+        "GET /balance/weekly-score": lambda: service.get_weekly_balance_score(1),
+        "GET /balance/stats/{user_id}": lambda: service.get_user_stats(1),
+        "GET /balance/streak/{user_id}": lambda: service.get_user_streak(1),
+    }
+
+    failed = False
+    for name, run in checks.items():
+        captured.clear()
+        print(f"\n=== {name} ===")
+        try:
+            run()
+        except Exception as e:
+            db.rollback()
+            print(f"실행 중 오류 (조회 이후 단계일 수 있음): {str(e)}")
+        if not captured:
+            print("meals 조회 없음")
+            continue
+        for statement, parameters in captured:
+            plan = explain(statement, parameters)
+            for detail in plan:
+                print(f"  {detail}")
+            uses_index = any(INDEX_NAME in detail for detail in plan)
+            full_scan = any(detail.startswith("SCAN meals") for detail in plan)
+            # 페이지 조회의 ORDER BY가 인덱스 순서로 처리되지 않으면 매번 정렬이 필요함
+            sorts = "LIMIT" in statement and "GROUP BY" not in statement and any("TEMP B-TREE" in detail for detail in plan)
+            if full_scan or not uses_index:
+                failed = True
+                print(f"  -> 실패: {INDEX_NAME} 범위 검색을 사용하지 않음")
+            elif sorts:
+                failed = True
+                print("  -> 실패: 페이지 조회에 별도 정렬 필요")
+            else:
+                print("  -> 통과")
+    return not failed
+
+if __name__ == "__main__":
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.add(User(id=1, email="plan@example.com", password_hash="x"))
+        db.commit()
+        ok = check_plans(db)
+    finally:
+        db.close()
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,29 @@
+import argparse
+from app.database import Base, engine
+from app.models import balance  # noqa: F401 (테이블 메타데이터 등록)
+from app.migrations import discover_migrations, applied_versions, run_migrations
+
+def show_status():
+    applied = applied_versions(engine)
+    print(f"\n=== 마이그레이션 상태 ({engine.url.render_as_string(hide_password=True)}) ===")
+    for migration in discover_migrations():
+        state = "적용됨" if migration.version in applied else "대기"
+        print(f"{migration.version:04d}_{migration.name}: {state}")
+
+def migrate():
+    # 새로 추가된 테이블은 먼저 만들고, 기존 테이블 변경과 데이터 채우기는 마이그레이션으로 적용
+    Base.metadata.create_all(bind=engine)
+    applied = run_migrations(engine)
+    if not applied:
+        print("적용할 마이그레이션이 없습니다.")
+    for migration in applied:
+        print(f"적용 완료: {migration.version:04d}_{migration.name}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="데이터베이스 스키마 마이그레이션")
+    parser.add_argument("--status", action="store_true", help="적용 여부만 출력")
+    args = parser.parse_args()
+    if args.status:
+        show_status()
+    else:
+        migrate()
@@ -0,0 +1,49 @@
+import sys
+import argparse
+from app.database import SessionLocal, create_tables
+from app.services.balance.balance_service import bump_data_versions
+from app.services.balance.streak_service import StreakService
+
+def check_streaks() -> bool:
+    """저장된 연속 기록이 롤업으로부터 다시 계산한 값과 같은지 확인"""
+    db = SessionLocal()
+    try:
+        mismatches = StreakService(db).find_mismatches()
+        print("\n=== 연속 기록 일관성 검사 ===")
+        for mismatch in mismatches:
+            print(f"사용자 {mismatch['user_id']}")
+            print(f"  저장된 값: {mismatch['stored']}")
+            print(f"  재계산 값: {mismatch['expected']}")
+        print(f"불일치 사용자: {len(mismatches)}명")
+        return not mismatches
+    finally:
+        db.close()
+
+def recompute_streaks(user_id=None):
+    db = SessionLocal()
+    try:
+        service = StreakService(db)
+        if user_id is not None:
+            service.recompute(user_id)
+            print(f"연속 기록 재계산 완료: 사용자 {user_id}")
+        else:
+            count = service.recompute_all()
+            print(f"연속 기록 재계산 완료: 사용자 {count}명")
+        bump_data_versions(db, user_id)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"연속 기록 재계산 중 오류 발생: {str(e)}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="daily_nutrition 롤업으로부터 user_streaks 재계산")
+    parser.add_argument("--user-id", type=int, default=None, help="특정 사용자만 재계산")
+    parser.add_argument("--check", action="store_true", help="재계산하지 않고 불일치만 확인 (불일치 시 종료 코드 1)")
+    args = parser.parse_args()
+    create_tables()
+    if args.check:
+        sys.exit(0 if check_streaks() else 1)
+    recompute_streaks(args.user_id)
@@ -57,41 +57,26 @@ const MainPage = () => {
           return;
         }
 
-        // 영양 통계 정보 가져오기
-        const statsResponse = await fetch(`${API_BASE_URL}/api/v1/balance/stats`, {
+        // 영양 통계와 오늘의 식사 목록을 한 번에 가져오기
+        const dashboardResponse = await fetch(`${API_BASE_URL}/api/v1/balance/dashboard?fields=stats,meals`, {
           headers: {
             'Authorization': `Bearer ${token}`
           }
         });
         
-        if (!statsResponse.ok) {
+        if (!dashboardResponse.ok) {
           // 토큰이 만료된 경우
-          if (statsResponse.status === 401) {
+          if (dashboardResponse.status === 401) {
             // 로그인 페이지로 리다이렉트
             localStorage.removeItem('token');
             localStorage.removeItem('userId');
             navigate('/login');
             return;
           }
-          throw new Error(`Stats API Error: ${statsResponse.status}`);
+          throw new Error(`Dashboard API Error: ${dashboardResponse.status}`);
         }
         
-        const statsData = await statsResponse.json();
-        console.log('Stats API Response:', statsData);
-
-        // 식사별 칼로리 정보 가져오기
-        const mealsResponse = await fetch(`${API_BASE_URL}/api/v1/balance/meals`, {
-          headers: {
-            'Authorization': `Bearer ${token}`
-          }
-        });
-
-        if (!mealsResponse.ok) {
-          throw new Error(`Meals API Error: ${mealsResponse.status}`);
-        }
-
-        const mealCalories = await mealsResponse.json();
-        console.log('Meals API Response:', mealCalories);
+        const { stats: statsData, meals: mealCalories } = await dashboardResponse.json();
 
         // 각 식사 타입별 칼로리 합계 계산
         const breakfast_calories = mealCalories.breakfast?.reduce((sum, meal) => sum + meal.calories, 0) || 0;
@@ -60,15 +60,6 @@ const OcrResultPage = () => {
     },
     meal_calories: []
   });
-  
-  // 전달받은 날짜가 있으면 사용, 없으면 현재 날짜 사용
-  const [selectedDate, setSelectedDate] = useState(
-    location.state?.selectedDate || new Date().toISOString().split('T')[0]
-  );
-  
-  const [selectedTime, setSelectedTime] = useState(
-    new Date().toLocaleTimeString('en-US', { hour12: false, hour: '2-digit', minute: '2-digit' })
-  );
 
   const fetchBalanceStats = async () => {
     try {
@@ -200,40 +191,27 @@ const OcrResultPage = () => {
     try {
       const selectedItems = results.filter(item => selectedFoods.has(item.name));
       
-      for (const item of selectedItems) {
-        // 선택한 날짜와 시간으로 timestamp 생성
-        const [year, month, day] = selectedDate.split('-');
-        const [hours, minutes] = selectedTime.split(':');
-        const timestamp = new Date(
-          parseInt(year),
-          parseInt(month) - 1,
-          parseInt(day),
-          parseInt(hours),
-          parseInt(minutes)
-        ).toISOString();
-
-        const mealData = {
-          meal_type: mealType.toLowerCase(),
-          food_name: item.name,
-          calories: parseFloat(item.calories || 0),
-          carbohydrates: parseFloat(item.nutrients?.carbohydrates || 0),
-          protein: parseFloat(item.nutrients?.protein || 0),
-          fat: parseFloat(item.nutrients?.fat || 0),
-          timestamp: timestamp
-        };
+      // 선택한 음식을 한 번의 요청으로 저장 (기록 시각은 서버의 현재 한국 시간)
+      const meals = selectedItems.map(item => ({
+        meal_type: mealType.toLowerCase(),
+        food_name: item.name,
+        calories: parseFloat(item.calories || 0),
+        carbohydrates: parseFloat(item.nutrients?.carbohydrates || 0),
+        protein: parseFloat(item.nutrients?.protein || 0),
+        fat: parseFloat(item.nutrients?.fat || 0)
+      }));
 
-        const response = await fetch('/api/v1/meals', {
-          method: 'POST',
-          headers: {
-            'Content-Type': 'application/json',
-            'Authorization': `Bearer ${localStorage.getItem('token')}`
-          },
-          body: JSON.stringify(mealData)
-        });
+      const response = await fetch(`${API_BASE_URL}/api/v1/balance/meals/bulk`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'Authorization': `Bearer ${localStorage.getItem('token')}`
+        },
+        body: JSON.stringify({ meals })
+      });
 
-        if (!response.ok) {
-          throw new Error('Failed to save meal');
-        }
+      if (!response.ok) {
+        throw new Error('Failed to save meals');
       }
 
       setShowSaveAlert(true);
@@ -41,186 +41,74 @@ const ProfilePage = () => {
   }, []);
 
   useEffect(() => {
-    const fetchUserProfile = async () => {
+    const fetchDashboard = async () => {
       try {
         const token = localStorage.getItem('token');
-        console.log("저장된 토큰:", token ? "있음" : "없음");
-        
         if (!token) {
-          console.error("토큰이 없습니다.");
+          navigate('/login');
           return;
         }
 
-        const userResponse = await fetch(`${API_BASE_URL}/api/v1/balance/users/profile`, {
-          method: 'GET',
+        // 프로필, 목표 칼로리, 가입 일수, 월간/주간 통계를 한 번에 조회
+        const fields = 'profile,stats,days_since_joined,monthly,weekly_score';
+        const response = await fetch(`${API_BASE_URL}/api/v1/balance/dashboard?fields=${fields}`, {
           headers: {
             'Authorization': `Bearer ${token}`,
-            'Content-Type': 'application/json',
             'Accept': 'application/json'
-          },
-          credentials: 'include'
+          }
         });
 
-        if (!userResponse.ok) {
-          if (userResponse.status === 401) {
+        if (!response.ok) {
+          if (response.status === 401) {
             localStorage.removeItem('token');
             localStorage.removeItem('userId');
             navigate('/login');
             return;
           }
-          const errorText = await userResponse.text();
-          console.error(`API 응답 에러 (${userResponse.status}):`, errorText);
-          throw new Error(`API 요청 실패: ${userResponse.status} ${errorText}`);
+          const errorText = await response.text();
+          console.error(`API 응답 에러 (${response.status}):`, errorText);
+          throw new Error(`API 요청 실패: ${response.status} ${errorText}`);
         }
 
-        const userData = await userResponse.json();
-        console.log("받은 사용자 데이터:", userData);
-        setUserProfile(userData);
-      } catch (error) {
-        console.error("프로필 조회 실패:", error);
-        setError(error.message);
-      }
-    };
-
-    const fetchUserSettings = async () => {
-      try {
-        const token = localStorage.getItem('token');
-        if (!token) {
-          navigate('/login');
-          return;
-        }
-
-        // 사용자 설정 가져오기
-        const statsResponse = await fetch(`${API_BASE_URL}/api/v1/balance/stats`, {
-          headers: {
-            'Authorization': `Bearer ${token}`
-          }
-        });
-
-        if (statsResponse.ok) {
-          const data = await statsResponse.json();
-          setSettings(prev => ({
-            ...prev,
-            dailyCalorieGoal: data.daily_calorie_goal
-          }));
-          setTempCalorieGoal(data.daily_calorie_goal);
-        }
-      } catch (error) {
-        console.error('Failed to fetch user settings:', error);
-      }
-    };
-
-    const fetchUserStats = async () => {
-      try {
-        const token = localStorage.getItem('token');
-        if (!token) {
-          navigate('/login');
-          return;
-        }
-
-        const userId = localStorage.getItem('userId');
-        if (!userId) {
-          navigate('/login');
-          return;
-        }
-
-        // 가입 일수 조회
-        const daysResponse = await fetch(
-          `${API_BASE_URL}/api/v1/balance/user/days-since-joined`,
-          {
-            headers: {
-              'Authorization': `Bearer ${token}`
-            }
-          }
-        );
-
-        if (daysResponse.ok) {
-          const daysData = await daysResponse.json();
-          setUserStats(prev => ({
-            ...prev,
-            daysSinceJoined: daysData.days
-          }));
-        }
-
-        // 기존 월간 통계 데이터 가져오기
-        const currentDate = new Date();
-        const year = currentDate.getFullYear();
-        const month = currentDate.getMonth() + 1;
-
-        const monthlyResponse = await fetch(
-          `${API_BASE_URL}/api/v1/balance/monthly/${userId}/${year}/${month}`,
-          {
-            headers: {
-              'Authorization': `Bearer ${token}`
-            }
-          }
-        );
-
-        if (!monthlyResponse.ok) {
-          if (monthlyResponse.status === 401) {
-            navigate('/login');
-            return;
-          }
-          throw new Error(`월간 통계 조회 실패: ${monthlyResponse.status}`);
-        }
+        const data = await response.json();
+        setUserProfile(data.profile);
 
-        if (monthlyResponse.ok) {
-          const monthlyData = await monthlyResponse.json();
-          
-          // 월간 평균 칼로리 계산
-          let totalCalories = 0;
-          let daysWithMeals = 0;
-          
-          Object.values(monthlyData.daily_meals).forEach(dayData => {
-            if (dayData && dayData.total_calories > 0) {
-              totalCalories += dayData.total_calories;
-              daysWithMeals++;
-            }
-          });
-
-          const averageCalories = daysWithMeals > 0 
-            ? Math.round(totalCalories / daysWithMeals) 
-            : 0;
-
-          setMonthlyStats({ averageCalories });
-          setUserStats(prev => ({
-            ...prev,
-            monthlyAvgCalories: averageCalories,
-            perfectBalanceDays: monthlyData.perfect_balance_count || 0
-          }));
-        }
-      } catch (error) {
-        console.error('Failed to fetch user stats:', error);
-      }
-    };
+        setSettings(prev => ({
+          ...prev,
+          dailyCalorieGoal: data.stats.daily_calorie_goal
+        }));
+        setTempCalorieGoal(data.stats.daily_calorie_goal);
 
-    const fetchWeeklyScore = async () => {
-      try {
-        const token = localStorage.getItem('token');
-        if (!token) {
-          navigate('/login');
-          return;
-        }
+        // 월간 평균 칼로리 계산
+        let totalCalories = 0;
+        let daysWithMeals = 0;
 
-        const response = await fetch(`${API_BASE_URL}/api/v1/balance/weekly-score`, {
-          headers: {
-            'Authorization': `Bearer ${token}`
+        Object.values(data.monthly.daily_meals).forEach(dayData => {
+          if (dayData && dayData.total_calories > 0) {
+            totalCalories += dayData.total_calories;
+            daysWithMeals++;
           }
         });
 
-        if (response.ok) {
-          const data = await response.json();
-          setWeeklyBalanceScore(data.weekly_balance_score);
-        }
+        const averageCalories = daysWithMeals > 0 
+          ? Math.round(totalCalories / daysWithMeals) 
+          : 0;
+
+        setMonthlyStats({ averageCalories });
+        setUserStats(prev => ({
+          ...prev,
+          daysSinceJoined: data.days_since_joined,
+          monthlyAvgCalories: averageCalories,
+          perfectBalanceDays: data.monthly.perfect_balance_count || 0
+        }));
+        setWeeklyBalanceScore(data.weekly_score);
       } catch (error) {
-        console.error('주간 밸런스 점수 조회 중 오류 발생:', error);
+        console.error("프로필 조회 실패:", error);
+        setError(error.message);
       }
     };
 
-    fetchUserProfile();
-    fetchUserSettings();
-    fetchUserStats();
-    fetchWeeklyScore();
+    fetchDashboard();
   }, [navigate]);
 
   const handleCalorieInputChange = (e) => {